@@ -68,5 +68,11 @@ elif len(sys.argv) > 1 and sys.argv[1] == '_linter':
     _start_linter()
 elif len(sys.argv) > 1 and sys.argv[1] == '_complete':
     _complete()
+elif len(sys.argv) > 1 and sys.argv[1] == 'analyze':
+    from jedi.api.analyze import main
+    sys.exit(main(sys.argv[2:]))
+elif len(sys.argv) > 1 and sys.argv[1] == 'index':
+    from jedi.api.index import main
+    sys.exit(main(sys.argv[2:]))
 else:
     print('Command not implemented: %s' % sys.argv[1])
@@ -6,6 +6,9 @@ Additionally you can add a debug function with :func:`set_debug_function`.
 Alternatively, if you don't need a custom function and are happy with printing
 debug messages to stdout, simply call :func:`set_debug_function` without
 arguments.
+
+Statistics about the hot paths of an API call can be collected with
+:func:`set_stats_function`.
 """
 import sys
 from pathlib import Path
@@ -15,18 +18,21 @@ from parso.python import tree
 
 from jedi.parser_utils import get_executable_nodes
 from jedi import debug
+from jedi import stats
 from jedi import settings
 from jedi import cache
 from jedi.file_io import KnownContentFileIO
 from jedi.api import classes
 from jedi.api import interpreter
 from jedi.api import helpers
-from jedi.api.helpers import validate_line_column
+from jedi.api import signature_cache
+from jedi.api.helpers import validate_line_column, collect_stats
 from jedi.api.completion import Completion, search_in_module
 from jedi.api.keywords import KeywordName
 from jedi.api.environment import InterpreterEnvironment
 from jedi.api.project import get_default_project, Project
 from jedi.api.errors import parso_to_jedi_errors
+from jedi.api.semantic_map import create_semantic_map
 from jedi.api import refactoring
 from jedi.api.refactoring.extract import extract_function, extract_variable
 from jedi.inference import InferenceState
@@ -96,8 +102,21 @@ class Script:
     :param Project project: Provide a :class:`.Project` to make sure finding
         references works well, because the right folder is searched. There are
         also ways to modify the sys path and other things.
+    :param budget: The limits of the inference, either a profile name
+        (``'interactive'``, ``'analysis'``, ``'batch'``) or an
+        :class:`.InferenceBudget`. Defaults to
+        :data:`jedi.settings.inference_budget`.
+    """
+    last_stats = None
+    """
+    The statistics of the last API call (including the creation of the
+    Script), if statistics are enabled with :func:`jedi.set_stats_function`.
+    See :mod:`jedi.stats` for the format.
     """
-    def __init__(self, code=None, *, path=None, environment=None, project=None):
+
+    @collect_stats
+    def __init__(self, code=None, *, path=None, environment=None, project=None,
+                 budget=None):
         self._orig_path = path
         if isinstance(path, str):
             path = Path(path)
@@ -117,7 +136,7 @@ class Script:
             project = get_default_project(None if self.path is None else self.path.parent)
 
         self._inference_state = InferenceState(
-            project, environment=environment, script_path=self.path
+            project, environment=environment, script_path=self.path, budget=budget
         )
         debug.speed('init')
         self._module_node, code = self._inference_state.parse_and_get_code(
@@ -191,6 +210,7 @@ class Script:
             self._inference_state.environment,
         )
 
+    @collect_stats
     @validate_line_column
     def complete(self, line=None, column=None, *, fuzzy=False):
         """
@@ -214,6 +234,7 @@ class Script:
             )
             return completion.complete()
 
+    @collect_stats
     @validate_line_column
     def infer(self, line=None, column=None, *, only_stubs=False, prefer_stubs=False):
         """
@@ -232,6 +253,9 @@ class Script:
         :rtype: list of :class:`.Name`
         """
         self._inference_state.reset_recursion_limitations()
+        return self._infer(line, column, only_stubs=only_stubs, prefer_stubs=prefer_stubs)
+
+    def _infer(self, line, column, *, only_stubs=False, prefer_stubs=False):
         pos = line, column
         leaf = self._module_node.get_name_of_position(pos)
         if leaf is None:
@@ -259,6 +283,7 @@ class Script:
         # the API.
         return helpers.sorted_definitions(set(defs))
 
+    @collect_stats
     @validate_line_column
     def goto(self, line=None, column=None, *, follow_imports=False, follow_builtin_imports=False,
              only_stubs=False, prefer_stubs=False):
@@ -276,11 +301,17 @@ class Script:
         :rtype: list of :class:`.Name`
         """
         self._inference_state.reset_recursion_limitations()
+        return self._goto(line, column, follow_imports=follow_imports,
+                          follow_builtin_imports=follow_builtin_imports,
+                          only_stubs=only_stubs, prefer_stubs=prefer_stubs)
+
+    def _goto(self, line, column, *, follow_imports=False, follow_builtin_imports=False,
+              only_stubs=False, prefer_stubs=False):
         tree_name = self._module_node.get_name_of_position((line, column))
         if tree_name is None:
             # Without a name we really just want to jump to the result e.g.
             # executed by `foo()`, if we the cursor is after `)`.
-            return self.infer(line, column, only_stubs=only_stubs, prefer_stubs=prefer_stubs)
+            return self._infer(line, column, only_stubs=only_stubs, prefer_stubs=prefer_stubs)
         name = self._get_module_context().create_name(tree_name)
 
         # Make it possible to goto the super class function/attribute
@@ -311,6 +342,43 @@ class Script:
         # Avoid duplicates
         return list(set(helpers.sorted_definitions(defs)))
 
+    @collect_stats
+    def infer_many(self, positions, **kwargs):
+        """
+        Like :meth:`infer`, but for a lot of ``(line, column)`` positions at
+        once. The results are the same as calling :meth:`infer` for each of
+        them, :attr:`last_stats` contains the statistics of all of them.
+
+        Accepts the same keyword arguments as :meth:`infer`.
+
+        :return: One list of :class:`.Name` per position, in the order of
+            ``positions``.
+        :rtype: list of lists of :class:`.Name`
+        """
+        return self._for_many(self._infer, positions, kwargs)
+
+    @collect_stats
+    def goto_many(self, positions, **kwargs):
+        """
+        Like :meth:`goto`, but for a lot of ``(line, column)`` positions at
+        once, see :meth:`infer_many`.
+
+        Accepts the same keyword arguments as :meth:`goto`.
+
+        :rtype: list of lists of :class:`.Name`
+        """
+        return self._for_many(self._goto, positions, kwargs)
+
+    def _for_many(self, func, positions, kwargs):
+        positions = [helpers.get_line_column(self._code_lines, *pos) for pos in positions]
+        results = []
+        for line, column in positions:
+            # Like for separate API calls, the limits apply per position.
+            self._inference_state.reset_recursion_limitations()
+            results.append(func(line, column, **kwargs))
+        return results
+
+    @collect_stats
     def search(self, string, *, all_scopes=False):
         """
         Searches a name in the current file. For a description of how the
@@ -338,6 +406,7 @@ class Script:
             fuzzy=fuzzy,
         )
 
+    @collect_stats
     def complete_search(self, string, **kwargs):
         """
         Like :meth:`.Script.search`, but completes that string. If you want to
@@ -353,6 +422,7 @@ class Script:
         """
         return self._search_func(string, complete=True, **kwargs)
 
+    @collect_stats
     @validate_line_column
     def help(self, line=None, column=None):
         """
@@ -397,6 +467,7 @@ class Script:
                 return [classes.Name(self._inference_state, name)]
         return []
 
+    @collect_stats
     @validate_line_column
     def get_references(self, line=None, column=None, **kwargs):
         """
@@ -428,6 +499,7 @@ class Script:
             return helpers.sorted_definitions(definitions)
         return _references(**kwargs)
 
+    @collect_stats
     @validate_line_column
     def get_signatures(self, line=None, column=None):
         """
@@ -452,20 +524,22 @@ class Script:
             return []
 
         context = self._get_module_context().create_context(call_details.bracket_leaf)
-        definitions = helpers.cache_signatures(
+        signatures = signature_cache.get_signatures(
             self._inference_state,
             context,
             call_details.bracket_leaf,
             self._code_lines,
-            pos
+            pos,
+            lambda s: classes.Signature(self._inference_state, s, call_details),
         )
         debug.speed('func_call followed')
 
         # TODO here we use stubs instead of the actual values. We should use
         # the signatures from stubs, but the actual values, probably?!
         return [classes.Signature(self._inference_state, signature, call_details)
-                for signature in definitions.get_signatures()]
+                for signature in signatures]
 
+    @collect_stats
     @validate_line_column
     def get_context(self, line=None, column=None):
         """
@@ -507,6 +581,7 @@ class Script:
             definition = definition.parent()
         return definition
 
+    @collect_stats
     def _analysis(self):
         self._inference_state.is_analysis = True
         self._inference_state.analysis_modules = [self._module_node]
@@ -541,6 +616,7 @@ class Script:
         finally:
             self._inference_state.is_analysis = False
 
+    @collect_stats
     def get_names(self, **kwargs):
         """
         Returns names defined in the current file.
@@ -551,11 +627,41 @@ class Script:
             class, function or a statement (``a = b`` returns ``a``).
         :param references: If True lists all the names that are not listed by
             ``definitions=True``. E.g. ``a = b`` returns ``b``.
+        :param with_types: If True the names are inferred right away (like
+            with :meth:`infer_many`) and :meth:`.Name.infer` returns the
+            result without inferring again.
         :rtype: list of :class:`.Name`
         """
-        names = self._names(**kwargs)
-        return [classes.Name(self._inference_state, n) for n in names]
+        with_types = kwargs.pop('with_types', False)
+        if not with_types:
+            names = self._names(**kwargs)
+            return [classes.Name(self._inference_state, n) for n in names]
+
+        defs = [classes.Name(self._inference_state, n) for n in self._names(**kwargs)]
+        for d in defs:
+            self._inference_state.reset_recursion_limitations()
+            d._inferred = d.infer()
+        return defs
+
+    @collect_stats
+    def get_semantic_map(self, *, follow_imports=False, time_budget=None):
+        """
+        Returns the kind, definition and inferred type of every name in the
+        current file (definitions and references in all scopes). Names with
+        the same definitions are only inferred once.
+
+        :param follow_imports: The definitions of imported names are the
+            names in the imported modules (like ``goto(follow_imports=True)``)
+            instead of the import statements.
+        :param time_budget: Stop resolving names after this many seconds. The
+            remaining names are still listed, but without kind, definition and
+            type.
+        :rtype: :class:`.SemanticMap`
+        """
+        return create_semantic_map(self._inference_state, self._get_module_context(),
+                                   follow_imports=follow_imports, time_budget=time_budget)
 
+    @collect_stats
     def get_syntax_errors(self):
         """
         Lists all syntax errors in the current file.
@@ -579,6 +685,7 @@ class Script:
         ]
         return sorted(defs, key=lambda x: x.start_pos)
 
+    @collect_stats
     def rename(self, line=None, column=None, *, new_name):
         """
         Renames all references of the variable under the cursor.
@@ -591,6 +698,7 @@ class Script:
         definitions = self.get_references(line, column, include_builtins=False)
         return refactoring.rename(self._inference_state, definitions, new_name)
 
+    @collect_stats
     @validate_line_column
     def extract_variable(self, line, column, *, new_name, until_line=None, until_column=None):
         """
@@ -630,6 +738,7 @@ class Script:
             new_name, (line, column), until_pos
         )
 
+    @collect_stats
     @validate_line_column
     def extract_function(self, line, column, *, new_name, until_line=None, until_column=None):
         """
@@ -677,6 +786,7 @@ class Script:
             new_name, (line, column), until_pos
         )
 
+    @collect_stats
     def inline(self, line=None, column=None):
         """
         Inlines a variable under the cursor. This is basically the opposite of
@@ -795,3 +905,17 @@ def set_debug_function(func_cb=debug.print_to_stdout, warnings=True,
     debug.enable_warning = warnings
     debug.enable_notice = notices
     debug.enable_speed = speed
+
+
+def set_stats_function(func_cb=None, enable=True):
+    """
+    Enable collecting statistics (counters and timers) for every API call.
+    The statistics of the last call are available as ``Script.last_stats``,
+    see :mod:`jedi.stats` for the format.
+
+    :param func_cb: An optional callback that receives the statistics of
+        every API call as a dict.
+    :param enable: Disables collecting statistics if false.
+    """
+    stats.stats_function = func_cb
+    stats.enabled = enable
@@ -0,0 +1,288 @@
+"""
+Runs Jedi's static analysis (attribute, name and import errors, ...) on a lot
+of files in parallel::
+
+    python -m jedi analyze --jobs 8 --exclude '*/tests/*' src/
+
+The results are written as JSON lines, one object per issue::
+
+    {"path": "src/foo.py", "line": 3, "column": 4, "code": "E1",
+     "name": "attribute-error", "message": "AttributeError: ..."}
+
+Files that could not be analyzed (timeouts, crashes) are reported with a
+``failure`` key instead. This is a pre-alpha API and will very likely change.
+
+Results are cached in the cache directory. A file is only analyzed again if
+its content, one of the modules it imported or a folder in which an import was
+not found changed.
+"""
+import argparse
+import fnmatch
+import hashlib
+import json
+import os
+import signal
+import sys
+import threading
+import traceback
+from multiprocessing import Pool
+
+_CACHE_SERIALIZER_VERSION = 2
+
+_timeout = None
+_use_cache = True
+_file_hashes = {}
+
+
+class _Timeout(BaseException):
+    # Not an Exception, because Jedi catches some exceptions internally.
+    pass
+
+
+def _matches(path, patterns):
+    name = os.path.basename(path)
+    return any(fnmatch.fnmatch(path, p) or fnmatch.fnmatch(name, p) for p in patterns)
+
+
+def iter_paths(paths, include=('*.py',), exclude=()):
+    """
+    Yields the files in ``paths`` (files or folders that are searched
+    recursively) that match one of the ``include`` patterns and none of the
+    ``exclude`` patterns. Patterns are matched against the path and the file
+    name, folders that match an ``exclude`` pattern are not searched.
+    """
+    for path in paths:
+        if not os.path.isdir(path):
+            yield path
+            continue
+
+        for root, dirnames, filenames in os.walk(path):
+            dirnames[:] = sorted(
+                d for d in dirnames if not _matches(os.path.join(root, d), exclude)
+            )
+            for filename in sorted(filenames):
+                p = os.path.join(root, filename)
+                if _matches(p, include) and not _matches(p, exclude):
+                    yield p
+
+
+def _raise_timeout(signum, frame):
+    raise _Timeout
+
+
+def _can_use_timeout():
+    return hasattr(signal, 'setitimer') \
+        and threading.current_thread() is threading.main_thread()
+
+
+def _kill_subprocess(path):
+    # The subprocess might have been interrupted while communicating with it,
+    # it is restarted the next time it's used.
+    import jedi
+    environment = jedi.get_default_project(os.path.dirname(path)).get_environment()
+    subprocess = getattr(environment, '_subprocess', None)
+    if subprocess is not None:
+        subprocess._kill()
+
+
+def _error_to_dict(error):
+    return dict(
+        path=str(error.path),
+        line=error.line,
+        column=error.column,
+        code=error.code,
+        name=error.name,
+        message=error.message,
+    )
+
+
+def _hash_file(path):
+    try:
+        stat = os.stat(path)
+        key = stat.st_mtime_ns, stat.st_size
+        try:
+            cached_key, hash_ = _file_hashes[path]
+            if cached_key == key:
+                return hash_
+        except KeyError:
+            pass
+        with open(path, 'rb') as f:
+            hash_ = hashlib.sha256(f.read()).hexdigest()
+    except OSError:
+        return None
+    _file_hashes[path] = key, hash_
+    return hash_
+
+
+def _hash_folder(path):
+    try:
+        names = sorted(os.listdir(path))
+    except OSError:
+        return None
+    return hashlib.sha256('\0'.join(names).encode('utf-8')).hexdigest()
+
+
+def _get_cache_path(path):
+    from jedi import settings
+    name = hashlib.sha256(os.path.abspath(path).encode('utf-8')).hexdigest()
+    return os.path.join(settings.cache_directory, 'analysis', name + '.json')
+
+
+def _get_environment_key(path):
+    import jedi
+    environment = jedi.get_default_project(os.path.dirname(path)).get_environment()
+    return [environment.executable, list(environment.version_info), jedi.__version__]
+
+
+def _get_dependencies(inference_state):
+    module_paths = set()
+    values = list(inference_state.module_cache.iter_values())
+    values += [v for v in inference_state.stub_module_cache.values() if v is not None]
+    for value in values:
+        file_path = value.py__file__()
+        if file_path is not None:
+            module_paths.add(str(file_path))
+    return (
+        {p: _hash_file(p) for p in sorted(module_paths)},
+        {p: _hash_folder(p) for p in sorted(inference_state.missing_import_folders)},
+    )
+
+
+def _load_cached_results(path):
+    try:
+        with open(_get_cache_path(path)) as f:
+            version, entry = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if version != _CACHE_SERIALIZER_VERSION \
+            or entry['environment'] != _get_environment_key(path) \
+            or entry['hash'] != _hash_file(path):
+        return None
+    for p, hash_ in entry['modules'].items():
+        if _hash_file(p) != hash_:
+            return None
+    for p, hash_ in entry['folders'].items():
+        if _hash_folder(p) != hash_:
+            return None
+    return entry['results']
+
+
+def _save_results(path, hash_, inference_state, results):
+    modules, folders = _get_dependencies(inference_state)
+    entry = dict(
+        environment=_get_environment_key(path),
+        hash=hash_,
+        modules=modules,
+        folders=folders,
+        results=results,
+    )
+    cache_path = _get_cache_path(path)
+    tmp_path = cache_path + '.%s.tmp' % os.getpid()
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        with open(tmp_path, 'w') as f:
+            json.dump((_CACHE_SERIALIZER_VERSION, entry), f)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass
+
+
+def _analyze(path, use_cache):
+    import jedi
+    from jedi import stats
+
+    if use_cache:
+        results = _load_cached_results(path)
+        if results is not None:
+            stats.increment('analysis_cache_hits')
+            return results
+
+    # Hash before analyzing, a file that changes in the meantime is then
+    # analyzed again next time.
+    hash_ = _hash_file(path)
+    script = jedi.Script(path=path, budget='analysis')
+    results = [_error_to_dict(e) for e in script._analysis()]
+    if use_cache and hash_ is not None:
+        _save_results(path, hash_, script._inference_state, results)
+    return results
+
+
+def analyze_file(path, timeout=None, use_cache=True):
+    """
+    Analyzes a file and returns a list of dicts, one per issue. ``timeout`` is
+    only supported on Unix in the main thread. If ``use_cache`` is true,
+    results of earlier runs are reused if nothing they depend on changed.
+    """
+    use_timeout = timeout and _can_use_timeout()
+    if use_timeout:
+        old_handler = signal.signal(signal.SIGALRM, _raise_timeout)
+    try:
+        if use_timeout:
+            signal.setitimer(signal.ITIMER_REAL, timeout)
+        return _analyze(path, use_cache)
+    except _Timeout:
+        _kill_subprocess(path)
+        return [dict(path=path, failure='timeout after %ss' % timeout)]
+    except Exception:
+        return [dict(path=path, failure=traceback.format_exc())]
+    finally:
+        if use_timeout:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+            signal.signal(signal.SIGALRM, old_handler)
+
+
+def _init_worker(timeout, use_cache):
+    global _timeout, _use_cache
+    _timeout = timeout
+    _use_cache = use_cache
+    # Builtins and typing are used by every file, parse their stubs only once
+    # per worker.
+    import jedi
+    jedi.preload_module('builtins', 'typing')
+
+
+def _analyze_in_worker(path):
+    return analyze_file(path, _timeout, _use_cache)
+
+
+def analyze(paths, jobs=1, timeout=None, use_cache=True):
+    """
+    Analyzes ``paths`` with ``jobs`` processes and yields the results of
+    :func:`analyze_file` as soon as they are available (not in the order of
+    ``paths`` if ``jobs`` is bigger than one).
+    """
+    if jobs == 1:
+        for path in paths:
+            yield analyze_file(path, timeout, use_cache)
+        return
+
+    with Pool(jobs, initializer=_init_worker, initargs=(timeout, use_cache)) as pool:
+        yield from pool.imap_unordered(_analyze_in_worker, paths, chunksize=4)
+
+
+def main(args):
+    parser = argparse.ArgumentParser(prog='python -m jedi analyze')
+    parser.add_argument('paths', nargs='+', metavar='path',
+                        help='Files and folders to analyze.')
+    parser.add_argument('-j', '--jobs', type=int, default=os.cpu_count() or 1,
+                        help='Number of processes (default: number of CPUs).')
+    parser.add_argument('--include', action='append', default=[], metavar='GLOB',
+                        help='Only analyze matching files (default: *.py).')
+    parser.add_argument('--exclude', action='append', default=[], metavar='GLOB',
+                        help="Don't analyze matching files and folders.")
+    parser.add_argument('--timeout', type=float, default=None, metavar='SECONDS',
+                        help='Give up on files that take longer (only on Unix).')
+    parser.add_argument('--no-cache', action='store_true',
+                        help="Don't use or store the results of earlier runs.")
+    args = parser.parse_args(args)
+
+    paths = iter_paths(args.paths, include=args.include or ['*.py'], exclude=args.exclude)
+    found = False
+    results_iterator = analyze(paths, jobs=max(args.jobs, 1), timeout=args.timeout,
+                               use_cache=not args.no_cache)
+    for results in results_iterator:
+        for result in results:
+            found = True
+            print(json.dumps(result))
+        sys.stdout.flush()
+    return 1 if found else 0
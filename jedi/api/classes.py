@@ -28,6 +28,7 @@ from jedi.inference.gradual.conversion import convert_names, convert_values
 from jedi.inference.base_value import ValueSet, HasNoContext
 from jedi.api.keywords import KeywordName
 from jedi.api import completion_cache
+from jedi.api.signature_cache import DescribedName
 from jedi.api.helpers import filter_follow_imports
 
 
@@ -77,6 +78,8 @@ class BaseName:
     _tuple_mapping = dict((tuple(k.split('.')), v) for (k, v) in {
         'argparse._ActionsContainer': 'argparse.ArgumentParser',
     }.items())
+    # The result of infer() if it was inferred in advance, see Script.get_names
+    _inferred = None
 
     def __init__(self, inference_state, name):
         self._inference_state = inference_state
@@ -309,6 +312,9 @@ class BaseName:
         return self._name.py__doc__()
 
     def _get_docstring_signature(self):
+        if isinstance(self._name, DescribedName):
+            # Signatures from the signature cache know this already.
+            return self._name.docstring_signature
         return '\n'.join(
             signature.to_string()
             for signature in self._get_signatures(for_docstring=True)
@@ -471,6 +477,9 @@ class BaseName:
         """
         assert not (only_stubs and prefer_stubs)
 
+        if self._inferred is not None and not only_stubs and not prefer_stubs:
+            return list(self._inferred)
+
         if not self._name.is_value_name:
             return []
 
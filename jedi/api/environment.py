@@ -4,12 +4,17 @@ static analysis. The Python binary in that environment is going to be executed.
 """
 import os
 import sys
+import json
+import queue
 import hashlib
 import filecmp
+import threading
 from collections import namedtuple
 from shutil import which
 from typing import TYPE_CHECKING, Any
 
+from jedi import debug
+from jedi import settings
 from jedi.cache import memoize_method, time_cache
 from jedi.inference.compiled.subprocess import CompiledSubprocess, \
     InferenceStateSameProcess, InferenceStateSubprocess
@@ -26,6 +31,11 @@ _SUPPORTED_PYTHONS = ['3.14', '3.13', '3.12', '3.11', '3.10']
 _SAFE_PATHS = ['/usr/bin', '/usr/local/bin']
 _CONDA_VAR = 'CONDA_PREFIX'
 _CURRENT_VERSION = '%s.%s' % (sys.version_info.major, sys.version_info.minor)
+_REGISTRY_SERIALIZER_VERSION = 2
+_HASHES_SERIALIZER_VERSION = 1
+
+# path -> (file identity, sha256), see _get_sha256
+_file_hashes = {}
 
 
 class InvalidPythonEnvironment(Exception):
@@ -44,12 +54,23 @@ class _BaseEnvironment:
         version_string = '%s.%s' % (self.version_info.major, self.version_info.minor)
         return parso.load_grammar(version=version_string)
 
+    def _get_import_system_info(self, inference_state):
+        """
+        Cached version of the subprocess function ``get_import_system_info``.
+        """
+        try:
+            return self._import_system_info
+        except AttributeError:
+            info = inference_state.compiled_subprocess.get_import_system_info()
+            self._import_system_info = info
+            return info
+
     @property
     def _sha256(self):
         try:
             return self._hash
         except AttributeError:
-            self._hash = _calculate_sha256_for_file(self.executable)
+            self._hash = _get_sha256(self.executable)
             return self._hash
 
 
@@ -58,9 +79,184 @@ def _get_info():
         sys.executable,
         sys.prefix,
         sys.version_info[:3],
+        sys.path,
     )
 
 
+class _EnvironmentRegistry:
+    """
+    Persists the information about environments (executable, prefix, version
+    and sys path) in :data:`jedi.settings.cache_directory`, so that an
+    :class:`Environment` can be created without starting a subprocess. Entries
+    are keyed by the executable and are only used if the SHA-256 of the
+    executable did not change. A replaced interpreter or a changed
+    ``pyvenv.cfg`` is noticed by the identities of these files (see
+    :func:`_get_environment_stamps`).
+
+    The sys path of an environment changes if ``.pth`` files are added, so
+    entries are also validated by the modification times of the sys path
+    folders. Since there might be other changes, entries that are used are
+    refreshed once per process in a background thread. The refreshed
+    information is used by environments that are created later.
+
+    The lock only protects the state of the background thread and is never
+    held during I/O. Concurrent updates of the file might therefore lose an
+    entry, which is then just calculated again.
+    """
+    def __init__(self):
+        self._reset()
+
+    def _reset(self):
+        # Also called in forked children, which don't inherit the background
+        # thread and might inherit a lock that is never released.
+        self._lock = threading.Lock()
+        self._queue = queue.Queue()
+        self._refreshed = set()
+        self._thread = None
+
+    def _get_path(self):
+        return os.path.join(settings.cache_directory, 'environments.json')
+
+    def _load(self):
+        try:
+            with open(self._get_path()) as f:
+                version, entries = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if version != _REGISTRY_SERIALIZER_VERSION:
+            return {}
+        return entries
+
+    def _save(self, entries):
+        _dump_json(self._get_path(), (_REGISTRY_SERIALIZER_VERSION, entries))
+
+    def get(self, executable):
+        """
+        Returns the info of an environment like :func:`_get_info` or None.
+        """
+        entry = self._load().get(executable)
+        if entry is None:
+            return None
+        if not os.access(executable, os.X_OK):
+            return None
+        if _get_environment_stamps(executable) != entry['stamps']:
+            return None
+        if _get_mtimes(entry['sys_path']) != entry['sys_path_mtimes']:
+            return None
+        try:
+            if _get_sha256(executable) != entry['sha256']:
+                return None
+        except OSError:
+            return None
+        return entry['executable'], entry['path'], entry['version_info'], entry['sys_path']
+
+    def update(self, executable, info):
+        try:
+            sha256 = _get_sha256(executable)
+        except OSError:
+            return
+        entries = self._load()
+        entries[executable] = dict(
+            sha256=sha256,
+            executable=info[0],
+            path=info[1],
+            version_info=list(info[2]),
+            sys_path=list(info[3]),
+            sys_path_mtimes=_get_mtimes(info[3]),
+            stamps=_get_environment_stamps(executable),
+        )
+        self._save(entries)
+
+    def remove(self, executable):
+        entries = self._load()
+        if entries.pop(executable, None) is not None:
+            self._save(entries)
+
+    def refresh(self, executable):
+        """
+        Starts a subprocess to get the current info of an environment.
+        """
+        compiled_subprocess = CompiledSubprocess(executable)
+        try:
+            info = compiled_subprocess._send(None, _get_info)
+        except Exception as exc:
+            debug.warning('Could not refresh the environment %s: %r', executable, exc)
+            self.remove(executable)
+        else:
+            self.update(executable, info)
+        finally:
+            compiled_subprocess._kill()
+
+    def schedule_refresh(self, executable):
+        """
+        Refreshes an entry in a background thread, once per process.
+        """
+        with self._lock:
+            if executable in self._refreshed:
+                return
+            self._refreshed.add(executable)
+            self._queue.put(executable)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._refresh_loop, daemon=True)
+                self._thread.start()
+
+    def _refresh_loop(self):
+        while True:
+            self.refresh(self._queue.get())
+
+
+def _dump_json(path, data):
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = '%s.%s.%s.tmp' % (path, os.getpid(), threading.get_ident())
+        with open(tmp_path, 'w') as f:
+            json.dump(data, f)
+        os.replace(tmp_path, path)
+    except OSError:
+        # The cache directory might not be writable, the data is then just
+        # calculated again.
+        pass
+
+
+def _get_mtimes(paths):
+    mtimes = []
+    for path in paths:
+        try:
+            mtimes.append(os.stat(path).st_mtime_ns)
+        except OSError:
+            mtimes.append(None)
+    return mtimes
+
+
+def _get_environment_stamps(executable):
+    """
+    Returns the identities of an executable (and of the file it links to) and
+    of the ``pyvenv.cfg`` files that might configure it, so changes are
+    noticed without starting a subprocess.
+    """
+    directory = os.path.dirname(executable)
+    paths = [
+        executable,
+        os.path.join(directory, 'pyvenv.cfg'),
+        os.path.join(os.path.dirname(directory), 'pyvenv.cfg'),
+    ]
+    stamps = [os.path.realpath(executable)]
+    for path in paths:
+        try:
+            stat = os.stat(path)
+        except OSError:
+            stamps.append(None)
+        else:
+            stamps.append([stat.st_dev, stat.st_ino, stat.st_size,
+                           stat.st_mtime_ns, stat.st_ctime_ns])
+    return stamps
+
+
+_environment_registry = _EnvironmentRegistry()
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_environment_registry._reset)
+
+
 class Environment(_BaseEnvironment):
     """
     This class is supposed to be created by internal Jedi architecture. You
@@ -68,20 +264,36 @@ class Environment(_BaseEnvironment):
     functions instead. It is then returned by that function.
     """
     _subprocess = None
+    _subprocess_pid = None
+    _sys_path = None
 
     def __init__(self, executable, env_vars=None):
         self._start_executable = executable
         self._env_vars = env_vars
+        if env_vars is None:
+            # Environment variables might change the sys path, so these
+            # environments are not cached.
+            info = _environment_registry.get(executable)
+            if info is not None:
+                self._set_info(info)
+                _environment_registry.schedule_refresh(executable)
+                return
         # Initialize the environment
         self._get_subprocess()
 
     def _get_subprocess(self):
+        if self._subprocess is not None and self._subprocess_pid != os.getpid():
+            # This is a forked process (e.g. a worker of a multiprocessing
+            # pool). Talking to the parent's subprocess would mix up the
+            # messages of both processes.
+            self._subprocess._forget()
         if self._subprocess is not None and not self._subprocess.is_crashed:
             return self._subprocess
 
         try:
             self._subprocess = CompiledSubprocess(self._start_executable,
                                                   env_vars=self._env_vars)
+            self._subprocess_pid = os.getpid()
             info = self._subprocess._send(None, _get_info)
         except Exception as exc:
             raise InvalidPythonEnvironment(
@@ -89,6 +301,12 @@ class Environment(_BaseEnvironment):
                     self._start_executable,
                     exc))
 
+        self._set_info(info)
+        if self._env_vars is None:
+            _environment_registry.update(self._start_executable, info)
+        return self._subprocess
+
+    def _set_info(self, info):
         # Since it could change and might not be the same(?) as the one given,
         # set it here.
         self.executable = info[0]
@@ -104,7 +322,7 @@ class Environment(_BaseEnvironment):
         Like :data:`sys.version_info`: a tuple to show the current
         Environment's Python version.
         """
-        return self._subprocess
+        self._sys_path = info[3]
 
     def __repr__(self):
         version = '.'.join(str(i) for i in self.version_info)
@@ -129,6 +347,8 @@ class Environment(_BaseEnvironment):
         # on how the Python version was compiled (ENV variables).
         # If you omit -S when starting Python (normal case), additionally
         # site.py gets executed.
+        if self._sys_path is not None:
+            return self._sys_path
         return self._get_subprocess().get_sys_path()
 
 
@@ -154,6 +374,10 @@ class InterpreterEnvironment(_SameEnvironmentMixin, _BaseEnvironment):
     def get_sys_path(self):
         return sys.path
 
+    def _get_import_system_info(self, inference_state):
+        # The import system of this process might change.
+        return inference_state.compiled_subprocess.get_import_system_info()
+
 
 def _get_virtual_env_from_var(env_var='VIRTUAL_ENV'):
     """Get virtualenv environment from VIRTUAL_ENV environment variable.
@@ -184,6 +408,55 @@ def _calculate_sha256_for_file(path):
     return sha256.hexdigest()
 
 
+def _get_file_identity(path):
+    """
+    A cheap replacement for the hash of a file: Its inode, size, modification
+    and change times and a hash of the first bytes.
+    """
+    stat = os.stat(path)
+    with open(path, 'rb') as f:
+        header = hashlib.sha256(f.read(filecmp.BUFSIZE)).hexdigest()
+    return [stat.st_dev, stat.st_ino, stat.st_size, stat.st_mtime_ns, stat.st_ctime_ns, header]
+
+
+def _get_sha256(path):
+    """
+    Like :func:`_calculate_sha256_for_file`, but the hash is only calculated
+    if the identity of the file changed. The hashes are persisted in
+    :data:`jedi.settings.cache_directory`, so new processes don't need to read
+    the whole Python executable again.
+
+    :raises: :exc:`OSError`
+    """
+    identity = _get_file_identity(path)
+    try:
+        cached_identity, sha256 = _file_hashes[path]
+    except KeyError:
+        pass
+    else:
+        if cached_identity == identity:
+            return sha256
+
+    hashes_path = os.path.join(settings.cache_directory, 'executable-hashes.json')
+    try:
+        with open(hashes_path) as f:
+            version, hashes = json.load(f)
+        if version != _HASHES_SERIALIZER_VERSION:
+            hashes = {}
+    except (OSError, ValueError):
+        hashes = {}
+
+    entry = hashes.get(path)
+    if entry is not None and entry[0] == identity:
+        sha256 = entry[1]
+    else:
+        sha256 = _calculate_sha256_for_file(path)
+        hashes[path] = identity, sha256
+        _dump_json(hashes_path, (_HASHES_SERIALIZER_VERSION, hashes))
+    _file_hashes[path] = identity, sha256
+    return sha256
+
+
 def get_default_environment():
     """
     Tries to return an active Virtualenv or conda environment.
@@ -453,6 +726,8 @@ def _is_safe(executable_path):
         # virtualenv's Python is not (which is probably never going to get
         # upgraded), it will not work with Jedi. IMO that's fine, because
         # people should just be using venv. ~ dave
+        # The executable that is checked is always hashed completely, because
+        # it might have been written by an attacker.
         if environment._sha256 == _calculate_sha256_for_file(real_path):
             return True
     return False
@@ -11,11 +11,12 @@ from inspect import Parameter
 from parso.python.parser import Parser
 from parso.python import tree
 
+from jedi import stats
 from jedi.inference.base_value import NO_VALUES
 from jedi.inference.syntax_tree import infer_atom
 from jedi.inference.helpers import infer_call_of_leaf
 from jedi.inference.compiled import get_string_value_set
-from jedi.cache import signature_time_cache, memoize_method
+from jedi.cache import memoize_method
 from jedi.parser_utils import get_parent_scope
 
 
@@ -443,51 +444,55 @@ def get_signature_details(module, position):
     return None
 
 
-@signature_time_cache("call_signatures_validity")
-def cache_signatures(inference_state, context, bracket_leaf, code_lines, user_pos):
-    """This function calculates the cache key."""
-    line_index = user_pos[0] - 1
+def get_line_column(code_lines, line=None, column=None):
+    """
+    Returns the position for ``line`` and ``column`` (the end of the file or
+    line if omitted) and raises a ``ValueError`` if it's not in the code.
+    """
+    line = max(len(code_lines), 1) if line is None else line
+    if not (0 < line <= len(code_lines)):
+        raise ValueError('`line` parameter is not in a valid range.')
 
-    before_cursor = code_lines[line_index][:user_pos[1]]
-    other_lines = code_lines[bracket_leaf.start_pos[0]:line_index]
-    whole = ''.join(other_lines + [before_cursor])
-    before_bracket = re.match(r'.*\(', whole, re.DOTALL)
+    line_string = code_lines[line - 1]
+    line_len = len(line_string)
+    if line_string.endswith('\r\n'):
+        line_len -= 2
+    elif line_string.endswith('\n'):
+        line_len -= 1
 
-    module_path = context.get_root_context().py__file__()
-    if module_path is None:
-        yield None  # Don't cache!
-    else:
-        yield (module_path, before_bracket, bracket_leaf.start_pos)
-    yield infer(
-        inference_state,
-        context,
-        bracket_leaf.get_previous_leaf(),
-    )
+    column = line_len if column is None else column
+    if not (0 <= column <= line_len):
+        raise ValueError('`column` parameter (%d) is not in a valid range '
+                         '(0-%d) for line %d (%r).' % (
+                             column, line_len, line, line_string))
+    return line, column
 
 
 def validate_line_column(func):
     @wraps(func)
     def wrapper(self, line=None, column=None, *args, **kwargs):
-        line = max(len(self._code_lines), 1) if line is None else line
-        if not (0 < line <= len(self._code_lines)):
-            raise ValueError('`line` parameter is not in a valid range.')
-
-        line_string = self._code_lines[line - 1]
-        line_len = len(line_string)
-        if line_string.endswith('\r\n'):
-            line_len -= 2
-        elif line_string.endswith('\n'):
-            line_len -= 1
-
-        column = line_len if column is None else column
-        if not (0 <= column <= line_len):
-            raise ValueError('`column` parameter (%d) is not in a valid range '
-                             '(0-%d) for line %d (%r).' % (
-                                 column, line_len, line, line_string))
+        line, column = get_line_column(self._code_lines, line, column)
         return func(self, line, column, *args, **kwargs)
     return wrapper
 
 
+def collect_stats(func):
+    """
+    Collects the statistics of an API call and stores them as
+    ``self.last_stats``, see :mod:`jedi.stats`.
+    """
+    @wraps(func)
+    def wrapper(self, *args, **kwargs):
+        collected = None
+        try:
+            with stats.collect(func.__name__) as collected:
+                return func(self, *args, **kwargs)
+        finally:
+            if collected is not None:
+                self.last_stats = collected.as_dict()
+    return wrapper
+
+
 def get_module_names(module, all_scopes, definitions=True, references=False):
     """
     Returns a dictionary with name parts as keys and their call paths as
@@ -0,0 +1,424 @@
+"""
+Builds an index of all names in a project, so definitions and references can
+be looked up later without running the inference again::
+
+    python -m jedi index --jobs 8 src/
+
+The index is an SQLite database (``.jedi/index.sqlite`` in the project by
+default) that is memory mapped when it's queried with :class:`Index`. Building
+it again only indexes the files that changed and the files that import them.
+
+This is a pre-alpha API and will very likely change.
+"""
+import argparse
+import hashlib
+import os
+import sqlite3
+import traceback
+from multiprocessing import Pool
+from pathlib import Path
+
+from jedi import debug
+from jedi.file_io import FolderIO
+from jedi.inference.references import recurse_find_python_files
+
+_INDEX_SERIALIZER_VERSION = 2
+_MMAP_SIZE = 2 ** 30
+
+_SCHEMA = '''
+CREATE TABLE files (
+    id INTEGER PRIMARY KEY, path TEXT UNIQUE NOT NULL,
+    mtime_ns INTEGER, size INTEGER, hash TEXT
+);
+CREATE TABLE symbols (
+    id INTEGER PRIMARY KEY, path TEXT, line INTEGER, column INTEGER,
+    name TEXT, kind TEXT, UNIQUE (path, line, column, name)
+);
+CREATE TABLE names (
+    file_id INTEGER NOT NULL, line INTEGER, column INTEGER, length INTEGER,
+    symbol_id INTEGER
+);
+CREATE TABLE imports (file_id INTEGER NOT NULL, path TEXT NOT NULL);
+CREATE INDEX names_position ON names (file_id, line, column);
+CREATE INDEX names_symbol ON names (symbol_id);
+CREATE INDEX symbols_name ON symbols (name);
+CREATE INDEX imports_file ON imports (file_id);
+CREATE INDEX imports_path ON imports (path);
+'''
+
+_project = None
+
+
+def get_default_index_path(project):
+    return os.path.join(str(project.path), '.jedi', 'index.sqlite')
+
+
+def _connect(index_path):
+    connection = sqlite3.connect(index_path)
+    version, = connection.execute('PRAGMA user_version').fetchone()
+    if version != _INDEX_SERIALIZER_VERSION:
+        connection.close()
+        # An index of another version is just built again.
+        if os.path.exists(index_path):
+            os.remove(index_path)
+        connection = sqlite3.connect(index_path)
+        connection.executescript(_SCHEMA)
+        connection.execute('PRAGMA user_version = %d' % _INDEX_SERIALIZER_VERSION)
+    return connection
+
+
+def _hash_file(path):
+    with open(path, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def _get_imports(script):
+    positions = [
+        import_path[-1].start_pos
+        for import_ in script._module_node.iter_imports()
+        for import_path in import_.get_paths()
+    ]
+    return sorted({
+        str(d.module_path)
+        for names in script.infer_many(positions)
+        for d in names
+        if d.type == 'module' and d.module_path is not None
+    })
+
+
+def _index_file(path, project):
+    """
+    Returns the names (with the symbols they refer to) and the imports of a
+    file as plain data, so it can be passed between processes.
+    """
+    import jedi
+
+    try:
+        script = jedi.Script(path=path, project=project, budget='batch')
+        # Names have to refer to the definitions in other modules, not to
+        # the imports, so references across modules can be found.
+        semantic_map = script.get_semantic_map(follow_imports=True)
+        names = []
+        for i in range(len(semantic_map)):
+            target = semantic_map.targets[i]
+            if target == -1:
+                continue
+            line = semantic_map.lines[i]
+            column = semantic_map.columns[i]
+            text = script._code_lines[line - 1][column:column + semantic_map.lengths[i]]
+            symbol_path, symbol_line, symbol_column, _ = semantic_map.definitions[target]
+            # Builtins have no path and position, NULL would make the symbols
+            # unique.
+            symbol = (symbol_path or '', symbol_line or 0, symbol_column or 0, text,
+                      semantic_map.kinds[i])
+            names.append((line, column, semantic_map.lengths[i], symbol))
+        return dict(path=path, names=names, imports=_get_imports(script))
+    except Exception:
+        debug.warning('Failed to index %s', path)
+        return dict(path=path, names=[], imports=[], failure=traceback.format_exc())
+
+
+def _init_worker(project):
+    global _project
+    _project = project
+    import jedi
+    jedi.preload_module('builtins', 'typing')
+
+
+def _index_file_in_worker(path):
+    return _index_file(path, _project)
+
+
+def _get_stat(path):
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _get_changed_paths(connection, paths):
+    """
+    Returns the paths that are new or changed and updates the modification
+    times of files whose content did not change.
+    """
+    indexed = {
+        path: (mtime_ns, size, hash_)
+        for path, mtime_ns, size, hash_
+        in connection.execute('SELECT path, mtime_ns, size, hash FROM files')
+    }
+    changed = []
+    for path in paths:
+        try:
+            mtime_ns, size, hash_ = indexed[path]
+        except KeyError:
+            changed.append(path)
+            continue
+        stat = _get_stat(path)
+        if stat == (mtime_ns, size) and hash_ is not None:
+            continue
+        if hash_ is not None and stat is not None and _hash_file(path) == hash_:
+            connection.execute('UPDATE files SET mtime_ns = ?, size = ? WHERE path = ?',
+                               stat + (path,))
+        else:
+            changed.append(path)
+    return changed
+
+
+def _get_importers(connection, paths):
+    """
+    Returns the files that import one of ``paths`` (directly or indirectly).
+    """
+    importers = set()
+    todo = list(paths)
+    while todo:
+        path = todo.pop()
+        for importer, in connection.execute(
+                'SELECT files.path FROM imports JOIN files ON files.id = imports.file_id '
+                'WHERE imports.path = ?', (path,)):
+            if importer not in importers:
+                importers.add(importer)
+                todo.append(importer)
+    return importers
+
+
+def _remove_files(connection, paths):
+    for path in paths:
+        row = connection.execute('SELECT id FROM files WHERE path = ?', (path,)).fetchone()
+        if row is not None:
+            connection.execute('DELETE FROM names WHERE file_id = ?', row)
+            connection.execute('DELETE FROM imports WHERE file_id = ?', row)
+            connection.execute('DELETE FROM files WHERE id = ?', row)
+
+
+def _get_symbol_id(connection, symbol):
+    connection.execute(
+        'INSERT OR IGNORE INTO symbols (path, line, column, name, kind) VALUES (?, ?, ?, ?, ?)',
+        symbol,
+    )
+    return connection.execute(
+        'SELECT id FROM symbols WHERE path = ? AND line = ? AND column = ? AND name = ?',
+        symbol[:4],
+    ).fetchone()[0]
+
+
+def _store_result(connection, result, stat, hash_):
+    path = result['path']
+    _remove_files(connection, [path])
+    if stat is None or hash_ is None or 'failure' in result:
+        # Without a hash the file is indexed again next time.
+        stat, hash_ = (None, None), None
+    cursor = connection.execute(
+        'INSERT INTO files (path, mtime_ns, size, hash) VALUES (?, ?, ?, ?)',
+        (path,) + stat + (hash_,),
+    )
+    file_id = cursor.lastrowid
+    connection.executemany(
+        'INSERT INTO names (file_id, line, column, length, symbol_id) VALUES (?, ?, ?, ?, ?)',
+        [(file_id, line, column, length, _get_symbol_id(connection, symbol))
+         for line, column, length, symbol in result['names']],
+    )
+    connection.executemany(
+        'INSERT INTO imports (file_id, path) VALUES (?, ?)',
+        [(file_id, p) for p in result['imports']],
+    )
+
+
+def build_index(project, index_path=None, *, paths=None, jobs=1):
+    """
+    Indexes the Python files of a :class:`.Project` (or ``paths`` if given)
+    that changed since the index was built the last time. Files that import
+    changed files are indexed again as well, because the positions of the
+    names they refer to might have changed.
+
+    :param index_path: Default ``.jedi/index.sqlite`` in the project.
+    :param jobs: The number of processes that index files.
+    :return: The indexed paths and the results of files that could not be
+        indexed (dicts with ``path`` and ``failure``).
+    """
+    if index_path is None:
+        index_path = get_default_index_path(project)
+    if paths is None:
+        paths = [
+            str(file_io.path)
+            for file_io in recurse_find_python_files(FolderIO(str(project.path)))
+        ]
+    else:
+        paths = [os.path.abspath(p) for p in paths]
+
+    os.makedirs(os.path.dirname(os.path.abspath(index_path)), exist_ok=True)
+    connection = _connect(index_path)
+    try:
+        with connection:
+            path_set = set(paths)
+            removed = [
+                p for p, in connection.execute('SELECT path FROM files')
+                if p not in path_set and not os.path.exists(p)
+            ]
+            changed = _get_changed_paths(connection, paths)
+            todo = sorted(set(changed) | _get_importers(connection, changed + removed))
+            _remove_files(connection, removed)
+            todo = [p for p in todo if p not in removed]
+
+        stats = {p: _get_stat(p) for p in todo}
+        hashes = {}
+        for p in todo:
+            try:
+                hashes[p] = _hash_file(p)
+            except OSError:
+                hashes[p] = None
+
+        if jobs == 1 or len(todo) <= 1:
+            results = (_index_file(p, project) for p in todo)
+            pool = None
+        else:
+            pool = Pool(jobs, initializer=_init_worker, initargs=(project,))
+            results = pool.imap_unordered(_index_file_in_worker, todo, chunksize=4)
+
+        failures = []
+        try:
+            for result in results:
+                if 'failure' in result:
+                    failures.append(dict(path=result['path'], failure=result['failure']))
+                with connection:
+                    _store_result(connection, result, stats[result['path']],
+                                  hashes[result['path']])
+        finally:
+            if pool is not None:
+                pool.terminate()
+                pool.join()
+
+        with connection:
+            connection.execute(
+                'DELETE FROM symbols WHERE id NOT IN (SELECT symbol_id FROM names)'
+            )
+    finally:
+        connection.close()
+    return todo, failures
+
+
+def _to_position(path, line, column):
+    if not path:
+        # Builtins
+        return None, None, None
+    return path, line, column
+
+
+class Index:
+    """
+    Queries an index that was built with :func:`build_index`. Paths are
+    absolute, lines start with 1 and columns with 0.
+    """
+    def __init__(self, index_path):
+        self._connection = sqlite3.connect(
+            Path(index_path).resolve().as_uri() + '?mode=ro',
+            uri=True,
+        )
+        self._connection.execute('PRAGMA mmap_size = %d' % _MMAP_SIZE)
+        version, = self._connection.execute('PRAGMA user_version').fetchone()
+        if version != _INDEX_SERIALIZER_VERSION:
+            self._connection.close()
+            raise ValueError('The index %s needs to be built again.' % index_path)
+
+    def close(self):
+        self._connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def _get_symbol_ids(self, path, line, column):
+        return [symbol_id for symbol_id, in self._connection.execute(
+            'SELECT symbol_id FROM names JOIN files ON files.id = names.file_id '
+            'WHERE files.path = ? AND names.line = ? AND names.column <= ? '
+            'AND names.column + names.length >= ?',
+            (os.path.abspath(path), line, column, column),
+        )]
+
+    def goto(self, path, line, column):
+        """
+        Returns the definitions of the name at a position as a list of
+        ``(path, line, column)``, which are ``None`` for builtins.
+        """
+        return sorted({
+            _to_position(*row)
+            for symbol_id in self._get_symbol_ids(path, line, column)
+            for row in self._connection.execute(
+                'SELECT path, line, column FROM symbols WHERE id = ?', (symbol_id,)
+            )
+        }, key=lambda p: (p[0] or '', p[1] or 0, p[2] or 0))
+
+    def get_references(self, path, line, column):
+        """
+        Returns all names in the index that refer to the same definition as
+        the name at a position (including the definition) as a sorted list of
+        ``(path, line, column)``.
+        """
+        return sorted({
+            row
+            for symbol_id in self._get_symbol_ids(path, line, column)
+            for row in self._connection.execute(
+                'SELECT files.path, names.line, names.column '
+                'FROM symbols AS symbol JOIN symbols ON symbols.path = symbol.path '
+                'AND symbols.line = symbol.line AND symbols.column = symbol.column '
+                # Builtins have no position.
+                "AND (symbols.path != '' OR symbols.name = symbol.name) "
+                'JOIN names ON names.symbol_id = symbols.id '
+                'JOIN files ON files.id = names.file_id '
+                'WHERE symbol.id = ?', (symbol_id,)
+            )
+        })
+
+    def search(self, name):
+        """
+        Returns the definitions called ``name`` in the indexed files as a
+        sorted list of ``(path, line, column, kind)``.
+        """
+        return sorted(self._connection.execute(
+            'SELECT DISTINCT symbols.path, symbols.line, symbols.column, symbols.kind '
+            'FROM symbols JOIN names ON names.symbol_id = symbols.id '
+            'JOIN files ON files.id = names.file_id '
+            'WHERE symbols.name = ? AND files.path = symbols.path '
+            'AND names.line = symbols.line AND names.column = symbols.column',
+            (name,)
+        ))
+
+    def get_imports(self, path):
+        """Returns the paths of the modules that a file imports."""
+        return sorted(p for p, in self._connection.execute(
+            'SELECT imports.path FROM imports JOIN files ON files.id = imports.file_id '
+            'WHERE files.path = ?', (os.path.abspath(path),)
+        ))
+
+    def get_importers(self, path):
+        """Returns the paths of the indexed files that import a module."""
+        return sorted(p for p, in self._connection.execute(
+            'SELECT files.path FROM imports JOIN files ON files.id = imports.file_id '
+            'WHERE imports.path = ?', (os.path.abspath(path),)
+        ))
+
+
+def main(args):
+    import jedi
+
+    parser = argparse.ArgumentParser(prog='python -m jedi index')
+    parser.add_argument('project', nargs='?', default='.',
+                        help='The project folder (default: the current folder).')
+    parser.add_argument('-j', '--jobs', type=int, default=os.cpu_count() or 1,
+                        help='Number of processes (default: number of CPUs).')
+    parser.add_argument('-o', '--output', default=None, metavar='PATH',
+                        help='The index file (default: .jedi/index.sqlite in the project).')
+    args = parser.parse_args(args)
+
+    path = os.path.abspath(args.project)
+    try:
+        project = jedi.Project.load(path)
+    except FileNotFoundError:
+        project = jedi.Project(path)
+    indexed, failures = build_index(project, args.output, jobs=max(args.jobs, 1))
+    for failure in failures:
+        print('Failed to index %s:\n%s' % (failure['path'], failure['failure']))
+    print('Indexed %s files' % len(indexed))
+    return 1 if failures else 0
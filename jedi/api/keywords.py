@@ -1,22 +1,22 @@
-import pydoc
+import json
+import os
+import sys
 from contextlib import suppress
 from typing import Dict, Optional
 
+from jedi import settings
 from jedi.inference.names import AbstractArbitraryName
 
-try:
-    from pydoc_data import topics
-    pydoc_topics: Optional[Dict[str, str]] = topics.topics
-except ImportError:
-    # Python 3.6.8 embeddable does not have pydoc_data.
-    pydoc_topics = None
+_INDEX_SERIALIZER_VERSION = 1
+
+_keyword_docs: Optional[Dict[str, str]] = None
 
 
 class KeywordName(AbstractArbitraryName):
     api_type = 'keyword'
 
     def py__doc__(self):
-        return imitate_pydoc(self.string_name)
+        return get_keyword_docs().get(self.string_name, '')
 
 
 def imitate_pydoc(string):
@@ -24,7 +24,11 @@ def imitate_pydoc(string):
     It's not possible to get the pydoc's without starting the annoying pager
     stuff.
     """
-    if pydoc_topics is None:
+    import pydoc
+    try:
+        from pydoc_data import topics
+    except ImportError:
+        # Python 3.6.8 embeddable does not have pydoc_data.
         return ''
 
     h = pydoc.help
@@ -46,6 +50,60 @@ def imitate_pydoc(string):
         return ''
 
     try:
-        return pydoc_topics[label].strip() if pydoc_topics else ''
+        return topics.topics[label].strip()
     except KeyError:
         return ''
+
+
+def get_keyword_docs():
+    """
+    Returns a mapping of keywords, symbols and pydoc topics to their
+    documentation. The index is only built once per Python version and is
+    persisted in :data:`jedi.settings.cache_directory`.
+    """
+    global _keyword_docs
+    if _keyword_docs is None:
+        path = _get_index_path()
+        _keyword_docs = _load_index(path)
+        if _keyword_docs is None:
+            _keyword_docs = _build_index()
+            _save_index(path, _keyword_docs)
+    return _keyword_docs
+
+
+def _get_index_path():
+    return os.path.join(
+        settings.cache_directory,
+        'keyword-docs-%s.json' % '.'.join(map(str, sys.version_info[:3])),
+    )
+
+
+def _build_index():
+    import pydoc
+
+    h = pydoc.help
+    names = set(h.keywords) | set(h.symbols) | set(h.topics)
+    docs = {name: imitate_pydoc(name) for name in names}
+    return {name: doc for name, doc in docs.items() if doc}
+
+
+def _load_index(path):
+    try:
+        with open(path) as f:
+            version, data = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if version != _INDEX_SERIALIZER_VERSION:
+        return None
+    return data
+
+
+def _save_index(path, data):
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w') as f:
+            json.dump((_INDEX_SERIALIZER_VERSION, data), f)
+    except OSError:
+        # The cache directory might not be writable, which is not a problem,
+        # the index is just rebuilt in the next process.
+        pass
@@ -8,17 +8,19 @@ Projects can be saved to disk and loaded again, to allow project definitions to
 be used across repositories.
 """
 import json
+import os
 from pathlib import Path
 from itertools import chain
 
 from jedi import debug
+from jedi import stats
 from jedi.api.environment import get_cached_default_environment, create_environment
 from jedi.api.exceptions import WrongVersion
 from jedi.api.completion import search_in_module
 from jedi.api.helpers import split_search_string, get_module_names
 from jedi.inference.imports import load_module_from_path, \
     load_namespace_from_path, iter_module_names
-from jedi.inference.sys_path import discover_buildout_paths
+from jedi.inference.sys_path import discover_buildout_paths, get_buildout_dependencies
 from jedi.inference.cache import inference_state_as_method_param_cache
 from jedi.inference.references import recurse_find_python_folders_and_files, search_in_file_ios
 from jedi.file_io import FolderIO
@@ -29,6 +31,9 @@ _CONTAINS_POTENTIAL_PROJECT = \
 
 _SERIALIZER_VERSION = 1
 
+# path -> (stat paths, stat signature, project), see get_default_project
+_default_projects = {}
+
 
 def _try_to_skip_duplicates(func):
     def wrapper(*args, **kwargs):
@@ -99,6 +104,7 @@ class Project:
         data = dict(self.__dict__)
         data.pop('_environment', None)
         data.pop('_django', None)  # TODO make django setting public?
+        data.pop('_sys_path_cache', None)
         data = {k.lstrip('_'): v for k, v in data.items()}
         data['path'] = str(data['path'])
 
@@ -106,6 +112,13 @@ class Project:
         with open(self._get_json_path(self._path), 'w') as f:
             return json.dump((_SERIALIZER_VERSION, data), f)
 
+    def __getstate__(self):
+        # Projects are passed to other processes, but environments can't.
+        state = dict(self.__dict__)
+        state.pop('_environment', None)
+        state['_sys_path_cache'] = {}
+        return state
+
     def __init__(
         self,
         path,
@@ -147,6 +160,9 @@ class Project:
         self._smart_sys_path = smart_sys_path
         self._load_unsafe_extensions = load_unsafe_extensions
         self._django = False
+        # (script folder, add_parent_paths, add_init_paths) ->
+        # (stat paths, stat signature, sys path entries)
+        self._sys_path_cache = {}
         # Remap potential pathlib.Path entries
         self.added_sys_path = list(map(str, added_sys_path))
         """The sys path that is going to be added at the end of the """
@@ -209,29 +225,11 @@ class Project:
             prefixed.append(str(self._path))
 
             if inference_state.script_path is not None:
-                suffixed += map(str, discover_buildout_paths(
+                suffixed += self._get_script_sys_path(
                     inference_state,
-                    inference_state.script_path
-                ))
-
-                if add_parent_paths:
-                    # Collect directories in upward search by:
-                    #   1. Skipping directories with __init__.py
-                    #   2. Stopping immediately when above self._path
-                    traversed = []
-                    for parent_path in inference_state.script_path.parents:
-                        if parent_path == self._path \
-                                or self._path not in parent_path.parents:
-                            break
-                        if not add_init_paths \
-                                and parent_path.joinpath("__init__.py").is_file():
-                            continue
-                        traversed.append(str(parent_path))
-
-                    # AFAIK some libraries have imports like `foo.foo.bar`, which
-                    # leads to the conclusion to by default prefer longer paths
-                    # rather than shorter ones by default.
-                    suffixed += reversed(traversed)
+                    add_parent_paths=add_parent_paths,
+                    add_init_paths=add_init_paths,
+                )
 
         if self._django:
             prefixed.append(str(self._path))
@@ -239,12 +237,73 @@ class Project:
         path = prefixed + sys_path + suffixed
         return list(_remove_duplicates_from_path(path))
 
+    def _get_script_sys_path(self, inference_state, add_parent_paths, add_init_paths):
+        """
+        Returns the sys path entries that depend on the folder of the script.
+
+        They are cached per project and shared between inference states. An
+        entry is validated by the modification times of the parent folders
+        (adding/removing an ``__init__.py`` or ``buildout.cfg`` changes them)
+        and of the buildout scripts.
+        """
+        script_path = inference_state.script_path
+        key = str(script_path.parent), add_parent_paths, add_init_paths
+        try:
+            stat_paths, signature, result = self._sys_path_cache[key]
+        except KeyError:
+            pass
+        else:
+            if _get_stat_signature(stat_paths) == signature:
+                stats.increment('sys_path_cache_hits')
+                return result
+
+        stat_paths = list(script_path.parents) + get_buildout_dependencies(script_path)
+        # The signature is created before the sys path is calculated, so that
+        # concurrent modifications lead to a recalculation next time.
+        signature = _get_stat_signature(stat_paths)
+
+        result = [str(p) for p in discover_buildout_paths(inference_state, script_path)]
+        if add_parent_paths:
+            # Collect directories in upward search by:
+            #   1. Skipping directories with __init__.py
+            #   2. Stopping immediately when above self._path
+            traversed = []
+            for parent_path in script_path.parents:
+                if parent_path == self._path \
+                        or self._path not in parent_path.parents:
+                    break
+                if not add_init_paths \
+                        and parent_path.joinpath("__init__.py").is_file():
+                    continue
+                traversed.append(str(parent_path))
+
+            # AFAIK some libraries have imports like `foo.foo.bar`, which
+            # leads to the conclusion to by default prefer longer paths
+            # rather than shorter ones by default.
+            result += reversed(traversed)
+
+        self._sys_path_cache[key] = stat_paths, signature, result
+        return result
+
+    def get_cached_sys_paths(self):
+        """
+        Returns the cached sys path entries that were added for scripts in
+        specific folders (buildout paths and parent folders). This is mostly
+        useful for debugging.
+
+        :returns: dict of ``(script_folder, add_parent_paths,
+            add_init_paths)`` to a list of ``str``
+        """
+        return {key: list(result) for key, (_, _, result) in self._sys_path_cache.items()}
+
     def get_environment(self):
+        if self._environment_path is None:
+            # Not stored on the project, because projects are reused by
+            # get_default_project and the default environment might change
+            # (e.g. a different VIRTUAL_ENV).
+            return get_cached_default_environment()
         if self._environment is None:
-            if self._environment_path is not None:
-                self._environment = create_environment(self._environment_path, safe=False)
-            else:
-                self._environment = get_cached_default_environment()
+            self._environment = create_environment(self._environment_path, safe=False)
         return self._environment
 
     def search(self, string, *, all_scopes=False):
@@ -370,6 +429,16 @@ class Project:
         return '<%s: %s>' % (self.__class__.__name__, self._path)
 
 
+def _get_stat_signature(paths):
+    signature = []
+    for path in paths:
+        try:
+            signature.append(os.stat(path).st_mtime_ns)
+        except OSError:
+            signature.append(None)
+    return signature
+
+
 def _is_potential_project(path):
     for name in _CONTAINS_POTENTIAL_PROJECT:
         try:
@@ -398,6 +467,10 @@ def get_default_project(path=None):
     1. A ``.jedi/config.json``
     2. One of the following files: ``setup.py``, ``.git``, ``.hg``,
        ``requirements.txt`` and ``MANIFEST.in``.
+
+    The projects are cached and the same :class:`.Project` object is returned
+    until one of the traversed folders (or a ``.jedi/project.json`` or
+    ``manage.py`` in them) is modified.
     """
     if path is None:
         path = Path.cwd()
@@ -405,9 +478,33 @@ def get_default_project(path=None):
         path = Path(path)
 
     check = path.absolute()
+    try:
+        stat_paths, signature, project = _default_projects[check]
+    except KeyError:
+        pass
+    else:
+        if _get_stat_signature(stat_paths) == signature:
+            stats.increment('default_project_cache_hits')
+            return project
+
+    traversed = []
+    project = _find_default_project(path, check, traversed)
+    stat_paths = []
+    for dir in traversed:
+        stat_paths.append(dir)
+        stat_paths.append(Project._get_json_path(dir))
+        manage_py = dir.joinpath('manage.py')
+        if manage_py.exists():
+            stat_paths.append(manage_py)
+    _default_projects[check] = stat_paths, _get_stat_signature(stat_paths), project
+    return project
+
+
+def _find_default_project(path, check, traversed):
     probable_path = None
     first_no_init_file = None
     for dir in chain([check], check.parents):
+        traversed.append(dir)
         try:
             return Project.load(dir)
         except (FileNotFoundError, IsADirectoryError, PermissionError):
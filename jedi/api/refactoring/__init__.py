@@ -1,12 +1,21 @@
 import difflib
+import os
+import shutil
+import tempfile
+from multiprocessing import Pool
 from pathlib import Path
-from typing import Dict, Iterable, Tuple
+from typing import Dict, Iterable, Iterator, Tuple
 
 from parso import split_lines
 
 from jedi.api.exceptions import RefactoringError
+from jedi.cache import memoize_method
 from jedi.inference.value.namespace import ImplicitNSName
 
+# Diffing a file takes less than a millisecond usually, starting processes and
+# sending them the code only pays off for a lot of files.
+_MIN_FILES_FOR_PROCESSES = 100
+
 EXPRESSION_PARTS = (
     'or_test and_test not_test comparison '
     'expr xor_expr and_expr shift_expr arith_expr term factor power atom_expr'
@@ -22,47 +31,22 @@ class ChangedFile:
         self._module_node = module_node
         self._node_to_str_map = node_to_str_map
 
-    def get_diff(self):
-        old_lines = split_lines(self._module_node.get_code(), keepends=True)
-        new_lines = split_lines(self.get_new_code(), keepends=True)
-
-        # Add a newline at the end if it's missing. Otherwise the diff will be
-        # very weird. A `diff -u file1 file2` would show the string:
-        #
-        #     \ No newline at end of file
-        #
-        # This is not necessary IMO, because Jedi does not really play with
-        # newlines and the ending newline does not really matter in Python
-        # files. ~dave
-        if old_lines[-1] != '':
-            old_lines[-1] += '\n'
-        if new_lines[-1] != '':
-            new_lines[-1] += '\n'
-
+    def _get_diff_args(self):
         project_path = self._inference_state.project.path
         if self._from_path is None:
             from_p = ''
         else:
-            try:
-                from_p = self._from_path.relative_to(project_path)
-            except ValueError:  # Happens it the path is not on th project_path
-                from_p = self._from_path
+            from_p = _try_relative_to(self._from_path, project_path)
         if self._to_path is None:
             to_p = ''
         else:
-            try:
-                to_p = self._to_path.relative_to(project_path)
-            except ValueError:
-                to_p = self._to_path
-        diff = difflib.unified_diff(
-            old_lines, new_lines,
-            fromfile=str(from_p),
-            tofile=str(to_p),
-        )
-        # Apparently there's a space at the end of the diff - for whatever
-        # reason.
-        return ''.join(diff).rstrip(' ')
+            to_p = _try_relative_to(self._to_path, project_path)
+        return self._module_node.get_code(), self.get_new_code(), str(from_p), str(to_p)
 
+    def get_diff(self):
+        return _get_diff(*self._get_diff_args())
+
+    @memoize_method
     def get_new_code(self):
         return self._inference_state.grammar.refactor(self._module_node, self._node_to_str_map)
 
@@ -72,19 +56,93 @@ class ChangedFile:
                 'Cannot apply a refactoring on a Script with path=None'
             )
 
-        with open(self._from_path, 'w', newline='') as f:
-            f.write(self.get_new_code())
+        _write_files([(self._from_path, self.get_new_code())])
 
     def __repr__(self):
         return '<%s: %s>' % (self.__class__.__name__, self._from_path)
 
 
+def _get_diff(old_code, new_code, from_p, to_p):
+    old_lines = split_lines(old_code, keepends=True)
+    new_lines = split_lines(new_code, keepends=True)
+
+    # Add a newline at the end if it's missing. Otherwise the diff will be
+    # very weird. A `diff -u file1 file2` would show the string:
+    #
+    #     \ No newline at end of file
+    #
+    # This is not necessary IMO, because Jedi does not really play with
+    # newlines and the ending newline does not really matter in Python
+    # files. ~dave
+    if old_lines[-1] != '':
+        old_lines[-1] += '\n'
+    if new_lines[-1] != '':
+        new_lines[-1] += '\n'
+
+    diff = difflib.unified_diff(
+        old_lines, new_lines,
+        fromfile=from_p,
+        tofile=to_p,
+    )
+    # Apparently there's a space at the end of the diff - for whatever
+    # reason.
+    return ''.join(diff).rstrip(' ')
+
+
+def _get_diff_in_worker(args):
+    return _get_diff(*args)
+
+
+def _write_files(path_code_pairs):
+    """
+    Writes all files to temporary files first and replaces the original files
+    only if that worked for all of them. This way a refactoring is not applied
+    partially if e.g. the disk is full.
+    """
+    tmp_paths = []
+    try:
+        for path, code in path_code_pairs:
+            # Symlinks stay symlinks, the file they point to is replaced.
+            path = os.path.realpath(path)
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix='.jedi-')
+            tmp_paths.append((tmp_path, path))
+            with open(fd, 'w', newline='') as f:
+                f.write(code)
+            _copy_metadata(path, tmp_path)
+    except BaseException:
+        for tmp_path, _ in tmp_paths:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+        raise
+
+    for tmp_path, path in tmp_paths:
+        os.replace(tmp_path, path)
+
+
+def _copy_metadata(path, tmp_path):
+    try:
+        shutil.copymode(path, tmp_path)
+    except OSError:
+        # The file doesn't exist yet.
+        return
+    stat = os.stat(path)
+    try:
+        os.chown(tmp_path, stat.st_uid, stat.st_gid)
+    except (OSError, AttributeError):
+        # Only privileged users can give files to other users and
+        # os.chown doesn't exist on Windows.
+        pass
+
+
 class Refactoring:
     def __init__(self, inference_state, file_to_node_changes, renames=()):
         self._inference_state = inference_state
         self._renames = renames
         self._file_to_node_changes = file_to_node_changes
 
+    @memoize_method
     def get_changed_files(self) -> Dict[Path, ChangedFile]:
         def calculate_to_path(p):
             if p is None:
@@ -117,21 +175,55 @@ class Refactoring:
         """
         return sorted(self._renames)
 
-    def get_diff(self):
+    def iter_diff(self, *, jobs=1) -> Iterator[str]:
+        """
+        Like :meth:`get_diff`, but yields the diff in parts (the renames and
+        then one part per changed file), as soon as they are ready.
+
+        :param jobs: The number of processes that calculate the diffs of the
+            changed files. Processes are only used for big refactorings.
+        """
         text = ''
         project_path = self._inference_state.project.path
         for from_, to in self.get_renames():
             text += 'rename from %s\nrename to %s\n' \
                 % (_try_relative_to(from_, project_path), _try_relative_to(to, project_path))
+        if text:
+            yield text
+
+        changed_files = list(self.get_changed_files().values())
+        if jobs == 1 or len(changed_files) < _MIN_FILES_FOR_PROCESSES:
+            for f in changed_files:
+                yield f.get_diff()
+            return
+
+        # The new code has to be generated in this thread, the pool consumes
+        # iterators in a separate thread.
+        args = [f._get_diff_args() for f in changed_files]
+        with Pool(jobs) as pool:
+            yield from pool.imap(_get_diff_in_worker, args, chunksize=8)
+
+    def get_diff(self, *, jobs=1):
+        """
+        Returns a unified diff of the whole refactoring.
 
-        return text + ''.join(f.get_diff() for f in self.get_changed_files().values())
+        :param jobs: The number of processes that calculate the diffs of the
+            changed files. Processes are only used for big refactorings.
+        """
+        return ''.join(self.iter_diff(jobs=jobs))
 
     def apply(self):
         """
         Applies the whole refactoring to the files, which includes renames.
+        The changed files are only written if the new code of all of them
+        could be written.
         """
-        for f in self.get_changed_files().values():
-            f.apply()
+        changed_files = self.get_changed_files().values()
+        if any(f._from_path is None for f in changed_files):
+            raise RefactoringError(
+                'Cannot apply a refactoring on a Script with path=None'
+            )
+        _write_files([(f._from_path, f.get_new_code()) for f in changed_files])
 
         for old, new in self.get_renames():
             old.rename(new)
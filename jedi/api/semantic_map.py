@@ -0,0 +1,146 @@
+"""
+A semantic map contains the kind, definition and type of every name in a file,
+see :meth:`.Script.get_semantic_map`.
+"""
+import time
+from dataclasses import replace
+
+from jedi.api import classes
+from jedi.api.helpers import get_module_names
+
+
+class SemanticMap:
+    """
+    Generated by :meth:`.Script.get_semantic_map`. The information is stored
+    in parallel lists (one entry per name, sorted by position) to keep it
+    compact.
+    """
+    def __init__(self):
+        self.lines = []
+        """The lines of the names (starting with 1)."""
+        self.columns = []
+        """The columns of the names (starting with 0)."""
+        self.lengths = []
+        """The lengths of the names."""
+        self.kinds = []
+        """
+        The :attr:`.Name.type` of the definitions of the names (e.g.
+        ``'function'``), ``None`` if the definition is not known.
+        """
+        self.targets = []
+        """Indexes into :attr:`definitions`, ``-1`` if not known."""
+        self.types = []
+        """Indexes into :attr:`type_names`, ``-1`` if not known."""
+        self.definitions = []
+        """
+        The definitions of names as ``(module_path, line, column, full_name)``.
+        The path is ``None`` for code without a path. Builtins have no path
+        and position, local names have no full name.
+        """
+        self.type_names = []
+        """
+        The inferred types, e.g. ``'builtins.int'`` or ``'builtins.int |
+        builtins.str'`` if there are multiple.
+        """
+        self.complete = True
+        """
+        False if the time budget was exceeded. Names that were not resolved in
+        time have no kind, target and type. The name that was being resolved
+        when the time was up might be resolved only partially.
+        """
+
+    def __len__(self):
+        return len(self.lines)
+
+    def __repr__(self):
+        return '<%s: %s names>' % (self.__class__.__name__, len(self))
+
+
+def _index(indexes, list_, key):
+    try:
+        return indexes[key]
+    except KeyError:
+        indexes[key] = len(list_)
+        list_.append(key)
+        return indexes[key]
+
+
+def _get_type_name(names):
+    return ' | '.join(sorted({n.full_name or n.name for n in names}))
+
+
+def create_semantic_map(inference_state, module_context, follow_imports=False,
+                        time_budget=None):
+    semantic_map = SemanticMap()
+    definition_indexes = {}
+    type_name_indexes = {}
+    # Names with the same definitions have the same types, infer them only
+    # once.
+    types_by_targets = {}
+
+    tree_names = sorted(
+        get_module_names(module_context.tree_node, all_scopes=True, references=True),
+        key=lambda n: n.start_pos,
+    )
+    deadline = None if time_budget is None else time.perf_counter() + time_budget
+    budget = inference_state.budget
+    for tree_name in tree_names:
+        line, column = tree_name.start_pos
+        semantic_map.lines.append(line)
+        semantic_map.columns.append(column)
+        semantic_map.lengths.append(len(tree_name.value))
+        if semantic_map.complete and deadline is not None \
+                and time.perf_counter() > deadline:
+            semantic_map.complete = False
+        if not semantic_map.complete:
+            semantic_map.kinds.append(None)
+            semantic_map.targets.append(-1)
+            semantic_map.types.append(-1)
+            continue
+
+        if deadline is not None:
+            # Functions are not executed anymore once the time is up, so
+            # a slow name cannot take much longer than the time budget.
+            time_limit = deadline - time.perf_counter()
+            if budget.time_limit is not None:
+                time_limit = min(time_limit, budget.time_limit)
+            inference_state.budget = replace(budget, time_limit=time_limit)
+        try:
+            inference_state.reset_recursion_limitations()
+        finally:
+            inference_state.budget = budget
+        name = classes.Name(inference_state, module_context.create_name(tree_name))
+        targets = sorted(
+            set(name.goto(follow_imports=follow_imports)),
+            key=lambda d: (str(d.module_path or ''), d.line or 0, d.column or 0),
+        )
+        if not targets:
+            semantic_map.kinds.append(None)
+            semantic_map.targets.append(-1)
+            semantic_map.types.append(-1)
+            continue
+
+        # Builtins have no path and position, the full name is needed as
+        # well.
+        definitions = [
+            (None if d.module_path is None else str(d.module_path), d.line, d.column,
+             d.full_name)
+            for d in targets
+        ]
+        semantic_map.kinds.append(targets[0].type)
+        semantic_map.targets.append(
+            _index(definition_indexes, semantic_map.definitions, definitions[0])
+        )
+        keys = tuple(definitions)
+        try:
+            type_index = types_by_targets[keys]
+        except KeyError:
+            inferred = [n for d in targets for n in d.infer()]
+            if inferred:
+                type_index = _index(type_name_indexes, semantic_map.type_names,
+                                    _get_type_name(inferred))
+            else:
+                type_index = -1
+            types_by_targets[keys] = type_index
+        semantic_map.types.append(type_index)
+    return semantic_map
@@ -0,0 +1,294 @@
+"""
+Signature help is requested on every ``(`` and ``,`` the user types, which
+means that the same callee is inferred over and over again by different
+:class:`.Script` objects. This module caches a plain description of the
+signatures of a callee (no inference objects) that stays valid across Scripts
+as long as the code of the current module (apart from the arguments that are
+being typed) and the files of the modules that were loaded don't change.
+
+A cached signature only uses the description for the typical signature help
+data (names, params, docstrings). Everything else (e.g. ``infer()``) is
+lazily inferred again with the current Script.
+"""
+import hashlib
+import os
+from collections import namedtuple, OrderedDict
+from inspect import Parameter
+from typing import Any, Tuple
+
+from jedi.api.helpers import infer
+
+SignatureDescription = namedtuple(
+    'SignatureDescription',
+    'name api_type start_pos qualified_names docstring docstring_signature '
+    'annotation_string string params'
+)
+ParamDescription = namedtuple('ParamDescription', 'string_name public_name kind string')
+
+_CACHE_LIMIT = 100
+
+# The least recently used entries are at the beginning.
+_cache: 'OrderedDict[Any, Tuple[Tuple[Any, ...], Tuple[SignatureDescription, ...]]]' \
+    = OrderedDict()
+
+
+def get_signatures(inference_state, context, bracket_leaf, code_lines, position,
+                   wrap_signature):
+    """
+    Returns the signatures for the call that ``bracket_leaf`` opens, the
+    cursor is at ``position``. ``wrap_signature`` is used to create API
+    signatures of the inferred signatures, to be able to describe them.
+    """
+    loaded = []
+
+    def load():
+        if not loaded:
+            values = infer(inference_state, context, bracket_leaf.get_previous_leaf())
+            loaded.append(values.get_signatures())
+        return loaded[0]
+
+    key = _get_key(inference_state, context, bracket_leaf, code_lines, position)
+    if key is not None:
+        try:
+            dependencies, descriptions = _cache[key]
+        except KeyError:
+            pass
+        else:
+            if _dependencies_valid(dependencies):
+                _cache.move_to_end(key)
+                return [DescribedSignature(d, i, load) for i, d in enumerate(descriptions)]
+            del _cache[key]
+
+    signatures = load()
+    if key is not None:
+        dependencies = _get_dependencies(inference_state, key[0])
+        if dependencies is not None:
+            _cache[key] = dependencies, tuple(
+                _describe(signature, wrap_signature(signature))
+                for signature in signatures
+            )
+            if len(_cache) > _CACHE_LIMIT:
+                _cache.popitem(last=False)
+    return signatures
+
+
+def clear_cache():
+    _cache.clear()
+
+
+def _get_callee_nodes(leaf):
+    """
+    Returns the nodes that form the callee, e.g. for ``foo.bar(`` the nodes of
+    ``foo`` and ``.bar``. Similar to ``infer_call_of_leaf``.
+    """
+    parent = leaf.parent
+    if leaf.type == 'name' and parent.type == 'dotted_name':
+        # Decorators like `@foo.bar(`.
+        return [parent]
+    if leaf.type == 'name' and parent.type != 'trailer':
+        return [leaf]
+
+    if parent.type != 'trailer' or leaf is not parent.children[-1]:
+        return None
+
+    power = parent.parent
+    index = power.children.index(parent)
+    if power.type == 'error_node':
+        start = index
+        while True:
+            start -= 1
+            if power.children[start].type != 'trailer':
+                break
+    else:
+        start = 0
+    nodes = power.children[start:index + 1]
+    if nodes[0] == 'await':
+        nodes = nodes[1:]
+    return nodes
+
+
+def _get_key(inference_state, context, bracket_leaf, code_lines, position):
+    module_path = context.get_root_context().py__file__()
+    if module_path is None:
+        return None
+
+    nodes = _get_callee_nodes(bracket_leaf.get_previous_leaf())
+    if not nodes:
+        return None
+    callee_code = nodes[0].get_code(include_prefix=False) \
+        + ''.join(n.get_code() for n in nodes[1:])
+
+    # The callee can be resolved with any code of the current module (e.g.
+    # the return value of a function that returns the callee), so all of it
+    # is part of the key. Only the arguments that are being typed (from the
+    # bracket to the end of the line of the cursor) are excluded, otherwise
+    # the cache would never be used while typing.
+    line, column = bracket_leaf.end_pos
+    hash_ = hashlib.sha256()
+    for code_line in code_lines[:line - 1]:
+        hash_.update(code_line.encode('utf-8', 'surrogatepass'))
+    hash_.update(code_lines[line - 1][:column].encode('utf-8', 'surrogatepass'))
+    hash_.update(b'\0')
+    for code_line in code_lines[position[0]:]:
+        hash_.update(code_line.encode('utf-8', 'surrogatepass'))
+
+    environment = inference_state.environment
+    return (
+        module_path,
+        callee_code,
+        hash_.hexdigest(),
+        environment.executable,
+        tuple(environment.version_info),
+        inference_state.project.path,
+    )
+
+
+def _get_dependencies(inference_state, module_path):
+    """
+    Returns the files of all the modules (apart from the current one, its
+    code is part of the key) that were loaded to infer the signatures with
+    their modification times. The callee might have been resolved through any
+    of them. Returns None if the signatures cannot be cached.
+    """
+    values = list(inference_state.module_cache.iter_values())
+    values += [v for v in inference_state.stub_module_cache.values() if v is not None]
+    dependencies = set()
+    for value in values:
+        path = value.py__file__()
+        if path is None or path == module_path:
+            continue
+        try:
+            dependencies.add((path, os.path.getmtime(path)))
+        except OSError:
+            return None
+    return tuple(dependencies)
+
+
+def _dependencies_valid(dependencies):
+    for path, mtime in dependencies:
+        try:
+            if os.path.getmtime(path) != mtime:
+                return False
+        except OSError:
+            return False
+    return True
+
+
+def _describe(signature, api_signature):
+    return SignatureDescription(
+        name=api_signature.name,
+        api_type=api_signature.type,
+        start_pos=signature.name.start_pos,
+        qualified_names=signature.name.get_qualified_names(include_module_names=True),
+        docstring=api_signature.docstring(raw=True),
+        docstring_signature=api_signature._get_docstring_signature(),
+        annotation_string=signature.annotation_string,
+        string=signature.to_string(),
+        params=tuple(
+            ParamDescription(
+                string_name=param_name.string_name,
+                public_name=param_name.get_public_name(),
+                kind=param_name.get_kind().name,
+                string=param_name.to_string(),
+            )
+            for param_name in signature.get_param_names(resolve_stars=True)
+        ),
+    )
+
+
+class _Described:
+    """
+    Uses a description for the most important attributes and falls back to
+    inferring the actual object for everything else.
+    """
+    def __getattr__(self, name):
+        return getattr(self._get_actual(), name)
+
+
+class DescribedSignature(_Described):
+    def __init__(self, description, index, load_signatures):
+        self._description = description
+        self._index = index
+        self._load_signatures = load_signatures
+        self.name = DescribedName(self)
+
+    def _get_actual(self):
+        return self._load_signatures()[self._index]
+
+    @property
+    def annotation_string(self):
+        return self._description.annotation_string
+
+    def get_param_names(self, resolve_stars=False):
+        if not resolve_stars:
+            return self._get_actual().get_param_names()
+        return [DescribedParamName(self, i, d)
+                for i, d in enumerate(self._description.params)]
+
+    def to_string(self):
+        return self._description.string
+
+    def __repr__(self):
+        return '<%s: %s>' % (self.__class__.__name__, self._description.string)
+
+
+class DescribedName(_Described):
+    tree_name = None
+    is_value_name = True
+
+    def __init__(self, signature):
+        self._signature = signature
+        description = signature._description
+        self.string_name = description.name
+        self.start_pos = description.start_pos
+        self.api_type = description.api_type
+        self.docstring_signature = description.docstring_signature
+
+    def _get_actual(self):
+        return self._signature._get_actual().name
+
+    def get_public_name(self):
+        return self.string_name
+
+    def get_qualified_names(self, include_module_names=False):
+        names = self._signature._description.qualified_names
+        if names is None or include_module_names:
+            return names
+        return self._get_actual().get_qualified_names()
+
+    def py__doc__(self):
+        return self._signature._description.docstring
+
+    def __repr__(self):
+        return '<%s: string_name=%s>' % (self.__class__.__name__, self.string_name)
+
+
+class DescribedParamName(_Described):
+    tree_name = None
+    is_value_name = True
+    api_type = 'param'
+
+    def __init__(self, signature, index, description):
+        self._signature = signature
+        self._index = index
+        self._description = description
+        self.string_name = description.string_name
+
+    def _get_actual(self):
+        actual_signature = self._signature._get_actual()
+        return actual_signature.get_param_names(resolve_stars=True)[self._index]
+
+    def get_public_name(self):
+        return self._description.public_name
+
+    def get_kind(self):
+        return getattr(Parameter, self._description.kind)
+
+    def to_string(self):
+        return self._description.string
+
+    def get_qualified_names(self, include_module_names=False):
+        return None
+
+    def __repr__(self):
+        return '<%s: string_name=%s>' % (self.__class__.__name__, self.string_name)
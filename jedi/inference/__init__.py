@@ -69,6 +69,7 @@ from jedi.file_io import FileIO
 
 from jedi import debug
 from jedi import settings
+from jedi import stats
 from jedi.inference import imports
 from jedi.inference import recursion
 from jedi.inference.cache import inference_state_function_cache
@@ -86,7 +87,7 @@ from jedi.plugins import plugin_manager
 class InferenceState:
     analysis_modules: "list[Any]"
 
-    def __init__(self, project, environment=None, script_path=None):
+    def __init__(self, project, environment=None, script_path=None, budget=None):
         if environment is None:
             environment = project.get_environment()
         self.environment = environment
@@ -102,13 +103,18 @@ class InferenceState:
         self.inferred_element_counts = {}
         self.mixed_cache = {}  # see `inference.compiled.mixed._create()`
         self.analysis = []
+        # Folders that were searched for modules that could not be found.
+        self.missing_import_folders = set()
         self.dynamic_params_depth = 0
+        self.dynamic_array_search_depth = 0
+        self.is_searching_other_modules_for_additions = False
         self.do_dynamic_params_search = settings.dynamic_params
         self.is_analysis = False
         self.project = project
         self.access_cache = {}
         self.allow_unsafe_executions = False
         self.flow_analysis_enabled = True
+        self.budget = recursion.get_budget(budget)
 
         self.reset_recursion_limitations()
 
@@ -156,6 +162,8 @@ class InferenceState:
     def reset_recursion_limitations(self):
         self.recursion_detector = recursion.RecursionDetector()
         self.execution_recursion_detector = recursion.ExecutionRecursionDetector(self)
+        # See settings.dynamic_additions_time_limit
+        self.dynamic_additions_time = 0.0
 
     def get_sys_path(self, **kwargs):
         """Convenience function"""
@@ -211,7 +219,9 @@ class InferenceState:
             code = code[:settings._cropped_file_size]
 
         grammar = self.latest_grammar if use_latest_grammar else self.grammar
-        return grammar.parse(code=code, path=path, file_io=file_io, **kwargs), code
+        with stats.timer('parse'):
+            module = grammar.parse(code=code, path=path, file_io=file_io, **kwargs)
+        return module, code
 
     def parse(self, *args, **kwargs):
         return self.parse_and_get_code(*args, **kwargs)[0]
@@ -6,6 +6,7 @@
 from functools import wraps
 
 from jedi import debug
+from jedi import stats
 
 _NO_DEFAULT = object()
 _RECURSION_SENTINEL = object()
@@ -36,9 +37,14 @@ def _memoize_default(default=_NO_DEFAULT, inference_state_is_first_arg=False,
                 cache[function] = memo = {}
 
             key = (obj, args, frozenset(kwargs.items()))
+            current_stats = stats.get_current()
             if key in memo:
+                if current_stats is not None:
+                    current_stats.memoize_lookup(function, hit=True)
                 return memo[key]
             else:
+                if current_stats is not None:
+                    current_stats.memoize_lookup(function, hit=False)
                 if default is not _NO_DEFAULT:
                     memo[key] = default
                 rv = function(obj, *args, **kwargs)
@@ -97,6 +103,9 @@ def inference_state_method_generator_cache():
 
             key = (obj, args, frozenset(kwargs.items()))
 
+            current_stats = stats.get_current()
+            if current_stats is not None:
+                current_stats.memoize_lookup(function, hit=key in memo)
             if key in memo:
                 actual_generator, cached_lst = memo[key]
             else:
@@ -0,0 +1,297 @@
+"""
+An index of the call sites in a project. It maps the names of called
+functions and classes to the files (and positions) where they are called,
+which is used by :mod:`jedi.inference.dynamic_params` to find the arguments
+of a function without opening every file in the project. It also contains the
+names of objects that are modified with ``append``, ``update``,
+``obj[key] = value``, etc., see :mod:`jedi.inference.value.dynamic_arrays`.
+
+The index is cheap to build, because files are not parsed, calls are just
+found with a regular expression. It is persisted in
+:data:`jedi.settings.cache_directory` and files are only scanned again if
+their modification time or size changes. Files are only scanned for a limited
+time per API call, until all files are scanned the old search through the
+files of the project is used.
+"""
+import hashlib
+import json
+import os
+import re
+import time
+from bisect import bisect_right
+
+from parso import python_bytes_to_unicode
+
+from jedi import settings
+from jedi import stats
+from jedi import debug
+from jedi.file_io import FileIO, FolderIO
+from jedi.inference.cache import inference_state_function_cache
+from jedi.inference.imports import load_module_from_path
+from jedi.inference.references import recurse_find_python_files, \
+    get_module_contexts_containing_name, _PARSED_FILE_LIMIT
+
+_INDEX_SERIALIZER_VERSION = 2
+_SCAN_TIME_LIMIT = 0.1
+"""
+Files are scanned for at most this many seconds per API call. The rest of the
+files are scanned in the next API calls.
+"""
+_REFRESH_INTERVAL = 10
+"""
+The project is searched for changed files at most every this many seconds.
+"""
+# Definitions like `def foo(` are matched without a group and skipped.
+_CALL_REGEX = re.compile(r'(?:\b(?:def|class)\s+\w+|\b([^\W\d]\w*))\s*\(')
+_MUTATION_REGEX = re.compile(
+    r'\b([^\W\d]\w*)\s*(?:\.\s*(?:append|extend|insert|add|update)\s*\(|\[.*\]\s*=(?!=))'
+)
+
+_indexes = {}
+
+
+def _find(regex, code):
+    line_offsets = [0] + [m.end() for m in re.finditer('\n', code)]
+    result = {}
+    for match in regex.finditer(code):
+        if match.group(1) is None:
+            continue
+        start = match.start(1)
+        line = bisect_right(line_offsets, start)
+        result.setdefault(match.group(1), []).append(
+            (line, start - line_offsets[line - 1])
+        )
+    return result
+
+
+def find_calls(code):
+    """
+    Returns a dict of called names to a list of ``(line, column)`` positions.
+
+    >>> find_calls('def foo(a):\\n    return bar(a) + bar (1)')
+    {'bar': [(2, 11), (2, 20)]}
+    """
+    return _find(_CALL_REGEX, code)
+
+
+def find_mutations(code):
+    """
+    Returns a dict of names of objects that are modified to a list of
+    ``(line, column)`` positions.
+
+    >>> find_mutations('a.append(1)\\nx.b[1] = 3\\nc[1] == 2\\nd = e[1]')
+    {'a': [(1, 0)], 'b': [(2, 2)]}
+    """
+    return _find(_MUTATION_REGEX, code)
+
+
+class CallSiteIndex:
+    def __init__(self, project_path):
+        self.project_path = str(project_path)
+        # path -> [mtime, size, calls, mutations], calls and mutations are
+        # dicts of {name: [(line, column), ...]}
+        self._files = {}
+        self._paths_by_name = {}
+        self._loaded = False
+        # (file_io, stat) of the files that need to be scanned.
+        self._pending = []
+        self._last_walk = None
+        self._changed = False
+        self.complete = False
+        """False if not all the files of the project are scanned yet."""
+
+    def _get_cache_path(self):
+        return os.path.join(
+            settings.cache_directory,
+            'call-sites',
+            hashlib.sha256(self.project_path.encode('utf-8')).hexdigest() + '.json',
+        )
+
+    def _load(self):
+        try:
+            with open(self._get_cache_path()) as f:
+                version, project_path, files = json.load(f)
+        except (OSError, ValueError):
+            return
+        if version == _INDEX_SERIALIZER_VERSION and project_path == self.project_path:
+            self._files = files
+
+    def _save(self):
+        path = self._get_cache_path()
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = '%s.%s.tmp' % (path, os.getpid())
+            with open(tmp_path, 'w') as f:
+                json.dump((_INDEX_SERIALIZER_VERSION, self.project_path, self._files), f)
+            os.replace(tmp_path, path)
+        except OSError:
+            # The cache directory might not be writable, the index is just
+            # rebuilt in the next process.
+            pass
+
+    def refresh(self, file_ios, time_limit=None):
+        """
+        Scans the files that changed since the last refresh for at most
+        ``time_limit`` seconds. ``file_ios`` (the files of the project) are
+        only searched for changes every :data:`_REFRESH_INTERVAL` seconds.
+        """
+        if not self._loaded:
+            self._load()
+            self._loaded = True
+
+        if not self._pending:
+            if self._last_walk is not None \
+                    and time.time() - self._last_walk < _REFRESH_INTERVAL:
+                return
+            self._walk(file_ios)
+        self._scan(time_limit)
+
+    def _walk(self, file_ios):
+        self._last_walk = time.time()
+        files = {}
+        for file_io in file_ios:
+            path = str(file_io.path)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+
+            entry = self._files.get(path)
+            if entry is None or entry[:2] != [stat.st_mtime, stat.st_size]:
+                self._pending.append((file_io, stat))
+            if entry is not None:
+                # Outdated entries are used until the file is scanned again.
+                files[path] = entry
+
+        if len(files) != len(self._files):
+            # Files were removed.
+            self._files = files
+            self._paths_by_name = {}
+            self._changed = True
+
+    def _scan(self, time_limit):
+        start = time.perf_counter()
+        while self._pending:
+            if time_limit is not None and time.perf_counter() - start >= time_limit:
+                debug.dbg('Call site index: %s files left to scan', len(self._pending))
+                break
+            file_io, stat = self._pending.pop()
+            try:
+                code = file_io.read()
+            except OSError:
+                continue
+            code = python_bytes_to_unicode(code, errors='replace')
+            self._files[str(file_io.path)] = [
+                stat.st_mtime, stat.st_size, find_calls(code), find_mutations(code)
+            ]
+            self._paths_by_name = {}
+            self._changed = True
+            stats.increment('call_site_index_scanned_files')
+
+        self.complete = not self._pending
+        # Saving is not cheap for big projects, so it's only done once
+        # everything is scanned.
+        if self.complete and self._changed:
+            self._save()
+            self._changed = False
+
+    def _get_paths(self, kind, name):
+        try:
+            paths_by_name = self._paths_by_name[kind]
+        except KeyError:
+            paths_by_name = self._paths_by_name[kind] = {}
+            for path, entry in self._files.items():
+                for n in entry[kind]:
+                    paths_by_name.setdefault(n, []).append(path)
+        return paths_by_name.get(name, [])
+
+    def get_paths(self, name):
+        """
+        Returns the paths of the files that call ``name``.
+        """
+        return self._get_paths(2, name)
+
+    def get_mutation_paths(self, name):
+        """
+        Returns the paths of the files that modify an object called ``name``.
+        """
+        return self._get_paths(3, name)
+
+    def remove(self, path):
+        """
+        Removes a file that doesn't exist anymore before the next search for
+        changes.
+        """
+        if self._files.pop(path, None) is not None:
+            self._paths_by_name = {}
+            self._changed = True
+
+
+@inference_state_function_cache()
+def get_call_site_index(inference_state):
+    """
+    Returns the refreshed index of the current project. It is refreshed once
+    per inference state, i.e. usually once per API call.
+    """
+    project_path = inference_state.project.path
+    try:
+        index = _indexes[project_path]
+    except KeyError:
+        index = _indexes[project_path] = CallSiteIndex(project_path)
+    index.refresh(recurse_find_python_files(FolderIO(str(project_path))), _SCAN_TIME_LIMIT)
+    return index
+
+
+def get_module_contexts_with_calls(inference_state, module_contexts, name,
+                                   limit_reduction=1):
+    """
+    Like :func:`jedi.inference.references.get_module_contexts_containing_name`,
+    but only yields modules of the project that call ``name``. The modules
+    that are closest to the given modules are yielded first.
+
+    :param limit_reduction: Divides the limit on parsing files by this factor.
+    """
+    # Very short names are not searched in other modules to avoid lots of
+    # file lookups, get_module_contexts_containing_name handles that. Until
+    # the index is complete the files are searched like without an index.
+    if len(name) <= 2 or not get_call_site_index(inference_state).complete:
+        stats.increment('call_site_index_not_used')
+        yield from get_module_contexts_containing_name(
+            inference_state, module_contexts, name, limit_reduction=limit_reduction
+        )
+        return
+
+    for module_context in module_contexts:
+        if module_context.is_compiled():
+            continue
+        yield module_context
+
+    except_paths = {str(m.py__file__()) for m in module_contexts
+                    if m.py__file__() is not None}
+    folders = {os.path.dirname(p) for p in except_paths}
+    index = get_call_site_index(inference_state)
+    paths = index.get_paths(name)
+    parse_limit = _PARSED_FILE_LIMIT / limit_reduction
+    parsed_file_count = 0
+    for path in sorted(paths, key=lambda p: (os.path.dirname(p) not in folders, p)):
+        if path in except_paths:
+            continue
+        if parsed_file_count >= parse_limit:
+            debug.dbg('Hit limit of parsed files: %s', parse_limit)
+            break
+        try:
+            m = load_module_from_path(inference_state, FileIO(path))
+        except OSError:
+            # The file was removed after the project was searched for
+            # changes.
+            index.remove(path)
+            continue
+        parsed_file_count += 1
+        stats.increment('files_parsed')
+        if m.is_compiled():
+            continue
+        yield m.as_context()
+
+
+def clear_cache():
+    _indexes.clear()
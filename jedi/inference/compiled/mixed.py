@@ -3,6 +3,8 @@ Used only for REPL Completion.
 """
 
 import inspect
+import os
+import weakref
 from pathlib import Path
 
 from jedi.parser_utils import get_cached_code_lines
@@ -22,6 +24,9 @@ from jedi.inference.context import CompiledContext, CompiledModuleContext, \
     TreeContextMixin
 
 _sentinel = object()
+# id(python_object) -> (weak reference, location, modification time), see
+# _get_definition_location
+_definition_locations = {}
 
 
 class MixedObject(ValueWrapper):
@@ -186,6 +191,68 @@ def _find_syntax_node_name(inference_state, python_object):
     original_object = python_object
     try:
         python_object = _get_object_to_check(python_object)
+    except TypeError:
+        return None
+
+    location = _get_definition_location(inference_state, python_object)
+    if location is None:
+        return None
+    path, position = location
+
+    file_io = FileIO(path)
+    module_node = _load_module(inference_state, path)
+    code_lines = get_cached_code_lines(inference_state.grammar, path)
+    if position is None:
+        return module_node, module_node, file_io, code_lines
+
+    tree_node = module_node.get_leaf_for_position(position).parent
+    if tree_node.type == 'funcdef' and get_api_type(original_object) == 'instance':
+        # If an instance is given and we're landing on a function (e.g.
+        # partial in 3.5), something is completely wrong and we should not
+        # return that.
+        return None
+    return module_node, tree_node, file_io, code_lines
+
+
+def _get_mtime(path):
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _get_definition_location(inference_state, python_object):
+    """
+    Returns the path and the position of the name of the definition of an
+    object (the position is None for modules) or None.
+
+    Searching for definitions is cached per process (not per inference state),
+    because REPLs create an ``Interpreter`` for every completion. An entry is
+    valid while the object is alive and the file was not modified.
+    """
+    key = id(python_object)
+    try:
+        ref, location, mtime = _definition_locations[key]
+    except KeyError:
+        pass
+    else:
+        if ref() is python_object \
+                and (location is None or _get_mtime(location[0]) == mtime):
+            return location
+
+    location = _search_definition_location(inference_state, python_object)
+    try:
+        ref = weakref.ref(python_object, lambda r: _definition_locations.pop(key, None))
+    except TypeError:
+        # Not all objects can be weakly referenced, just don't cache them.
+        return location
+    mtime = None if location is None else _get_mtime(location[0])
+    _definition_locations[key] = ref, location, mtime
+    return location
+
+
+def _search_definition_location(inference_state, python_object):
+    try:
         path = inspect.getsourcefile(python_object)
     except (OSError, TypeError):
         # The type might not be known (e.g. class_with_dict.__weakref__)
@@ -202,15 +269,11 @@ def _find_syntax_node_name(inference_state, python_object):
         #     syntax is incorrect: '<string>'
         return None
 
-    file_io = FileIO(path)
-    module_node = _load_module(inference_state, path)
-
     if inspect.ismodule(python_object):
         # We don't need to check names for modules, because there's not really
         # a way to write a module in a module in Python (and also __name__ can
         # be something like ``email.utils``).
-        code_lines = get_cached_code_lines(inference_state.grammar, path)
-        return module_node, module_node, file_io, code_lines
+        return path, None
 
     try:
         name_str = python_object.__name__
@@ -221,6 +284,7 @@ def _find_syntax_node_name(inference_state, python_object):
     if name_str == '<lambda>':
         return None  # It's too hard to find lambdas.
 
+    module_node = _load_module(inference_state, path)
     # Doesn't always work (e.g. os.stat_result)
     names = module_node.get_used_names().get(name_str, [])
     # Only functions and classes are relevant. If a name e.g. points to an
@@ -249,19 +313,12 @@ def _find_syntax_node_name(inference_state, python_object):
         if line_names:
             names = line_names
 
-    code_lines = get_cached_code_lines(inference_state.grammar, path)
     # It's really hard to actually get the right definition, here as a last
     # resort we just return the last one. This chance might lead to odd
     # completions at some points but will lead to mostly correct type
     # inference, because people tend to define a public name in a module only
     # once.
-    tree_node = names[-1].parent
-    if tree_node.type == 'funcdef' and get_api_type(original_object) == 'instance':
-        # If an instance is given and we're landing on a function (e.g.
-        # partial in 3.5), something is completely wrong and we should not
-        # return that.
-        return None
-    return module_node, tree_node, file_io, code_lines
+    return path, names[-1].start_pos
 
 
 @inference_state_function_cache()
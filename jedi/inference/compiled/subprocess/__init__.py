@@ -37,6 +37,7 @@ from typing import Dict, TYPE_CHECKING, Any
 
 from jedi._compatibility import pickle_dump, pickle_load
 from jedi import debug
+from jedi import stats
 from jedi.cache import memoize_method
 from jedi.inference.compiled.subprocess import functions
 from jedi.inference.compiled.access import DirectObjectAccess, AccessPath, \
@@ -223,6 +224,32 @@ class InferenceStateSubprocess(_InferenceStateProcess):
             self._compiled_subprocess.delete_inference_state(self._inference_state_id)
 
 
+class _CountingFile:
+    """
+    Counts the bytes that are written to or read from a pipe, see
+    :mod:`jedi.stats`.
+    """
+    def __init__(self, file, counter_name):
+        self._file = file
+        self._counter_name = counter_name
+
+    def _count(self, data):
+        stats.increment(self._counter_name, len(data))
+        return data
+
+    def write(self, data):
+        return self._file.write(self._count(data))
+
+    def flush(self):
+        self._file.flush()
+
+    def read(self, *args):
+        return self._count(self._file.read(*args))
+
+    def readline(self, *args):
+        return self._count(self._file.readline(*args))
+
+
 class CompiledSubprocess:
     """
     A subprocess which runs inference within a target environment.
@@ -304,20 +331,39 @@ class CompiledSubprocess:
         self.is_crashed = True
         self._cleanup_callable()
 
+    def _forget(self):
+        """
+        Stops using the process without killing it, because it belongs to
+        another (the parent) process.
+        """
+        self.is_crashed = True
+        if isinstance(self._cleanup_callable, weakref.finalize):
+            self._cleanup_callable.detach()
+
     def _send(self, inference_state_id, function, args=(), kwargs={}):
         if self.is_crashed:
             raise InternalError("The subprocess %s has crashed." % self._executable)
 
+        with stats.timer('subprocess'):
+            return self._send_and_receive(inference_state_id, function, args, kwargs)
+
+    def _send_and_receive(self, inference_state_id, function, args, kwargs):
+        stdin = self._get_process().stdin
+        stdout = self._get_process().stdout
+        if stats.get_current() is not None:
+            stdin = _CountingFile(stdin, 'subprocess_bytes_sent')
+            stdout = _CountingFile(stdout, 'subprocess_bytes_received')
+
         data = inference_state_id, function, args, kwargs
         try:
-            pickle_dump(data, self._get_process().stdin, PICKLE_PROTOCOL)
+            pickle_dump(data, stdin, PICKLE_PROTOCOL)
         except BrokenPipeError:
             self._kill()
             raise InternalError("The subprocess %s was killed. Maybe out of memory?"
                                 % self._executable)
 
         try:
-            is_exception, traceback, result = pickle_load(self._get_process().stdout)
+            is_exception, traceback, result = pickle_load(stdout)
         except EOFError as eof_error:
             try:
                 stderr = self._get_process().stderr.read().decode('utf-8', 'replace')
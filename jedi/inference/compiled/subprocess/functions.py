@@ -49,6 +49,41 @@ def get_builtin_module_names(inference_state):
     return sys.builtin_module_names
 
 
+def get_import_system_info(inference_state):
+    """
+    Returns the information that is needed to find modules on the file system
+    without this process, see :func:`jedi.inference.imports.import_module`:
+    The builtin module names, the extension module suffixes and the names of
+    modules that are found by other finders. The latter is None if there are
+    unknown finders or path hooks.
+    """
+    other_names = set()
+    for finder in sys.meta_path:
+        if finder in (importlib.machinery.BuiltinImporter,
+                      importlib.machinery.FrozenImporter,
+                      importlib.machinery.PathFinder):
+            continue
+        if type(finder).__name__ == 'DistutilsMetaFinder':
+            # Installed by setuptools, it only finds a few modules.
+            other_names.update(
+                n[len('spec_for_'):] for n in dir(finder) if n.startswith('spec_for_')
+            )
+            continue
+        other_names = None
+        break
+
+    for hook in sys.path_hooks:
+        if hook is not zipimporter \
+                and not getattr(hook, '__qualname__', '').startswith('FileFinder.'):
+            other_names = None
+
+    return (
+        sys.builtin_module_names,
+        importlib.machinery.EXTENSION_SUFFIXES,
+        None if other_names is None else sorted(other_names),
+    )
+
+
 def _test_raise_error(inference_state, exception_type):
     """
     Raise an error to simulate certain problems for unit tests.
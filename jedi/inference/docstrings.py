@@ -17,6 +17,7 @@ annotations.
 
 import re
 import warnings
+from functools import lru_cache
 
 from parso import parse, ParserSyntaxError
 
@@ -28,10 +29,14 @@ from jedi.inference.lazy_value import LazyKnownValues
 
 
 DOCSTRING_PARAM_PATTERNS = [
-    r'\s*:type\s+%s:\s*([^\n]+)',  # Sphinx
-    r'\s*:param\s+(\w+)\s+%s:[^\n]*',  # Sphinx param with type
-    r'\s*@type\s+%s:\s*([^\n]+)',  # Epydoc
+    re.compile(r'\s*:type\s+(\w+):\s*([^\n]+)'),  # Sphinx
+    re.compile(r'\s*:param\s+(\w+)\s+(\w+):[^\n]*'),  # Sphinx param with type
+    re.compile(r'\s*@type\s+(\w+):\s*([^\n]+)'),  # Epydoc
 ]
+"""
+The groups are the param name and its type, except for Sphinx params with
+type, where the type comes first.
+"""
 
 DOCSTRING_RETURN_PATTERNS = [
     re.compile(r'\s*:rtype:\s*([^\n]+)', re.M),  # Sphinx
@@ -40,6 +45,7 @@ DOCSTRING_RETURN_PATTERNS = [
 
 REST_ROLE_PATTERN = re.compile(r':[^`]+:`([^`]+)`')
 
+_CACHE_LIMIT = 10000
 
 _numpy_doc_string_cache = None
 
@@ -53,47 +59,75 @@ def _get_numpy_doc_string_cls():
     return _numpy_doc_string_cache
 
 
-def _search_param_in_numpydocstr(docstr, param_str):
-    """Search `docstr` (in numpydoc format) for type(-s) of `param_str`."""
-    with warnings.catch_warnings():
-        warnings.simplefilter("ignore")
-        try:
-            # This is a non-public API. If it ever changes we should be
-            # prepared and return gracefully.
-            params = _get_numpy_doc_string_cls()(docstr)._parsed_data['Parameters']
-        except Exception:
-            return []
-    for p_name, p_type, p_descr in params:
-        if p_name == param_str:
-            m = re.match(r'([^,]+(,[^,]+)*?)(,[ ]*optional)?$', p_type)
-            if m:
-                p_type = m.group(1)
-            return list(_expand_typestr(p_type))
-    return []
-
-
-def _search_return_in_numpydocstr(docstr):
+def _parse_numpydocstr(docstr):
     """
-    Search `docstr` (in numpydoc format) for type(-s) of function returns.
+    Returns the types of the params and the returns in `docstr` (in numpydoc
+    format).
     """
     with warnings.catch_warnings():
         warnings.simplefilter("ignore")
         try:
             doc = _get_numpy_doc_string_cls()(docstr)
         except Exception:
-            return
+            return {}, []
+
+    params = {}
     try:
         # This is a non-public API. If it ever changes we should be
         # prepared and return gracefully.
+        parsed_params = doc._parsed_data['Parameters']
+    except Exception:
+        parsed_params = []
+    for p_name, p_type, p_descr in parsed_params:
+        if p_name in params:
+            continue
+        m = re.match(r'([^,]+(,[^,]+)*?)(,[ ]*optional)?$', p_type)
+        if m:
+            p_type = m.group(1)
+        params[p_name] = list(_expand_typestr(p_type))
+
+    try:
         returns = doc._parsed_data['Returns']
         returns += doc._parsed_data['Yields']
     except Exception:
-        return
+        return params, []
+    return_types = []
     for r_name, r_type, r_descr in returns:
         # Return names are optional and if so the type is in the name
         if not r_type:
             r_type = r_name
-        yield from _expand_typestr(r_type)
+        return_types += _expand_typestr(r_type)
+    return params, return_types
+
+
+@lru_cache(maxsize=_CACHE_LIMIT)
+def _parse_docstring(docstr):
+    """
+    Returns the types of all params and the returns in `docstr` (in Sphinx,
+    Epydoc or numpydoc format). Docstrings are cached, because they are
+    usually searched for every param of a function.
+
+    >>> _parse_docstring(':type a: int\\n:param str b: foo\\n:rtype: float')
+    ({'b': ['str'], 'a': ['int']}, ['float'])
+    """
+    params, numpy_return_types = _parse_numpydocstr(docstr)
+    # Patterns that come first win.
+    for pattern in reversed(DOCSTRING_PARAM_PATTERNS):
+        found = {}
+        for match in pattern.finditer(docstr):
+            name, type_str = match.group(1, 2)
+            if pattern is DOCSTRING_PARAM_PATTERNS[1]:
+                type_str, name = name, type_str
+            found.setdefault(name, [_strip_rst_role(type_str)])
+        params.update(found)
+
+    return_types = []
+    for pattern in DOCSTRING_RETURN_PATTERNS:
+        match = pattern.search(docstr)
+        if match:
+            return_types.append(_strip_rst_role(match.group(1)))
+
+    return params, return_types + numpy_return_types
 
 
 def _expand_typestr(type_str):
@@ -147,14 +181,12 @@ def _search_param_in_docstr(docstr, param_str):
 
     """
     # look at #40 to see definitions of those params
-    patterns = [re.compile(p % re.escape(param_str))
-                for p in DOCSTRING_PARAM_PATTERNS]
-    for pattern in patterns:
-        match = pattern.search(docstr)
-        if match:
-            return [_strip_rst_role(match.group(1))]
+    return list(_parse_docstring(docstr)[0].get(param_str, []))
+
 
-    return _search_param_in_numpydocstr(docstr, param_str)
+def _search_return_in_docstr(docstr):
+    """Search `docstr` for type(-s) of function returns."""
+    return list(_parse_docstring(docstr)[1])
 
 
 def _strip_rst_role(type_str):
@@ -189,20 +221,10 @@ def _infer_for_statement_string(module_context, string):
     imports = "\n".join(f"import {p}" for p in potential_imports)
     string = f'{imports}\n{string}'
 
-    debug.dbg('Parse docstring code %s', string, color='BLUE')
-    grammar = module_context.inference_state.grammar
-    try:
-        module = grammar.parse(string, error_recovery=False)
-    except ParserSyntaxError:
-        return []
-    try:
-        # It's not the last item, because that's an end marker.
-        stmt = module.children[-2]
-    except (AttributeError, IndexError):
-        return []
-
-    if stmt.type not in ('name', 'atom', 'atom_expr'):
+    stmt = _parse_type_string(module_context.inference_state.grammar, string)
+    if stmt is None:
         return []
+    module = stmt.get_root_node()
 
     # Here we basically use a fake module that also uses the filters in
     # the actual module.
@@ -216,6 +238,32 @@ def _infer_for_statement_string(module_context, string):
     return list(_execute_types_in_stmt(m.as_context(), stmt))
 
 
+@lru_cache(maxsize=_CACHE_LIMIT)
+def _parse_type_string(grammar, string):
+    """
+    Returns the statement of a type string (with its imports) or None. The
+    trees are cached, because the same types are used in a lot of docstrings.
+    They are never modified, so it's fine to share them.
+    """
+    debug.dbg('Parse docstring code %s', string, color='BLUE')
+    stmt = None
+    try:
+        module = grammar.parse(string, error_recovery=False)
+    except ParserSyntaxError:
+        pass
+    else:
+        try:
+            # It's not the last item, because that's an end marker.
+            stmt = module.children[-2]
+        except (AttributeError, IndexError):
+            pass
+        else:
+            if stmt.type not in ('name', 'atom', 'atom_expr'):
+                stmt = None
+
+    return stmt
+
+
 def _execute_types_in_stmt(module_context, stmt):
     """
     Executing all types or general elements that we find in a statement. This
@@ -274,13 +322,5 @@ def infer_param(function_value, param):
 @inference_state_method_cache()
 @iterator_to_value_set
 def infer_return_types(function_value):
-    def search_return_in_docstr(code):
-        for p in DOCSTRING_RETURN_PATTERNS:
-            match = p.search(code)
-            if match:
-                yield _strip_rst_role(match.group(1))
-        # Check for numpy style return hint
-        yield from _search_return_in_numpydocstr(code)
-
-    for type_str in search_return_in_docstr(function_value.py__doc__()):
+    for type_str in _search_return_in_docstr(function_value.py__doc__()):
         yield from _infer_for_statement_string(function_value.get_root_context(), type_str)
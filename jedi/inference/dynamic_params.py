@@ -13,7 +13,8 @@ that's what a human would expect.
 It works as follows:
 
 - |Jedi| sees a param
-- search for function calls named ``foo``
+- search for function calls named ``foo`` (other modules are found with the
+  call site index in :mod:`jedi.inference.call_sites`)
 - execute these calls and check the input.
 """
 
@@ -27,7 +28,7 @@ from jedi.inference.helpers import is_stdlib_path
 from jedi.inference.utils import to_list
 from jedi.inference.value import instance
 from jedi.inference.base_value import ValueSet, NO_VALUES
-from jedi.inference.references import get_module_contexts_containing_name
+from jedi.inference.call_sites import get_module_contexts_with_calls
 from jedi.inference import recursion
 
 
@@ -116,8 +117,11 @@ def _search_function_arguments(module_context, funcdef, string_name):
     i = 0
     inference_state = module_context.inference_state
 
-    if settings.dynamic_params_for_other_modules:
-        module_contexts = get_module_contexts_containing_name(
+    if settings.dynamic_params_for_other_modules \
+            and not inference_state.dynamic_array_search_depth:
+        # Only modules that actually call the function are loaded, see
+        # jedi.inference.call_sites.
+        module_contexts = get_module_contexts_with_calls(
             inference_state, [module_context], string_name,
             # Limit the amounts of files to be opened massively.
             limit_reduction=5,
@@ -15,14 +15,16 @@ from parso.python import tree
 
 from jedi import debug
 from jedi import settings
-from jedi.file_io import FolderIO
+from jedi import stats
+from jedi.file_io import FileIO, FolderIO
 from jedi.parser_utils import get_cached_code_lines
 from jedi.inference import sys_path
 from jedi.inference import helpers
 from jedi.inference import compiled
 from jedi.inference import analysis
 from jedi.inference.utils import unite
-from jedi.inference.cache import inference_state_method_cache
+from jedi.inference.cache import inference_state_method_cache, \
+    inference_state_function_cache
 from jedi.inference.names import ImportName, SubModuleName
 from jedi.inference.base_value import ValueSet, NO_VALUES
 from jedi.inference.gradual.typeshed import import_module_decorator, \
@@ -42,6 +44,10 @@ class ModuleCache:
     def get(self, string_names):
         return self._name_cache.get(string_names)
 
+    def iter_values(self):
+        for value_set in self._name_cache.values():
+            yield from value_set
+
 
 # This memoization is needed, because otherwise we will infinitely loop on
 # certain imports.
@@ -372,7 +378,7 @@ def import_module_by_names(inference_state, import_names, sys_path=None,
     )
     base = [None]
     for i, name in enumerate(import_names):
-        base = value_set = ValueSet.from_sets([
+        value_set = ValueSet.from_sets([
             import_module(
                 inference_state,
                 str_import_names[:i+1],
@@ -382,12 +388,18 @@ def import_module_by_names(inference_state, import_names, sys_path=None,
             ) for parent_module_value in base
         ])
         if not value_set:
+            if i == 0:
+                folders = sys_path
+            else:
+                folders = [p for v in base for p in v.py__path__() or []]
+            inference_state.missing_import_folders.update(map(str, folders))
             message = 'No module named ' + '.'.join(str_import_names)
             if module_context is not None:
                 _add_error(module_context, name, message)
             else:
                 debug.warning(message)
             return NO_VALUES
+        base = value_set
     return value_set
 
 
@@ -397,6 +409,7 @@ def import_module(inference_state, import_names, parent_module_value, sys_path):
     """
     This method is very similar to importlib's `_gcd_import`.
     """
+    stats.increment('imports')
     if import_names[0] in settings.auto_import_modules:
         module = _load_builtin_module(inference_state, import_names, sys_path)
         if module is None:
@@ -405,14 +418,18 @@ def import_module(inference_state, import_names, parent_module_value, sys_path):
 
     module_name = '.'.join(import_names)
     if parent_module_value is None:
-        # Override the sys.path. It works only good that way.
-        # Injecting the path directly into `find_module` did not work.
-        file_io_or_ns, is_pkg = inference_state.compiled_subprocess.get_module_info(
-            string=import_names[-1],
-            full_name=module_name,
-            sys_path=sys_path,
-            is_global_search=True,
-        )
+        result = _find_module_in_folders(
+            inference_state, import_names, sys_path, is_global_search=True)
+        if result is None:
+            # Override the sys.path. It works only good that way.
+            # Injecting the path directly into `find_module` did not work.
+            result = inference_state.compiled_subprocess.get_module_info(
+                string=import_names[-1],
+                full_name=module_name,
+                sys_path=sys_path,
+                is_global_search=True,
+            )
+        file_io_or_ns, is_pkg = result
         if is_pkg is None:
             return NO_VALUES
     else:
@@ -421,12 +438,16 @@ def import_module(inference_state, import_names, parent_module_value, sys_path):
             # The module might not be a package.
             return NO_VALUES
 
-        file_io_or_ns, is_pkg = inference_state.compiled_subprocess.get_module_info(
-            string=import_names[-1],
-            path=paths,
-            full_name=module_name,
-            is_global_search=False,
-        )
+        result = _find_module_in_folders(
+            inference_state, import_names, paths, is_global_search=False)
+        if result is None:
+            result = inference_state.compiled_subprocess.get_module_info(
+                string=import_names[-1],
+                path=paths,
+                full_name=module_name,
+                is_global_search=False,
+            )
+        file_io_or_ns, is_pkg = result
         if is_pkg is None:
             return NO_VALUES
 
@@ -455,6 +476,73 @@ def import_module(inference_state, import_names, parent_module_value, sys_path):
     return ValueSet([module])
 
 
+@inference_state_function_cache()
+def _list_folder(inference_state, path):
+    try:
+        return set(os.listdir(path))
+    except NotADirectoryError:
+        return False
+    except OSError:
+        return None
+
+
+def _find_module_in_folders(inference_state, import_names, paths, is_global_search):
+    """
+    Finds Python modules and packages like importlib's ``PathFinder``, but
+    without asking the environment's subprocess. Returns the same as the
+    subprocess function ``get_module_info`` or None if the module cannot be
+    found this way (e.g. builtin and extension modules, zip imports and
+    custom finders).
+    """
+    builtin_names, extension_suffixes, other_names = \
+        inference_state.environment._get_import_system_info(inference_state)
+    if other_names is None or import_names[0] in other_names:
+        return None
+    string = import_names[-1]
+    if string in builtin_names:
+        return None
+
+    # Sourceless modules are found by the subprocess as well.
+    other_suffixes = list(extension_suffixes) + ['.pyc']
+    namespace_paths = []
+    for path in paths:
+        if not path:
+            # The current working directory of the subprocess.
+            return None
+        names = _list_folder(inference_state, path)
+        if names is False:
+            # Probably a zip file.
+            return None
+        if names is None:
+            continue
+
+        if string in names:
+            package_path = os.path.join(path, string)
+            init_names = _list_folder(inference_state, package_path)
+            if init_names is not None and init_names is not False:
+                if any('__init__' + suffix in init_names for suffix in other_suffixes):
+                    return None
+                if '__init__.py' in init_names:
+                    stats.increment('imports_found_in_folders')
+                    return FileIO(os.path.join(package_path, '__init__.py')), True
+                namespace_paths.append(package_path)
+
+        if any(string + suffix in names for suffix in other_suffixes):
+            return None
+        if string + '.py' in names:
+            stats.increment('imports_found_in_folders')
+            return FileIO(os.path.join(path, string + '.py')), False
+
+    if namespace_paths:
+        stats.increment('imports_found_in_folders')
+        name = string if is_global_search else '.'.join(import_names)
+        return ImplicitNSInfo(name, namespace_paths), True
+    if is_global_search:
+        # The subprocess also finds e.g. frozen modules.
+        return None
+    return None, None
+
+
 def _load_python_module(inference_state, file_io,
                         import_names=None, is_package=False):
     module_node = inference_state.parse(
@@ -20,39 +20,175 @@ itself (inception!). But I don't think there's any other Python library that
 uses recursion in a similarly extreme way. Completion should also be fast and
 therefore the quality might not always be maximal.
 
-.. autodata:: recursion_limit
-.. autodata:: total_function_execution_limit
-.. autodata:: per_function_execution_limit
-.. autodata:: per_function_recursion_limit
+The limits are bundled in an :class:`InferenceBudget` that is passed to
+:class:`.Script` (``Script(code, budget='batch')``). If no budget is given,
+:data:`jedi.settings.inference_budget` is used.
+
+.. autoclass:: InferenceBudget
+    :members: scale, with_time_limit
+.. autodata:: PROFILES
 """
 
+import time
+import warnings
+from collections import Counter
 from contextlib import contextmanager
+from dataclasses import dataclass, replace
+from typing import Optional
 
 from jedi import debug
+from jedi import settings
+from jedi import stats
 from jedi.inference.base_value import NO_VALUES
 
 
-recursion_limit = 15
+# The limits of the profiles are meant for requests that take up to about a
+# second, see InferenceBudget.with_time_limit.
+_REFERENCE_TIME = 1.0
+
+
+@dataclass(frozen=True)
+class InferenceBudget:
+    """
+    The limits of the inference of one API call. Budgets are immutable, use
+    :meth:`scale` or :meth:`with_time_limit` to get a different one.
+
+    :param recursion_limit: Like :func:`sys.getrecursionlimit()`, just for
+        |jedi|.
+    :param total_function_execution_limit: This is a hard limit of how many
+        non-builtin functions can be executed.
+    :param per_function_execution_limit: The maximal amount of times a
+        specific function may be executed.
+    :param per_function_recursion_limit: A function may not be executed more
+        than this number of times recursively.
+    :param value_infer_limit: How often a node may be inferred (for the whole
+        lifetime of a :class:`.Script`). Nodes in builtins may be inferred 100
+        times more often.
+    :param time_limit: If not ``None``, no functions are executed anymore
+        after this many seconds were spent executing functions.
+    """
+    recursion_limit: int = 15
+    total_function_execution_limit: int = 200
+    per_function_execution_limit: int = 6
+    per_function_recursion_limit: int = 2
+    value_infer_limit: int = 300
+    time_limit: Optional[float] = None
+
+    def scale(self, factor):
+        """
+        Returns a budget that allows ``factor`` times as many function
+        executions and inferences. The recursion limits are not scaled,
+        because the work they allow grows exponentially.
+        """
+        return replace(
+            self,
+            total_function_execution_limit=max(
+                int(self.total_function_execution_limit * factor), 1),
+            per_function_execution_limit=max(
+                int(self.per_function_execution_limit * factor), 1),
+            value_infer_limit=max(int(self.value_infer_limit * factor), 1),
+        )
+
+    def with_time_limit(self, time_limit):
+        """
+        Returns a budget that stops executing functions after ``time_limit``
+        seconds. The counts are scaled with the time: The profiles are meant
+        for about a second, ``PROFILES['interactive'].with_time_limit(0.2)``
+        allows a fifth of the function executions.
+        """
+        return replace(self.scale(time_limit / _REFERENCE_TIME), time_limit=time_limit)
+
+
+PROFILES = {
+    'interactive': InferenceBudget(),
+    'analysis': InferenceBudget(
+        recursion_limit=20,
+        total_function_execution_limit=500,
+        per_function_execution_limit=10,
+        value_infer_limit=600,
+    ),
+    'batch': InferenceBudget(
+        recursion_limit=30,
+        total_function_execution_limit=1000,
+        per_function_execution_limit=12,
+        per_function_recursion_limit=3,
+        value_infer_limit=1000,
+    ),
+}
 """
-Like :func:`sys.getrecursionlimit()`, just for |jedi|.
+The named budgets that can be passed instead of an :class:`InferenceBudget`:
+``'interactive'`` (the default, for completions and goto in editors),
+``'analysis'`` (for ``python -m jedi analyze``) and ``'batch'`` (for
+``python -m jedi index``, goes deepest).
 """
+
+# Deprecated, use an InferenceBudget instead. Changing them still changes the
+# 'interactive' profile.
+recursion_limit = 15
 total_function_execution_limit = 200
-"""
-This is a hard limit of how many non-builtin functions can be executed.
-"""
 per_function_execution_limit = 6
-"""
-The maximal amount of times a specific function may be executed.
-"""
 per_function_recursion_limit = 2
-"""
-A function may not be executed more than this number of times recursively.
-"""
+_DEPRECATED_LIMITS = (
+    'recursion_limit',
+    'total_function_execution_limit',
+    'per_function_execution_limit',
+    'per_function_recursion_limit',
+)
+
+
+def get_budget(budget=None):
+    """
+    Returns the :class:`InferenceBudget` for a profile name, a budget or
+    ``None`` (:data:`jedi.settings.inference_budget`).
+    """
+    if budget is None:
+        budget = settings.inference_budget
+    if isinstance(budget, InferenceBudget):
+        return budget
+    try:
+        profile = PROFILES[budget]
+    except KeyError:
+        raise ValueError(
+            "Unknown inference budget %r, use one of %s or an InferenceBudget"
+            % (budget, ', '.join(sorted(PROFILES)))
+        )
+    if budget == 'interactive':
+        default = InferenceBudget()
+        changed = {
+            name: globals()[name] for name in _DEPRECATED_LIMITS
+            if globals()[name] != getattr(default, name)
+        }
+        if changed:
+            warnings.warn(
+                "The module level limits in jedi.inference.recursion are "
+                "deprecated, pass an InferenceBudget to Script instead.",
+                DeprecationWarning,
+                stacklevel=2,
+            )
+            return replace(profile, **changed)
+    return profile
 
 
 class RecursionDetector:
     def __init__(self):
         self.pushed_nodes = []
+        # The same nodes as a set, so lookups don't depend on the depth of the
+        # stack. A node is never pushed twice.
+        self._pushed_node_set = set()
+
+    def push(self, node):
+        """
+        Returns False if ``node`` is already being inferred, otherwise pushes
+        it.
+        """
+        if node in self._pushed_node_set:
+            return False
+        self.pushed_nodes.append(node)
+        self._pushed_node_set.add(node)
+        return True
+
+    def pop(self):
+        self._pushed_node_set.remove(self.pushed_nodes.pop())
 
 
 @contextmanager
@@ -61,18 +197,18 @@ def execution_allowed(inference_state, node):
     A decorator to detect recursions in statements. In a recursion a statement
     at the same place, in the same module may not be executed two times.
     """
-    pushed_nodes = inference_state.recursion_detector.pushed_nodes
+    detector = inference_state.recursion_detector
 
-    if node in pushed_nodes:
+    if not detector.push(node):
         debug.warning('catched stmt recursion: %s @%s', node,
                       getattr(node, 'start_pos', None))
+        stats.increment('statement_recursion')
         yield False
     else:
         try:
-            pushed_nodes.append(node)
             yield True
         finally:
-            pushed_nodes.pop()
+            detector.pop()
 
 
 def execution_recursion_decorator(default=NO_VALUES):
@@ -98,22 +234,35 @@ class ExecutionRecursionDetector:
     """
     def __init__(self, inference_state):
         self._inference_state = inference_state
+        self._budget = inference_state.budget
+        # Only the time spent in executions counts, otherwise lazily inferred
+        # names (e.g. Name.infer() after get_names()) would be limited by the
+        # time that passed since the API call.
+        self._execution_time = 0.0
+        self._execution_start = None
 
         self._recursion_level = 0
         self._parent_execution_funcs = []
+        # How often each function is in _parent_execution_funcs.
+        self._parent_execution_func_counts = Counter()
         self._funcdef_execution_counts = {}
         self._execution_count = 0
 
     def pop_execution(self):
-        self._parent_execution_funcs.pop()
+        self._parent_execution_func_counts[self._parent_execution_funcs.pop()] -= 1
         self._recursion_level -= 1
+        if not self._recursion_level:
+            self._execution_time += time.perf_counter() - self._execution_start
 
     def push_execution(self, execution):
         funcdef = execution.tree_node
 
-        # These two will be undone in pop_execution.
+        # These will be undone in pop_execution.
         self._recursion_level += 1
+        if self._recursion_level == 1:
+            self._execution_start = time.perf_counter()
         self._parent_execution_funcs.append(funcdef)
+        self._parent_execution_func_counts[funcdef] += 1
 
         module_context = execution.get_root_context()
 
@@ -123,31 +272,45 @@ class ExecutionRecursionDetector:
             # they usually just help a lot with getting good results.
             return False
 
-        if self._recursion_level > recursion_limit:
-            debug.warning('Recursion limit (%s) reached', recursion_limit)
+        budget = self._budget
+        if self._recursion_level > budget.recursion_limit:
+            debug.warning('Recursion limit (%s) reached', budget.recursion_limit)
+            stats.increment('recursion_limit')
+            return True
+
+        if self._execution_count >= budget.total_function_execution_limit:
+            debug.warning('Function execution limit (%s) reached',
+                          budget.total_function_execution_limit)
+            stats.increment('total_function_execution_limit')
             return True
 
-        if self._execution_count >= total_function_execution_limit:
-            debug.warning('Function execution limit (%s) reached', total_function_execution_limit)
+        if budget.time_limit is not None and self._execution_time \
+                + time.perf_counter() - self._execution_start > budget.time_limit:
+            debug.warning('Time limit (%ss) reached', budget.time_limit)
+            stats.increment('time_limit')
             return True
         self._execution_count += 1
+        stats.increment('function_executions')
 
-        if self._funcdef_execution_counts.setdefault(funcdef, 0) >= per_function_execution_limit:
+        if self._funcdef_execution_counts.setdefault(funcdef, 0) \
+                >= budget.per_function_execution_limit:
             if module_context.py__name__() == 'typing':
                 return False
             debug.warning(
                 'Per function execution limit (%s) reached: %s',
-                per_function_execution_limit,
+                budget.per_function_execution_limit,
                 funcdef
             )
+            stats.increment('per_function_execution_limit')
             return True
         self._funcdef_execution_counts[funcdef] += 1
 
-        if self._parent_execution_funcs.count(funcdef) > per_function_recursion_limit:
+        if self._parent_execution_func_counts[funcdef] > budget.per_function_recursion_limit:
             debug.warning(
                 'Per function recursion limit (%s) reached: %s',
-                per_function_recursion_limit,
+                budget.per_function_recursion_limit,
                 funcdef
             )
+            stats.increment('per_function_recursion_limit')
             return True
         return False
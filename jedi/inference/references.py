@@ -3,12 +3,14 @@ import re
 
 from parso import python_bytes_to_unicode
 
+from jedi import stats
 from jedi.debug import dbg
 from jedi.file_io import KnownContentFileIO, FolderIO
 from jedi.inference.names import SubModuleName
 from jedi.inference.imports import load_module_from_path
 from jedi.inference.filters import ParserTreeFilter
 from jedi.inference.gradual.conversion import convert_names
+from jedi.parser_utils import get_parent_scope
 
 _IGNORE_FOLDERS = ('.tox', '.venv', '.mypy_cache', 'venv', '__pycache__')
 
@@ -111,6 +113,43 @@ def _find_global_variables(names, search_name):
                 yield from _add_names_in_same_context(c, global_name.string_name)
 
 
+def _get_private_scope(module_context, names, search_name):
+    """
+    Returns the scope node that contains all the references of ``names`` if
+    they can't be used outside of it: local variables of functions and
+    comprehensions. Otherwise returns None.
+    """
+    module_node = module_context.tree_node
+    if module_node is None:
+        return None
+    for leaf in module_node.get_used_names().get(search_name, []):
+        if leaf.parent.type in ('global_stmt', 'nonlocal_stmt'):
+            return None
+
+    scopes = set()
+    for name in names:
+        tree_name = name.tree_name
+        # Params can be used as keyword arguments outside of the function.
+        if tree_name is None or tree_name.parent.type == 'trailer' \
+                or name.api_type == 'param' \
+                or name.get_root_context() != module_context:
+            return None
+        if tree_name.is_definition():
+            scopes.add(get_parent_scope(tree_name))
+    if len(scopes) != 1:
+        return None
+
+    scope, = scopes
+    if scope.type in ('comp_for', 'sync_comp_for'):
+        # The element of a comprehension is not part of the comp_for.
+        while scope.type in ('comp_for', 'sync_comp_for'):
+            scope = scope.parent
+        return scope
+    if scope.type in ('funcdef', 'lambdef'):
+        return scope
+    return None
+
+
 def find_references(module_context, tree_name, only_in_module=False):
     inf = module_context.inference_state
     search_name = tree_name.value
@@ -126,7 +165,13 @@ def find_references(module_context, tree_name, only_in_module=False):
     found_names_dct = _dictionarize(found_names)
 
     module_contexts = [module_context]
-    if not only_in_module:
+    scope_node = _get_private_scope(module_context, found_names, search_name)
+    if scope_node is not None:
+        # The names can't be used anywhere else, so only the names in the
+        # scope need to be checked and the file system is not needed.
+        stats.increment('references_in_private_scope')
+        only_in_module = True
+    elif not only_in_module:
         for m in set(d.get_root_context() for d in found_names):
             if m != module_context and m.tree_node is not None \
                     and inf.project.path in m.py__file__().parents:
@@ -143,7 +188,13 @@ def find_references(module_context, tree_name, only_in_module=False):
 
     non_matching_reference_maps = {}
     for module_context in potential_modules:
-        for name_leaf in module_context.tree_node.get_used_names().get(search_name, []):
+        name_leaves = module_context.tree_node.get_used_names().get(search_name, [])
+        if scope_node is not None:
+            name_leaves = [
+                n for n in name_leaves
+                if scope_node.start_pos <= n.start_pos < scope_node.end_pos
+            ]
+        for name_leaf in name_leaves:
             new = _dictionarize(_find_names(module_context, name_leaf))
             if any(tree_name in found_names_dct for tree_name in new):
                 found_names_dct.update(new)
@@ -306,14 +357,18 @@ def search_in_file_ios(inference_state, file_io_iterator, name,
     regex = re.compile(r'\b' + re.escape(name) + (r'' if complete else r'\b'))
     for file_io in file_io_iterator:
         file_io_count += 1
+        stats.increment('files_opened')
         m = _check_fs(inference_state, file_io, regex)
         if m is not None:
             parsed_file_count += 1
+            stats.increment('files_parsed')
             yield m
             if parsed_file_count >= parse_limit:
                 dbg('Hit limit of parsed files: %s', parse_limit)
+                stats.increment('parsed_file_limit')
                 break
 
         if file_io_count >= open_limit:
             dbg('Hit limit of opened files: %s', open_limit)
+            stats.increment('opened_file_limit')
             break
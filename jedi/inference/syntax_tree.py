@@ -8,6 +8,7 @@ from parso.python import tree
 
 from jedi import debug
 from jedi import parser_utils
+from jedi import stats
 from jedi.inference.base_value import ValueSet, NO_VALUES, ContextualizedNode, \
     iterator_to_value_set, iterate_values
 from jedi.inference.lazy_value import LazyTreeValue
@@ -68,7 +69,7 @@ def _limit_value_infers(func):
         inference_state = context.inference_state
         try:
             inference_state.inferred_element_counts[n] += 1
-            maximum = 300
+            maximum = inference_state.budget.value_infer_limit
             if context.parent_context is None \
                     and context.get_value() is inference_state.builtins_module:
                 # Builtins should have a more generous inference limit.
@@ -79,6 +80,7 @@ def _limit_value_infers(func):
 
             if inference_state.inferred_element_counts[n] > maximum:
                 debug.warning('In value %s there were too many inferences.', n)
+                stats.increment('value_infer_limit')
                 return NO_VALUES
         except KeyError:
             inference_state.inferred_element_counts[n] = 1
@@ -181,6 +183,7 @@ def _infer_node_cached(context, element):
 @_limit_value_infers
 def _infer_node(context, element):
     debug.dbg('infer_node %s@%s in %s', element, element.start_pos, context)
+    stats.increment('inferred_nodes')
     inference_state = context.inference_state
     typ = element.type
     if typ in ('name', 'number', 'string', 'atom', 'strings', 'keyword', 'fstring'):
@@ -12,6 +12,9 @@ from jedi import settings
 from jedi import debug
 
 _BUILDOUT_PATH_INSERTION_LIMIT = 10
+_SYS_PATH_TRIES_LIMIT = 20
+
+_sys_path_tries = {}
 
 
 def _abs_path(module_context, str_path: str):
@@ -208,6 +211,23 @@ def _get_buildout_script_paths(search_path: Path):
             continue
 
 
+def get_buildout_dependencies(script_path: Path):
+    """
+    Returns the paths (apart from the parent directories of ``script_path``)
+    that :func:`discover_buildout_paths` depends on. If one of them changes,
+    the buildout paths need to be discovered again.
+    """
+    project_root = _get_parent_dir_with_file(script_path, 'buildout.cfg')
+    if not project_root:
+        return []
+    bin_path = project_root.joinpath('bin')
+    try:
+        names = os.listdir(bin_path)
+    except OSError:
+        return [bin_path]
+    return [bin_path] + [bin_path.joinpath(name) for name in names]
+
+
 def remove_python_path_suffix(path):
     for suffix in all_suffixes() + ['.pyi']:
         if path.suffix == suffix:
@@ -216,6 +236,38 @@ def remove_python_path_suffix(path):
     return path
 
 
+def _split_path(path):
+    if os.path.altsep is not None:
+        # On Windows a path can also use a slash.
+        path = path.replace(os.path.altsep, os.path.sep)
+    return path.rstrip(os.path.sep).split(os.path.sep)
+
+
+def _get_sys_path_trie(sys_path):
+    """
+    Returns a trie of the path components of all sys path entries. Entries
+    are marked with a ``None`` key. The tries are cached, because sys paths
+    are usually the same for a lot of calls.
+    """
+    key = tuple(sys_path)
+    try:
+        return _sys_path_tries[key]
+    except KeyError:
+        pass
+
+    trie = {}
+    for p in sys_path:
+        node = trie
+        for part in _split_path(p):
+            node = node.setdefault(part, {})
+        node[None] = True
+
+    if len(_sys_path_tries) >= _SYS_PATH_TRIES_LIMIT:
+        _sys_path_tries.clear()
+    _sys_path_tries[key] = trie
+    return trie
+
+
 def transform_path_to_dotted(sys_path, module_path):
     """
     Returns the dotted path inside a sys.path as a list of names. e.g.
@@ -239,34 +291,30 @@ def transform_path_to_dotted(sys_path, module_path):
     if is_package:
         module_path = module_path.parent
 
-    def iter_potential_solutions():
-        for p in sys_path:
-            if str(module_path).startswith(p):
-                # Strip the trailing slash/backslash
-                rest = str(module_path)[len(p):]
-                # On Windows a path can also use a slash.
-                if rest.startswith(os.path.sep) or rest.startswith('/'):
-                    # Remove a slash in cases it's still there.
-                    rest = rest[1:]
-
-                if rest:
-                    split = rest.split(os.path.sep)
-                    if not all(split):
-                        # This means that part of the file path was empty, this
-                        # is very strange and is probably a file that is called
-                        # `.py`.
-                        return
-                    # Stub folders for foo can end with foo-stubs. Just remove
-                    # it.
-                    yield tuple(re.sub(r'-stubs$', '', s) for s in split)
-
-    potential_solutions = tuple(iter_potential_solutions())
-    if not potential_solutions:
-        return None, False
-    # Try to find the shortest path, this makes more sense usually, because the
-    # user usually has venvs somewhere. This means that a path like
+    # Try to find the shortest path, i.e. the longest sys path entry that
+    # contains the module. This makes more sense usually, because the user
+    # usually has venvs somewhere. This means that a path like
     # .tox/py37/lib/python3.7/os.py can be normal for a file. However in that
     # case we definitely want to return ['os'] as a path and not a crazy
     # ['.tox', 'py37', 'lib', 'python3.7', 'os']. Keep in mind that this is a
     # heuristic and there's now ay to "always" do it right.
-    return sorted(potential_solutions, key=lambda p: len(p))[0], is_package
+    parts = _split_path(str(module_path))
+    node = _get_sys_path_trie(sys_path)
+    start = None
+    # The last part is never a sys path entry, the rest would be empty.
+    for i, part in enumerate(parts[:-1], 1):
+        node = node.get(part)
+        if node is None:
+            break
+        if None in node:
+            start = i
+
+    if start is None:
+        return None, False
+    rest = parts[start:]
+    if not all(rest):
+        # This means that part of the file path was empty, this is very
+        # strange and is probably a file that is called `.py`.
+        return None, False
+    # Stub folders for foo can end with foo-stubs. Just remove it.
+    return tuple(re.sub(r'-stubs$', '', s) for s in rest), is_package
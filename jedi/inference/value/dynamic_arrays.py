@@ -10,23 +10,35 @@ current module will be checked for appearances of ``arr.append``,
 content will be added
 
 This can be really cpu intensive, as you can imagine. Because |jedi| has to
-follow **every** ``append`` and check whether it's the right array. However this
-works pretty good, because in *slow* cases, the recursion detector and other
-settings will stop this process.
+follow ``append`` calls and check whether it's the right array. To keep this
+cheap, the ``append`` calls of a module are indexed once together with the
+names that might refer to the same object (assignments, call arguments and
+returns). Only the calls on such names are followed. In *slow* cases, the
+recursion detector and other settings will stop this process.
 
 It is important to note that:
 
-1. Array modifications work only in the current module.
+1. Array modifications work only in the current module, unless
+   :data:`jedi.settings.dynamic_additions_for_other_modules` is enabled. In
+   that case module and class level lists, sets and dicts (e.g. registries
+   like ``REGISTRY[key] = Handler``) are also looked up in other modules.
 2. Jedi only checks Array additions; ``list.pop``, etc are ignored.
 """
+import time
+from bisect import bisect_left
+
 from jedi import debug
 from jedi import settings
+from jedi import stats
+from jedi.file_io import FileIO
+from jedi.parser_utils import get_parent_scope
 from jedi.inference import recursion
 from jedi.inference.base_value import ValueSet, NO_VALUES, HelperValueMixin, \
     ValueWrapper
 from jedi.inference.lazy_value import LazyKnownValues
 from jedi.inference.helpers import infer_call_of_leaf
-from jedi.inference.cache import inference_state_method_cache
+from jedi.inference.cache import inference_state_method_cache, \
+    inference_state_function_cache
 
 _sentinel = object()
 
@@ -34,15 +46,424 @@ _sentinel = object()
 def check_array_additions(context, sequence):
     """ Just a mapper function for the internal _internal_check_array_additions """
     if sequence.array_type not in ('list', 'set'):
-        # TODO also check for dict updates
         return NO_VALUES
 
-    return _internal_check_array_additions(context, sequence)
+    return _internal_check_array_additions(context, sequence, sequence.atom)
+
+
+@inference_state_method_cache(default=())
+def check_dict_additions(context, dct):
+    """
+    Returns a list of ``(keys, values)`` that are added to a dict in other
+    modules (or outside of its flow), e.g. with ``REGISTRY[key] = Handler``
+    or ``REGISTRY.update(key=Handler)``. This only works if
+    :data:`jedi.settings.dynamic_additions_for_other_modules` is enabled.
+    """
+    from jedi.inference import arguments
+    from jedi.inference import compiled
+
+    if not settings.dynamic_array_additions:
+        return []
+
+    inference_state = context.inference_state
+    added = []
+
+    def handle_site(random_context, add_name, node):
+        if add_name == '__setitem__':
+            subscript = node.children[0].children[-1].children[1]
+            added.append((
+                random_context.infer_node(subscript),
+                random_context.infer_node(node.children[-1]),
+            ))
+            return
+
+        args = arguments.TreeArguments(inference_state, random_context, node.children[1])
+        for key, lazy_value in args.unpack():
+            if key is None:
+                for value in lazy_value.infer():
+                    try:
+                        get_mapping_item_values = value.get_mapping_item_values
+                    except AttributeError:
+                        continue
+                    added.append(get_mapping_item_values())
+            else:
+                added.append((
+                    ValueSet([compiled.create_simple_object(inference_state, key)]),
+                    lazy_value.infer(),
+                ))
+
+    _search_other_modules(context, dct.atom, ('__setitem__', 'update'), handle_site,
+                          include_own_module=True)
+    return added
+
+
+def _get_container_name(node):
+    """
+    Returns the name of the module or class level variable that ``node`` is
+    assigned to.
+    """
+    targets = _get_assignment_targets(node)
+    if targets is None or len(targets) != 1 or targets[0].type != 'name':
+        return None
+    if get_parent_scope(targets[0]).type not in ('file_input', 'classdef'):
+        return None
+    return targets[0]
+
+
+def _refers_to(context, leaf, tree_name):
+    """
+    Checks with goto (which is way cheaper than inferring the object) if
+    ``leaf`` refers to the definition ``tree_name``.
+    """
+    todo = list(context.create_name(leaf).goto())
+    seen = set()
+    while todo:
+        name = todo.pop()
+        if name.tree_name is tree_name:
+            return True
+        if name.is_import() and name not in seen:
+            seen.add(name)
+            todo += name.goto()
+    return False
+
+
+def _iter_mutation_sites(module_node, name):
+    """
+    Yields ``(name, add_name, node)`` for modifications of objects called
+    ``name``. ``node`` is the expr_stmt for ``name[key] = value`` (with
+    ``add_name`` ``__setitem__``) and otherwise the execution trailer, e.g.
+    of ``name.append(value)``.
+    """
+    for leaf in module_node.get_used_names().get(name, []):
+        end = leaf
+        if leaf.parent.type == 'trailer' and leaf.parent.children[0] == '.':
+            end = leaf.parent
+        power = end.parent
+        if power.type not in ('atom_expr', 'power'):
+            continue
+        trailer = end.get_next_sibling()
+        if trailer is None or trailer.type != 'trailer':
+            continue
+
+        if trailer.children[0] == '[':
+            stmt = power.parent
+            if trailer is power.children[-1] and stmt.type == 'expr_stmt' \
+                    and stmt.children[0] is power and stmt.children[1] == '=':
+                yield leaf, '__setitem__', stmt
+        elif trailer.children[0] == '.':
+            execution = trailer.get_next_sibling()
+            if execution is not None and execution.type == 'trailer' \
+                    and execution.children[0] == '(' and execution.children[1] != ')':
+                yield leaf, trailer.children[1].value, execution
+
+
+def _search_other_modules(context, node, add_names, handle_site, include_own_module):
+    """
+    Calls ``handle_site(context, add_name, node)`` for the modifications of
+    the module or class level object created by ``node`` in the other modules
+    of the project
+    (see :func:`_iter_mutation_sites`). This is limited by
+    :data:`jedi.settings.dynamic_additions_time_limit` per API call.
+    """
+    from jedi.inference.call_sites import get_call_site_index
+    from jedi.inference.imports import load_module_from_path
+
+    inference_state = context.inference_state
+    if not settings.dynamic_additions_for_other_modules \
+            or inference_state.is_searching_other_modules_for_additions:
+        return
+
+    tree_name = _get_container_name(node)
+    if tree_name is None:
+        return
+    name = tree_name.value
+
+    def time_is_up():
+        if inference_state.dynamic_additions_time >= settings.dynamic_additions_time_limit:
+            debug.warning('Time limit for additions in other modules reached: %s', name)
+            stats.increment('dynamic_additions_time_limit')
+            return True
+        return False
+
+    if time_is_up():
+        return
+
+    own_path = context.get_root_context().py__file__()
+    debug.dbg('Search additions of %s in other modules', name, color='MAGENTA')
+    inference_state.is_searching_other_modules_for_additions = True
+    # Everything (refreshing the call site index, parsing and scanning files
+    # and inferring the additions) counts towards the time limit.
+    start = time.perf_counter()
+    try:
+        index = get_call_site_index(inference_state)
+        paths = index.get_mutation_paths(name)
+        for path in paths:
+            if not include_own_module and own_path is not None and path == str(own_path):
+                continue
+            now = time.perf_counter()
+            inference_state.dynamic_additions_time += now - start
+            start = now
+            if time_is_up():
+                return
+
+            try:
+                module_value = load_module_from_path(inference_state, FileIO(path))
+            except OSError:
+                # The file was removed after the project was searched for
+                # changes.
+                index.remove(path)
+                continue
+            if module_value.is_compiled():
+                continue
+            module_context = module_value.as_context()
+            for leaf, add_name, site_node in _iter_mutation_sites(module_context.tree_node,
+                                                                   name):
+                if add_name not in add_names:
+                    continue
+                if _refers_to(module_context, leaf, tree_name):
+                    handle_site(module_context.create_context(leaf), add_name, site_node)
+    finally:
+        inference_state.dynamic_additions_time += time.perf_counter() - start
+        inference_state.is_searching_other_modules_for_additions = False
+
+
+def _leading_name(node):
+    """
+    Returns the first name of an expression like ``foo`` in ``foo.bar[1]``.
+    """
+    if node.type == 'name':
+        return node.value
+    if node.type in ('atom_expr', 'power') and node.children[0].type == 'name':
+        return node.children[0].value
+    return None
+
+
+def _get_assignment_targets(node):
+    """
+    Returns the targets of an assignment like ``a = b = node``.
+    """
+    stmt = node.parent
+    if stmt.type == 'annassign':
+        return [stmt.parent.children[0]]
+    elif stmt.type == 'expr_stmt' and stmt.children[-1] == node \
+            and stmt.children[1] == '=':
+        return stmt.children[:-1:2]
+    return None
+
+
+def _iter_arguments(arglist):
+    if arglist.type == 'arglist':
+        arguments = arglist.children[::2]
+    else:
+        arguments = [arglist]
+    for i, argument in enumerate(arguments):
+        if argument.type == 'argument' and argument.children[1] == '=':
+            yield None, argument.children[0].value, argument.children[2]
+        else:
+            yield i, None, argument
+
+
+# Parents of names that don't pass the object of the name to anything else.
+_NON_ESCAPING_PARENTS = {
+    'expr_stmt', 'annassign', 'return_stmt',  # See _MutationIndex._build
+    'simple_stmt', 'file_input', 'suite', 'if_stmt', 'while_stmt', 'for_stmt',
+    'sync_comp_for', 'comp_if', 'del_stmt', 'assert_stmt', 'global_stmt',
+    'nonlocal_stmt', 'except_clause', 'classdef', 'decorator', 'fstring_expr',
+    'comparison', 'not_test', 'arith_expr', 'term', 'factor', 'shift_expr',
+    'and_expr', 'xor_expr', 'expr', 'subscript', 'subscriptlist',
+    'import_from', 'import_name', 'dotted_name', 'dotted_as_name',
+    'import_as_name',
+}
+# Builtins that don't keep a reference to their arguments.
+_NON_ESCAPING_CALLS = {
+    'len', 'print', 'repr', 'str', 'bool', 'hash', 'id', 'type', 'isinstance',
+    'issubclass', 'list', 'tuple', 'set', 'frozenset', 'sorted', 'sum', 'min',
+    'max', 'any', 'all', 'iter', 'enumerate', 'zip',
+}
+
+
+class _MutationIndex:
+    """
+    The calls of ``append``, ``extend``, etc. in a module, including the
+    first name of their receiver (``foo`` in ``foo.bar.append(1)``), as well
+    as the names that might refer to the same object (through assignments,
+    call arguments and return statements).
+    """
+    def __init__(self, module_node):
+        self._module_node = module_node
+        # add_name -> [(receiver name, name, execution trailer)]
+        self._sites = {}
+        self._aliases = {}
+        self._functions = set()
+        self._escaping = {}
+        self._build(module_node)
+
+    def _add_alias(self, source, target):
+        if source is not None and target is not None and source != target:
+            self._aliases.setdefault(source, set()).add(target)
+
+    def _build(self, module_node):
+        calls = []
+        params = {}
+        stack = [(module_node, None)]
+        while stack:
+            node, funcname = stack.pop()
+            typ = node.type
+            if typ == 'funcdef':
+                funcname = node.name.value
+                params.setdefault(funcname, []).append(
+                    [p.name.value for p in node.get_params()]
+                )
+            elif typ == 'expr_stmt':
+                children = node.children
+                if children[-1].type == 'annassign':
+                    if len(children[-1].children) == 4:
+                        self._add_alias(_leading_name(children[-1].children[3]),
+                                        _leading_name(children[0]))
+                elif children[1] == '=':
+                    value = _leading_name(children[-1])
+                    for target in children[:-1:2]:
+                        self._add_alias(value, _leading_name(target))
+            elif typ == 'return_stmt':
+                self._add_alias(_leading_name(node.children[1]), funcname)
+            elif typ == 'trailer' and node.children[0] == '(':
+                self._add_call(node, calls)
+
+            # Reversed, so the nodes are visited in the order of the code.
+            for child in reversed(getattr(node, 'children', ())):
+                if hasattr(child, 'children'):
+                    stack.append((child, funcname))
+
+        self._functions = set(params)
+        for receiver, callee, is_method, index, keyword in calls:
+            for param_names in params.get(callee, []):
+                if keyword is not None:
+                    if keyword in param_names:
+                        self._add_alias(receiver, keyword)
+                else:
+                    # Methods have an additional self param.
+                    end = index + 2 if is_method else index + 1
+                    for param_name in param_names[index:end]:
+                        self._add_alias(receiver, param_name)
+
+    def _add_call(self, trailer, calls):
+        power = trailer.parent
+        previous = trailer.get_previous_sibling()
+        if previous is None:
+            return
+        is_method = False
+        if previous.type == 'name':
+            callee = previous.value
+        elif previous.type == 'trailer' and previous.children[0] == '.':
+            callee = previous.children[1].value
+            is_method = True
+            if trailer.children[1] != ')':
+                receiver = power.children[0]
+                self._sites.setdefault(callee, []).append((
+                    receiver.value if receiver.type == 'name' else None,
+                    previous.children[1],
+                    trailer,
+                ))
+        else:
+            return
+
+        if trailer.children[1] != ')':
+            for index, keyword, argument in _iter_arguments(trailer.children[1]):
+                receiver = _leading_name(argument)
+                if receiver is not None:
+                    calls.append((receiver, callee, is_method, index, keyword))
+
+    def get_receiver_names(self, node):
+        """
+        Returns the names that might refer to the object created by ``node``
+        or None if they cannot be determined.
+        """
+        targets = _get_assignment_targets(node)
+        if targets is None:
+            return None
+
+        todo = [_leading_name(target) for target in targets]
+        if None in todo:
+            return None
+        names = set()
+        while todo:
+            name = todo.pop()
+            if name not in names:
+                if self._is_escaping(name):
+                    # The object might be modified through names that are
+                    # unknown, e.g. after ``for x in [name]:``.
+                    return None
+                names.add(name)
+                todo += self._aliases.get(name, ())
+        return names
+
+    def _is_escaping(self, name):
+        """
+        Returns True if ``name`` is used in a way that is not followed by the
+        aliases, e.g. in a list literal or a conditional expression.
+        """
+        try:
+            return self._escaping[name]
+        except KeyError:
+            pass
+        result = self._escaping[name] = any(
+            self._is_escaping_leaf(leaf)
+            for leaf in self._module_node.get_used_names().get(name, [])
+        )
+        return result
+
+    def _is_escaping_leaf(self, leaf):
+        if leaf.is_definition():
+            return False
+        node = leaf
+        parent = leaf.parent
+        if parent.type in ('atom_expr', 'power') and parent.children[0] is leaf:
+            node = parent
+            parent = node.parent
+
+        if parent.type == 'argument':
+            if parent.children[0] is node and parent.children[1] == '=':
+                # The keyword of ``foo(name=1)``.
+                return False
+            parent = parent.parent
+        if parent.type == 'arglist':
+            parent = parent.parent
+        if parent.type == 'trailer':
+            if parent.children[0] != '(':
+                # ``foo.name`` or ``foo[name]``
+                return False
+            previous = parent.get_previous_sibling()
+            if previous.type == 'name':
+                callee = previous.value
+            elif previous.type == 'trailer' and previous.children[0] == '.':
+                callee = previous.children[1].value
+            else:
+                return True
+            # The arguments of functions in this module are followed.
+            return callee not in self._functions and callee not in _NON_ESCAPING_CALLS
+        return parent.type not in _NON_ESCAPING_PARENTS
+
+    def iter_sites(self, add_name, scope_node):
+        """
+        Returns ``(receiver name, name, execution trailer)`` of the
+        ``add_name`` calls within ``scope_node``.
+        """
+        sites = self._sites.get(add_name, [])
+        start = bisect_left(sites, scope_node.start_pos, key=lambda site: site[1].start_pos)
+        for site in sites[start:]:
+            if site[1].start_pos >= scope_node.end_pos:
+                break
+            yield site
+
+
+@inference_state_function_cache()
+def _get_mutation_index(inference_state, module_node):
+    return _MutationIndex(module_node)
 
 
 @inference_state_method_cache(default=NO_VALUES)
 @debug.increase_indent
-def _internal_check_array_additions(context, sequence):
+def _internal_check_array_additions(context, sequence, node):
     """
     Checks if a `Array` has "add" (append, insert, extend) statements:
 
@@ -70,39 +491,27 @@ def _internal_check_array_additions(context, sequence):
                 result |= set(lazy_value.infer().iterate())
         return result
 
-    temp_param_add, settings.dynamic_params_for_other_modules = \
-        settings.dynamic_params_for_other_modules, False
+    inference_state = context.inference_state
+    index = _get_mutation_index(inference_state, module_context.tree_node)
+    receiver_names = None if node is None else index.get_receiver_names(node)
 
     is_list = sequence.name.string_name == 'list'
     search_names = (['append', 'extend', 'insert'] if is_list else ['add', 'update'])
 
     added_types = set()
-    for add_name in search_names:
-        try:
-            possible_names = module_context.tree_node.get_used_names()[add_name]
-        except KeyError:
-            continue
-        else:
-            for name in possible_names:
-                value_node = context.tree_node
-                if not (value_node.start_pos < name.start_pos < value_node.end_pos):
-                    continue
-                trailer = name.parent
-                power = trailer.parent
-                trailer_pos = power.children.index(trailer)
-                try:
-                    execution_trailer = power.children[trailer_pos + 1]
-                except IndexError:
+    # Dynamic params in other modules are not searched while searching for
+    # array additions, because that would be really slow.
+    inference_state.dynamic_array_search_depth += 1
+    try:
+        for add_name in search_names:
+            for receiver, name, execution_trailer in index.iter_sites(add_name, context.tree_node):
+                if receiver_names is not None and receiver is not None \
+                        and receiver not in receiver_names:
                     continue
-                else:
-                    if execution_trailer.type != 'trailer' \
-                            or execution_trailer.children[0] != '(' \
-                            or execution_trailer.children[1] == ')':
-                        continue
 
                 random_context = context.create_context(name)
-
-                with recursion.execution_allowed(context.inference_state, power) as allowed:
+                power = execution_trailer.parent
+                with recursion.execution_allowed(inference_state, power) as allowed:
                     if allowed:
                         found = infer_call_of_leaf(
                             random_context,
@@ -116,9 +525,20 @@ def _internal_check_array_additions(context, sequence):
                                 execution_trailer.children[1],
                                 add_name
                             )
-
-    # reset settings
-    settings.dynamic_params_for_other_modules = temp_param_add
+    finally:
+        inference_state.dynamic_array_search_depth -= 1
+
+    if node is not None:
+        def handle_site(random_context, add_name, execution_trailer):
+            added_types.update(find_additions(
+                random_context,
+                execution_trailer.children[1],
+                add_name
+            ))
+
+        # Class level containers are often modified outside of the class.
+        _search_other_modules(context, node, search_names, handle_site,
+                              include_own_module=context.tree_node.type != 'file_input')
     debug.dbg('Dynamic array result %s', added_types, color='MAGENTA')
     return added_types
 
@@ -159,7 +579,9 @@ class _DynamicArrayAdditions(HelperValueMixin):
 
         from jedi.inference.arguments import TreeArguments
         if isinstance(arguments, TreeArguments):
-            additions = _internal_check_array_additions(arguments.context, self._instance)
+            node = None if arguments.trailer is None else arguments.trailer.parent
+            additions = _internal_check_array_additions(
+                arguments.context, self._instance, node)
             yield from additions
 
     def iterate(self, contextualized_node=None, is_async=False):
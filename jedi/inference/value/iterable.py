@@ -18,7 +18,8 @@ from jedi.inference.base_value import ValueSet, Value, NO_VALUES, \
     LazyValueWrapper
 from jedi.parser_utils import get_sync_comp_fors
 from jedi.inference.context import CompForContext
-from jedi.inference.value.dynamic_arrays import check_array_additions
+from jedi.inference.value.dynamic_arrays import check_array_additions, \
+    check_dict_additions
 
 
 class IterableMixin:
@@ -447,6 +448,9 @@ class DictLiteralValue(_DictMixin, SequenceLiteralValue, _DictKeyMixin):
                 for key_v in k.execute_operation(compiled_value_index, '=='):
                     if key_v.get_safe_value():
                         return self._defining_context.infer_node(value)
+        for keys, values in check_dict_additions(self._defining_context, self):
+            if any(k.get_safe_value(default=None) == index for k in keys):
+                return values
         raise SimpleGetItemNotFound('No key found in dictionary %s.' % self)
 
     def py__iter__(self, contextualized_node=None):
@@ -458,6 +462,8 @@ class DictLiteralValue(_DictMixin, SequenceLiteralValue, _DictKeyMixin):
         types = NO_VALUES
         for k, _ in self.get_tree_entries():
             types |= self._defining_context.infer_node(k)
+        for keys, _ in check_dict_additions(self._defining_context, self):
+            types |= keys
         # We don't know which dict index comes first, therefore always
         # yield all the types.
         for _ in types:
@@ -494,12 +500,16 @@ class DictLiteralValue(_DictMixin, SequenceLiteralValue, _DictKeyMixin):
         return ValueSet.from_sets(
             self._defining_context.infer_node(v)
             for k, v in self.get_tree_entries()
+        ) | ValueSet.from_sets(
+            values for _, values in check_dict_additions(self._defining_context, self)
         )
 
     def _dict_keys(self):
         return ValueSet.from_sets(
             self._defining_context.infer_node(k)
             for k, v in self.get_tree_entries()
+        ) | ValueSet.from_sets(
+            keys for keys, _ in check_dict_additions(self._defining_context, self)
         )
 
 
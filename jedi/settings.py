@@ -35,11 +35,19 @@ Dynamic stuff
 ~~~~~~~~~~~~~
 
 .. autodata:: dynamic_array_additions
+.. autodata:: dynamic_additions_for_other_modules
+.. autodata:: dynamic_additions_time_limit
 .. autodata:: dynamic_params
 .. autodata:: dynamic_params_for_other_modules
 .. autodata:: auto_import_modules
 
 
+Inference limits
+~~~~~~~~~~~~~~~~
+
+.. autodata:: inference_budget
+
+
 Caching
 ~~~~~~~
 
@@ -118,6 +126,22 @@ dynamic_array_additions = True
 check for `append`, etc. on arrays: [], {}, () as well as list/set calls.
 """
 
+dynamic_additions_for_other_modules = False
+"""
+Also check the other modules of the project for additions to module and class
+level lists, sets and dicts, e.g. ``registry.append(cls)`` or
+``REGISTRY[key] = Handler``. The modules are found with the index of
+:mod:`jedi.inference.call_sites`. This is off by default, because it can be
+slow.
+"""
+
+dynamic_additions_time_limit = 0.2
+"""
+The time in seconds that may be spent per API call searching other modules
+for additions, see :data:`dynamic_additions_for_other_modules`. This includes
+updating the index and parsing the modules.
+"""
+
 dynamic_params = True
 """
 A dynamic param completion, finds the callees of the function, which define
@@ -126,7 +150,8 @@ the params of a function.
 
 dynamic_params_for_other_modules = True
 """
-Do the same for other modules.
+Do the same for other modules. The modules of the project that call a function
+are found with an index that is persisted in :data:`cache_directory`.
 """
 
 dynamic_flow_information = True
@@ -152,6 +177,18 @@ Generally this setting allows Jedi to execute __getitem__ and descriptors like
 `property`.
 """
 
+# ----------------
+# Inference Limits
+# ----------------
+
+inference_budget = 'interactive'
+"""
+The limits of the inference that are used if a :class:`.Script` is created
+without a ``budget``. Either the name of one of the
+:data:`jedi.inference.recursion.PROFILES` (``'interactive'``, ``'analysis'``,
+``'batch'``) or a :class:`jedi.inference.recursion.InferenceBudget`.
+"""
+
 # ----------------
 # Caching Validity
 # ----------------
@@ -160,4 +197,8 @@ call_signatures_validity = 3.0
 """
 Finding function calls might be slow (0.1-0.5s). This is not acceptible for
 normal writing. Therefore cache it for a short time.
+
+.. deprecated:: 0.20.1
+    Signatures are now cached until their definitions change, this setting
+    is not used anymore.
 """
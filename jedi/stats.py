@@ -0,0 +1,112 @@
+"""
+Counters and timers for the hot paths of |jedi|, e.g. parsing, imports,
+subprocess calls and memoization. They are only collected if enabled with
+:func:`jedi.set_stats_function`, otherwise the overhead is a single check.
+
+The statistics are collected per API call (e.g. :meth:`.Script.complete`).
+After the call they are available as ``Script.last_stats`` and are passed to
+the stats function (if there is one). They look like this::
+
+    {
+        'name': 'complete',
+        'counters': {'parse': 1, 'subprocess': 3, 'subprocess_bytes_sent': 640, ...},
+        'timers': {'total': 0.05, 'parse': 0.01, 'subprocess': 0.002, ...},
+        'memoize': {'jedi.inference.value.klass.ClassMixin.py__mro__':
+                    {'hits': 20, 'misses': 3}, ...},
+    }
+
+Timers are in seconds, every timer has a counter with the same name that
+counts how often the timed code ran.
+
+API calls in different threads (or asyncio tasks) are collected separately.
+"""
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, Optional
+
+enabled = False
+
+# callback, interface: dict of statistics
+stats_function: Optional[Callable[[dict], None]] = None
+
+_current: "ContextVar[Optional[Stats]]" = ContextVar('jedi_stats', default=None)
+
+# Returns the statistics of the API call that is currently running in this
+# thread, None if statistics are disabled or no API call is running.
+get_current = _current.get
+
+
+class Stats:
+    def __init__(self, name):
+        self.name = name
+        self.counters = Counter()
+        self.timers = Counter()
+        self.memoize = {}
+
+    def memoize_lookup(self, function, hit):
+        try:
+            counts = self.memoize[function]
+        except KeyError:
+            counts = self.memoize[function] = [0, 0]
+        counts[not hit] += 1
+
+    def as_dict(self):
+        return dict(
+            name=self.name,
+            counters=dict(self.counters),
+            timers=dict(self.timers),
+            memoize={
+                '%s.%s' % (function.__module__, function.__qualname__):
+                    dict(hits=hits, misses=misses)
+                for function, (hits, misses) in self.memoize.items()
+            },
+        )
+
+    def __repr__(self):
+        return '<%s: %s>' % (self.__class__.__name__, self.name)
+
+
+def increment(name, value=1):
+    stats = _current.get()
+    if stats is not None:
+        stats.counters[name] += value
+
+
+@contextmanager
+def timer(name):
+    stats = _current.get()
+    if stats is None:
+        yield
+        return
+
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        stats.timers[name] += time.perf_counter() - start
+        stats.counters[name] += 1
+
+
+@contextmanager
+def collect(name):
+    """
+    Collects the statistics of an API call. API calls that happen while
+    another one is running are counted as part of the outer one, in that case
+    (or if statistics are disabled) ``None`` is yielded.
+    """
+    if not enabled or _current.get() is not None:
+        yield None
+        return
+
+    stats = Stats(name)
+    token = _current.set(stats)
+    start = time.perf_counter()
+    try:
+        yield stats
+    finally:
+        stats.timers['total'] = time.perf_counter() - start
+        _current.reset(token)
+        if stats_function is not None:
+            stats_function(stats.as_dict())
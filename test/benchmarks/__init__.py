@@ -0,0 +1,14 @@
+"""
+Benchmarks for the public API of Jedi.
+
+The benchmarks run against synthetic projects that are generated locally (see
+:mod:`test.benchmarks.corpus`), so results are comparable between commits and
+machines do not need any third party libraries. Run them with::
+
+    python -m test.benchmarks --output new.json --compare old.json
+
+The JSON output contains latency percentiles, the peak memory (measured with
+:mod:`tracemalloc`) and the number of calls to the environment subprocess for
+every benchmark. ``--compare`` reports regressions against an older result and
+exits with a non-zero status if there are any.
+"""
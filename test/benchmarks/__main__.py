@@ -0,0 +1,62 @@
+import argparse
+import json
+import sys
+import tempfile
+
+import jedi
+from test.benchmarks.corpus import generate_project
+from test.benchmarks.runner import BENCHMARKS, run_benchmarks, compare
+
+
+def main(args):
+    parser = argparse.ArgumentParser(prog='python -m test.benchmarks')
+    parser.add_argument('names', nargs='*', metavar='name',
+                        help='Only run these benchmarks (%s).' % ', '.join(BENCHMARKS))
+    parser.add_argument('-n', '--repeat', type=int, default=5,
+                        help='Number of warm runs per benchmark.')
+    parser.add_argument('--modules', type=int, default=10,
+                        help='Number of modules in the generated corpus.')
+    parser.add_argument('--chain-depth', type=int, default=30,
+                        help='Depth of the generated decorator and recursion chains.')
+    parser.add_argument('-o', '--output', help='Write the JSON result to this file.')
+    parser.add_argument('--compare', help='Compare with an older JSON result.')
+    parser.add_argument('--threshold', type=float, default=0.25,
+                        help='Relative slowdown that counts as a regression.')
+    parser.add_argument('-I', '--interpreter-env', action='store_true',
+                        help="Don't use a subprocess for the environment.")
+    options = parser.parse_args(args)
+    for name in options.names:
+        if name not in BENCHMARKS:
+            parser.error('Unknown benchmark: %s' % name)
+
+    environment = jedi.InterpreterEnvironment() if options.interpreter_env else None
+    with tempfile.TemporaryDirectory(prefix='jedi-corpus-') as path:
+        corpus = generate_project(path, modules=options.modules,
+                                  chain_depth=options.chain_depth)
+        result = run_benchmarks(
+            corpus,
+            repeat=options.repeat,
+            names=options.names or None,
+            environment=environment,
+        )
+    result['corpus'] = dict(modules=options.modules, chain_depth=options.chain_depth)
+
+    output = json.dumps(result, indent=2, sort_keys=True)
+    if options.output:
+        with open(options.output, 'w') as f:
+            f.write(output)
+    else:
+        print(output)
+
+    if options.compare:
+        with open(options.compare) as f:
+            old = json.load(f)
+        messages = compare(old, result, threshold=options.threshold)
+        for message in messages:
+            print(message, file=sys.stderr)
+        return 1 if messages else 0
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
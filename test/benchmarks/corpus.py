@@ -0,0 +1,257 @@
+"""
+Generates deterministic Python projects that are used as benchmark corpora.
+
+The size of a project is configurable, which makes it possible to check how
+Jedi scales with the size of a project (see :mod:`test.benchmarks.scaling`).
+A generated project contains:
+
+- A package ``benchpkg`` with ``modules`` modules, optionally spread over
+  ``packages`` sub packages.
+- One model class per module. Every model inherits from the model of the
+  previous module, until a hierarchy is ``hierarchy_depth`` classes deep.
+- A chain of imports, each module imports the previous module.
+- Star imports of ``benchpkg.base`` in every third module.
+- Calls of the untyped function ``benchpkg.base.consume`` in every module,
+  which need dynamic params to be inferred.
+- A ``tests`` folder with a ``conftest.py`` that defines a fixture per model
+  and tests that use them.
+- Optionally Django like models in ``benchpkg/djangomodels.py``.
+- Optionally deep inference chains in ``benchpkg/chains.py``: A function with
+  ``chain_depth`` decorators and a recursive tree model that is ``chain_depth``
+  nodes deep, like an ORM.
+"""
+import os
+from textwrap import dedent
+
+
+class Corpus:
+    """
+    A generated project. ``positions`` maps the name of a query to the
+    ``(path, line, column)`` that is used for it.
+    """
+    def __init__(self, path, main_path, positions):
+        self.path = path
+        self.main_path = main_path
+        self.positions = positions
+
+
+def _write(path, code):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w') as f:
+        f.write(code)
+
+
+def _position(code, search, offset=0):
+    """Returns the ``(line, column)`` of the first occurrence of ``search``."""
+    index = code.index(search) + offset
+    line = code.count('\n', 0, index) + 1
+    return line, index - (code.rfind('\n', 0, index) + 1)
+
+
+def _module_parent(i, packages):
+    if packages <= 1:
+        return 'benchpkg'
+    return 'benchpkg.pkg_%s' % (i % packages)
+
+
+def _generate_model_module(i, methods, packages, hierarchy_depth):
+    lines = []
+    if i % 3 == 0:
+        lines.append('from benchpkg.base import *')
+    else:
+        lines.append('from benchpkg.base import Base, helper, consume')
+    if i:
+        lines.append('from %s import models_%s' % (_module_parent(i - 1, packages), i - 1))
+    if i % hierarchy_depth:
+        base = 'models_%s.Model%s' % (i - 1, i - 1)
+    else:
+        base = 'Base'
+    lines += ['', '', 'class Model%s(%s):' % (i, base)]
+    lines += [
+        '    def __init__(self, name, size=0):',
+        '        self.name = name',
+        '        self.size = helper(size)',
+    ]
+    for k in range(methods):
+        lines.append('')
+        lines.append('    def method_%s(self, arg):' % k)
+        if i:
+            lines.append('        return models_%s.make_%s(self.name).method_%s(arg)'
+                         % (i - 1, i - 1, k))
+        else:
+            lines.append('        return helper(arg) + self.size')
+    lines += [
+        '', '',
+        'def make_%s(name):' % i,
+        '    return Model%s(name)' % i,
+        '',
+        '',
+        'consume(make_%s("consumed"))' % i,
+        '',
+    ]
+    return '\n'.join(lines)
+
+
+def _generate_tests(modules, packages):
+    conftest = ['import pytest', '']
+    for i in range(modules):
+        conftest += [
+            'from %s import models_%s' % (_module_parent(i, packages), i),
+            '',
+            '',
+            '@pytest.fixture',
+            'def model_%s():' % i,
+            '    return models_%s.make_%s("fixture")' % (i, i),
+            '',
+        ]
+    tests = []
+    for i in range(modules):
+        tests += [
+            '',
+            'def test_model_%s(model_%s):' % (i, i),
+            '    assert model_%s.method_0(1)' % i,
+            '',
+        ]
+    return '\n'.join(conftest), '\n'.join(tests)
+
+
+def _generate_django_models(modules):
+    lines = ['from django.db import models', '']
+    for i in range(modules):
+        lines += [
+            '',
+            'class Record%s(models.Model):' % i,
+            '    name = models.CharField(max_length=100)',
+            '    count = models.IntegerField(default=0)',
+        ]
+        if i:
+            lines.append('    parent = models.ForeignKey(Record%s, on_delete=models.CASCADE)'
+                         % (i - 1))
+        lines.append('')
+    lines.append('Record%s.objects.get().par' % (modules - 1))
+    return '\n'.join(lines)
+
+
+def _generate_chains(depth):
+    lines = []
+    for i in range(depth):
+        lines += [
+            'def decorator_%s(func):' % i,
+            '    def wrapper(value):',
+            '        return func(value)',
+            '    return wrapper',
+            '',
+            '',
+        ]
+    lines += ['@decorator_%s' % i for i in range(depth)]
+    lines += [
+        'def decorated(value):',
+        '    return [value]',
+        '',
+        '',
+        'class Node:',
+        '    def __init__(self, value, parent=None):',
+        '        self.value = value',
+        '        self.parent = parent',
+        '',
+        '    def child(self, value):',
+        '        return Node(value, self)',
+        '',
+        '    def root(self):',
+        '        if self.parent:',
+        '            return self.parent.root()',
+        '        return self',
+        '',
+        '',
+        'result = decorated(1)',
+        'node = Node(0)' + ''.join('.child(%s)' % i for i in range(depth)) + '.root()',
+        '',
+    ]
+    return '\n'.join(lines)
+
+
+def generate_project(path, modules=10, methods=5, packages=1, hierarchy_depth=5,
+                     tests=True, django=False, chain_depth=0):
+    """
+    Writes a project to ``path`` and returns a :class:`Corpus`.
+    """
+    package = os.path.join(path, 'benchpkg')
+    _write(os.path.join(package, '__init__.py'), '')
+    base_path = os.path.join(package, 'base.py')
+    base_code = dedent('''\
+        __all__ = ['Base', 'helper', 'consume']
+
+
+        def helper(value, factor=2):
+            """Multiplies a value."""
+            return value * factor
+
+
+        def consume(item):
+            return item
+
+
+        class Base:
+            def describe(self, verbose=False):
+                return str(self)
+        ''')
+    _write(base_path, base_code)
+
+    for j in range(packages if packages > 1 else 0):
+        _write(os.path.join(package, 'pkg_%s' % j, '__init__.py'), '')
+
+    for i in range(modules):
+        _write(
+            os.path.join(path, *_module_parent(i, packages).split('.'), 'models_%s.py' % i),
+            _generate_model_module(i, methods, packages, hierarchy_depth),
+        )
+
+    positions = {}
+    if tests:
+        conftest, test_code = _generate_tests(modules, packages)
+        _write(os.path.join(path, 'tests', 'conftest.py'), conftest)
+        test_path = os.path.join(path, 'tests', 'test_models.py')
+        _write(test_path, test_code)
+        positions['infer_fixture'] = (test_path,) + _position(
+            test_code, 'model_%s.method_0' % (modules - 1))
+
+    if django:
+        django_path = os.path.join(package, 'djangomodels.py')
+        django_code = _generate_django_models(modules)
+        _write(django_path, django_code)
+        positions['complete_django'] = (django_path,) + _position(django_code, '.par', 4)
+
+    if chain_depth:
+        chains_path = os.path.join(package, 'chains.py')
+        chains_code = _generate_chains(chain_depth)
+        _write(chains_path, chains_code)
+        positions['infer_deep_chain'] = (chains_path,) + _position(chains_code, 'result =')
+        positions['infer_recursive_model'] = (chains_path,) + _position(chains_code, 'node =')
+
+    last = modules - 1
+    main = dedent('''\
+        from benchpkg.base import helper
+        from %(parent)s import models_%(last)s
+
+        model = models_%(last)s.make_%(last)s('name')
+        result = model.method_0(1)
+        total = helper(result, factor=3)
+        model.met
+        ''' % dict(parent=_module_parent(last, packages), last=last))
+    main_path = os.path.join(path, 'main.py')
+    _write(main_path, main)
+
+    positions.update(
+        complete=_position(main, 'model.met', len('model.met')),
+        infer=_position(main, 'result ='),
+        goto=_position(main, 'make_%s(' % last),
+        get_signatures=_position(main, 'helper(result', len('helper(')),
+        get_references=_position(main, 'helper(result'),
+        rename=_position(main, 'model ='),
+        analysis=(1, 0),
+    )
+    for name, position in positions.items():
+        if len(position) == 2:
+            positions[name] = (main_path,) + position
+    positions['infer_dynamic_param'] = (base_path,) + _position(base_code, 'return item', 7)
+    return Corpus(path, main_path, positions)
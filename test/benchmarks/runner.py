@@ -0,0 +1,239 @@
+"""
+Runs the benchmarks and compares their results.
+"""
+import math
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+import jedi
+from jedi import cache
+from jedi import settings
+from jedi.api import completion_cache, signature_cache
+from jedi.inference import call_sites
+from jedi.inference.compiled.subprocess import CompiledSubprocess
+
+PERCENTILES = (50, 90, 99)
+
+
+def _complete(script, position, project):
+    return script.complete(*position)
+
+
+def _infer(script, position, project):
+    return script.infer(*position)
+
+
+def _goto(script, position, project):
+    return script.goto(*position, follow_imports=True)
+
+
+def _get_signatures(script, position, project):
+    return script.get_signatures(*position)
+
+
+def _get_references(script, position, project):
+    return script.get_references(*position, scope='project')
+
+
+def _search(script, position, project):
+    return list(project.search('method_1'))
+
+
+def _rename(script, position, project):
+    return script.rename(*position, new_name='instance').get_diff()
+
+
+def _analysis(script, position, project):
+    return script._analysis()
+
+
+BENCHMARKS = dict(
+    complete=_complete,
+    infer=_infer,
+    goto=_goto,
+    get_signatures=_get_signatures,
+    get_references=_get_references,
+    search=_search,
+    rename=_rename,
+    analysis=_analysis,
+    infer_fixture=_infer,
+    infer_dynamic_param=_infer,
+    complete_django=_complete,
+    infer_deep_chain=_infer,
+    infer_recursive_model=_infer,
+)
+
+
+class _SubprocessCounter:
+    def __init__(self):
+        self.calls = 0
+
+
+@contextmanager
+def count_subprocess_calls():
+    """Counts the requests that are sent to environment subprocesses."""
+    counter = _SubprocessCounter()
+    original = CompiledSubprocess._send
+
+    def _send(self, *args, **kwargs):
+        counter.calls += 1
+        return original(self, *args, **kwargs)
+
+    CompiledSubprocess._send = _send  # type: ignore[method-assign]
+    try:
+        yield counter
+    finally:
+        CompiledSubprocess._send = original  # type: ignore[method-assign]
+
+
+def clear_caches():
+    """
+    Removes all in memory caches of Jedi, which makes the next run cold.
+    """
+    cache.clear_time_caches(delete_all=True)
+    signature_cache.clear_cache()
+    completion_cache._cache.clear()
+    call_sites.clear_cache()
+
+
+def percentile(values, p):
+    """
+    Nearest rank percentile.
+
+    >>> percentile([1, 2, 3, 4], 50)
+    2
+    >>> percentile([1, 2, 3, 4], 99)
+    4
+    """
+    values = sorted(values)
+    index = max(int(math.ceil(p / 100 * len(values))) - 1, 0)
+    return values[index]
+
+
+def _summarize(timings):
+    summary = dict(min=min(timings), max=max(timings))
+    for p in PERCENTILES:
+        summary['p%s' % p] = percentile(timings, p)
+    return summary
+
+
+def _measure(func):
+    with count_subprocess_calls() as counter:
+        start = time.perf_counter()
+        func()
+        return time.perf_counter() - start, counter.calls
+
+
+def _measure_peak_memory(func):
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def run_benchmark(name, corpus, repeat=5, environment=None):
+    """
+    Runs a single benchmark once cold (after clearing all caches) and
+    ``repeat`` times warm.
+    """
+    project = jedi.Project(corpus.path)
+    path, line, column = corpus.positions.get(name, (corpus.main_path, None, None))
+    with open(path) as f:
+        code = f.read()
+
+    def func():
+        script = jedi.Script(code, path=path, project=project, environment=environment)
+        return BENCHMARKS[name](script, (line, column), project)
+
+    old_cache_directory = settings.cache_directory
+    settings.cache_directory = tempfile.mkdtemp(prefix='jedi-benchmark-')
+    try:
+        clear_caches()
+        cold, cold_calls = _measure(func)
+        warm = []
+        warm_calls = []
+        for _ in range(repeat):
+            timing, calls = _measure(func)
+            warm.append(timing)
+            warm_calls.append(calls)
+        peak_memory = _measure_peak_memory(func)
+    finally:
+        shutil.rmtree(settings.cache_directory, ignore_errors=True)
+        settings.cache_directory = old_cache_directory
+
+    return dict(
+        cold=cold,
+        warm=_summarize(warm),
+        peak_memory=peak_memory,
+        subprocess_calls=dict(cold=cold_calls, warm=max(warm_calls)),
+    )
+
+
+def available_benchmarks(corpus):
+    return [name for name in BENCHMARKS if name in corpus.positions or name == 'search']
+
+
+def run_benchmarks(corpus, repeat=5, names=None, environment=None):
+    """
+    Runs all benchmarks (or the ones in ``names``) on a corpus and returns a
+    JSON serializable result.
+    """
+    if names is None:
+        names = available_benchmarks(corpus)
+    return dict(
+        jedi_version=jedi.__version__,
+        python_version='.'.join(map(str, sys.version_info[:3])),
+        platform=sys.platform,
+        repeat=repeat,
+        benchmarks={
+            name: run_benchmark(name, corpus, repeat=repeat, environment=environment)
+            for name in names
+        },
+    )
+
+
+def compare(old, new, threshold=0.25):
+    """
+    Compares two results of :func:`run_benchmarks` and returns a list of
+    regression messages. Timings are regressions if they are more than
+    ``threshold`` (relative) slower, subprocess calls if there are more.
+
+    >>> old = dict(benchmarks=dict(infer=dict(
+    ...     cold=1.0, warm=dict(p50=0.1), subprocess_calls=dict(cold=3, warm=0))))
+    >>> new = dict(benchmarks=dict(infer=dict(
+    ...     cold=1.1, warm=dict(p50=0.2), subprocess_calls=dict(cold=3, warm=1))))
+    >>> for message in compare(old, new):
+    ...     print(message)
+    infer: warm p50 0.1000s -> 0.2000s (+100%)
+    infer: warm subprocess calls 0 -> 1
+    """
+    messages = []
+    for name, new_result in new['benchmarks'].items():
+        try:
+            old_result = old['benchmarks'][name]
+        except KeyError:
+            continue
+
+        for label, old_time, new_time in [
+            ('cold', old_result['cold'], new_result['cold']),
+            ('warm p50', old_result['warm']['p50'], new_result['warm']['p50']),
+        ]:
+            if new_time > old_time * (1 + threshold):
+                messages.append('%s: %s %.4fs -> %.4fs (+%d%%)' % (
+                    name, label, old_time, new_time,
+                    round((new_time / old_time - 1) * 100),
+                ))
+        for kind in ('cold', 'warm'):
+            old_calls = old_result['subprocess_calls'][kind]
+            new_calls = new_result['subprocess_calls'][kind]
+            if new_calls > old_calls:
+                messages.append('%s: %s subprocess calls %s -> %s' % (
+                    name, kind, old_calls, new_calls,
+                ))
+    return messages
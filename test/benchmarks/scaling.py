@@ -0,0 +1,118 @@
+"""
+Measures how the latency of the API grows with the size of a project.
+
+Projects of different sizes are generated with
+:func:`test.benchmarks.corpus.generate_project` and every benchmark is run on
+each of them. The output is a table and a plot of the warm median latency per
+size and the growth exponent, i.e. the slope in a log-log plot. An exponent
+below 1 means that a benchmark scales sublinearly::
+
+    python -m test.benchmarks.scaling --sizes 10 50 100 --output scaling.json
+"""
+import argparse
+import json
+import math
+import sys
+import tempfile
+
+import jedi
+from test.benchmarks.corpus import generate_project
+from test.benchmarks.runner import available_benchmarks, run_benchmark
+
+_PLOT_WIDTH = 50
+
+
+def measure_scaling(sizes, names=None, repeat=3, environment=None, **corpus_options):
+    """
+    Returns a dict of benchmark name -> list of ``(size, cold, warm p50)``.
+    """
+    results = {}
+    for size in sizes:
+        with tempfile.TemporaryDirectory(prefix='jedi-corpus-') as path:
+            corpus = generate_project(path, modules=size, **corpus_options)
+            for name in names or available_benchmarks(corpus):
+                try:
+                    result = run_benchmark(name, corpus, repeat=repeat,
+                                           environment=environment)
+                except Exception as e:
+                    # A crash for one size shouldn't stop the whole run.
+                    print('%s failed for size %s: %r' % (name, size, e), file=sys.stderr)
+                    continue
+                results.setdefault(name, []).append(
+                    (size, result['cold'], result['warm']['p50'])
+                )
+    return results
+
+
+def growth_exponent(points):
+    """
+    Least squares fit of the slope of ``log(time)`` over ``log(size)``.
+
+    >>> growth_exponent([(10, 1.0), (100, 10.0), (1000, 100.0)])
+    1.0
+    >>> growth_exponent([(10, 1.0), (100, 1.0)])
+    0.0
+    """
+    points = [(math.log(size), math.log(max(t, 1e-9))) for size, t in points]
+    if len(points) < 2:
+        return None
+    mean_x = sum(x for x, _ in points) / len(points)
+    mean_y = sum(y for _, y in points) / len(points)
+    denominator = sum((x - mean_x) ** 2 for x, _ in points)
+    if not denominator:
+        return None
+    slope = sum((x - mean_x) * (y - mean_y) for x, y in points) / denominator
+    return round(slope, 2)
+
+
+def format_report(results):
+    lines = []
+    for name, rows in results.items():
+        exponent = growth_exponent([(size, warm) for size, _, warm in rows])
+        lines.append('%s (growth exponent: %s)' % (name, exponent))
+        maximum = max(warm for _, _, warm in rows) or 1
+        for size, cold, warm in rows:
+            bar = '#' * max(int(round(warm / maximum * _PLOT_WIDTH)), 1)
+            lines.append('%8d  cold %9.4fs  warm %9.4fs  %s' % (size, cold, warm, bar))
+        lines.append('')
+    return '\n'.join(lines)
+
+
+def main(args):
+    parser = argparse.ArgumentParser(prog='python -m test.benchmarks.scaling')
+    parser.add_argument('names', nargs='*', metavar='name', help='Only run these benchmarks.')
+    parser.add_argument('--sizes', nargs='+', type=int, default=[5, 20, 50],
+                        help='Number of modules of the generated projects.')
+    parser.add_argument('-n', '--repeat', type=int, default=3,
+                        help='Number of warm runs per benchmark.')
+    parser.add_argument('--packages', type=int, default=1,
+                        help='Number of sub packages the modules are spread over.')
+    parser.add_argument('--hierarchy-depth', type=int, default=5,
+                        help='Maximum depth of the generated class hierarchies.')
+    parser.add_argument('--django', action='store_true', help='Generate Django models.')
+    parser.add_argument('--chain-depth', type=int, default=0,
+                        help='Depth of the generated decorator and recursion chains.')
+    parser.add_argument('-o', '--output', help='Write the JSON result to this file.')
+    parser.add_argument('-I', '--interpreter-env', action='store_true',
+                        help="Don't use a subprocess for the environment.")
+    options = parser.parse_args(args)
+
+    results = measure_scaling(
+        options.sizes,
+        names=options.names or None,
+        repeat=options.repeat,
+        environment=jedi.InterpreterEnvironment() if options.interpreter_env else None,
+        packages=options.packages,
+        hierarchy_depth=options.hierarchy_depth,
+        django=options.django,
+        chain_depth=options.chain_depth,
+    )
+    print(format_report(results))
+    if options.output:
+        with open(options.output, 'w') as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
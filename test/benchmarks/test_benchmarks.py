@@ -0,0 +1,59 @@
+"""
+Makes sure that the benchmarks keep working. These are not benchmarks
+themselves, use ``python -m test.benchmarks`` for that.
+"""
+import json
+
+from test.benchmarks.corpus import generate_project
+from test.benchmarks.runner import run_benchmarks, compare
+from test.benchmarks.scaling import measure_scaling, format_report
+from test.benchmarks.__main__ import main
+
+
+def test_corpus_positions(tmpdir):
+    corpus = generate_project(str(tmpdir), modules=2)
+    path, line, column = corpus.positions['get_signatures']
+    with open(path) as f:
+        lines = f.read().splitlines()
+    assert lines[line - 1][:column].endswith('helper(')
+
+
+def test_run_benchmarks(tmpdir, environment):
+    corpus = generate_project(str(tmpdir), modules=2)
+    result = run_benchmarks(corpus, repeat=2, names=['infer', 'get_signatures'],
+                            environment=environment)
+    assert set(result['benchmarks']) == {'infer', 'get_signatures'}
+    infer = result['benchmarks']['infer']
+    assert infer['warm']['min'] <= infer['warm']['p50'] <= infer['warm']['max']
+    assert infer['peak_memory'] > 0
+    assert compare(result, result) == []
+
+
+def test_main(tmpdir, capsys):
+    output = tmpdir.join('result.json')
+    assert main(['get_signatures', '-n', '1', '--modules', '2', '-o', str(output)]) == 0
+    assert main(['get_signatures', '-n', '1', '--modules', '2',
+                 '--compare', str(output), '--threshold', '1000']) == 0
+    assert json.loads(output.read())['corpus'] == dict(modules=2, chain_depth=30)
+
+
+def test_corpus_options(tmpdir):
+    corpus = generate_project(str(tmpdir), modules=4, packages=2, django=True)
+    assert tmpdir.join('benchpkg', 'pkg_1', 'models_3.py').check()
+    assert 'complete_django' in corpus.positions
+    assert 'infer_fixture' in corpus.positions
+    assert 'infer_deep_chain' not in corpus.positions
+
+
+def test_deep_chains(tmpdir, environment):
+    corpus = generate_project(str(tmpdir), modules=2, chain_depth=5)
+    result = run_benchmarks(corpus, repeat=1, environment=environment,
+                            names=['infer_deep_chain', 'infer_recursive_model'])
+    assert set(result['benchmarks']) == {'infer_deep_chain', 'infer_recursive_model'}
+
+
+def test_measure_scaling(environment):
+    results = measure_scaling([2, 3], names=['get_signatures'], repeat=1,
+                              environment=environment)
+    assert [size for size, cold, warm in results['get_signatures']] == [2, 3]
+    assert 'get_signatures' in format_report(results)
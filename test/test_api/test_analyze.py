@@ -0,0 +1,65 @@
+import json
+
+import jedi
+from jedi.api import analyze
+
+
+def _write(path, code):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(code)
+    return str(path)
+
+
+def test_iter_paths(tmp_path):
+    a = _write(tmp_path / 'a.py', '')
+    b = _write(tmp_path / 'pkg' / 'b.py', '')
+    _write(tmp_path / 'pkg' / 'c.txt', '')
+    _write(tmp_path / 'tests' / 'test_d.py', '')
+
+    assert list(analyze.iter_paths([str(tmp_path)], exclude=['*/tests'])) == [a, b]
+    assert list(analyze.iter_paths([str(tmp_path)], include=['b.py', '*.txt'])) \
+        == [b, str(tmp_path / 'pkg' / 'c.txt')]
+    assert list(analyze.iter_paths([b])) == [b]
+
+
+def test_analyze(tmp_path, capsys):
+    a = _write(tmp_path / 'a.py', 'import os\nos.doesnt_exist\n')
+    b = _write(tmp_path / 'b.py', 'import doesnt_exist\n')
+    _write(tmp_path / 'c.py', 'x = 1\n')
+
+    results = sorted((r for results in analyze.analyze([a, b], jobs=2) for r in results),
+                     key=lambda r: r['path'])
+    assert [(r['path'], r['line'], r['code']) for r in results] == [(a, 2, 'E1'), (b, 1, 'E3')]
+
+    assert analyze.main(['-j', '1', str(tmp_path)]) == 1
+    lines = capsys.readouterr().out.splitlines()
+    assert [json.loads(line)['name'] for line in lines] == ['attribute-error', 'import-error']
+
+    assert analyze.main(['-j', '1', str(tmp_path / 'c.py')]) == 0
+    assert analyze.analyze_file(a, timeout=1e-6, use_cache=False) == [
+        dict(path=a, failure='timeout after 1e-06s')
+    ]
+
+
+def test_analysis_cache(tmp_path, monkeypatch):
+    main = _write(tmp_path / 'main.py', 'import dep\nimport missing\ndep.x\n')
+    _write(tmp_path / 'dep.py', 'y = 1\n')
+
+    def codes():
+        return [r['code'] for r in analyze.analyze_file(main)]
+
+    assert codes() == ['E3', 'E1']
+
+    class FailingScript:
+        def __init__(self, *args, **kwargs):
+            raise AssertionError('Should have been cached')
+
+    with monkeypatch.context() as m:
+        m.setattr(jedi, 'Script', FailingScript)
+        assert codes() == ['E3', 'E1']
+
+    _write(tmp_path / 'dep.py', 'x = 1\n')
+    assert codes() == ['E3']
+
+    _write(tmp_path / 'missing.py', '')
+    assert codes() == []
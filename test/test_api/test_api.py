@@ -9,7 +9,7 @@ import pytest
 from pytest import raises
 from parso import cache
 
-from jedi import preload_module
+from jedi import preload_module, InferenceBudget
 from jedi.inference.gradual import typeshed
 from test.helpers import test_dir, get_example_dir
 
@@ -412,3 +412,45 @@ def test_infer_after_parentheses(Script, code, column, expected):
         assert completions == []
     else:
         assert [c.name for c in completions] == [expected]
+
+
+def test_infer_and_goto_many(Script):
+    code = dedent('''\
+        import os
+        def f(x):
+            y = x
+            return os.path
+        z = f(1.0)
+        ''')
+    script = Script(code)
+    positions = [(5, 0), (3, 8), (4, 15), (1, 7), (3, 4)]
+    assert [[d.name for d in defs] for defs in script.infer_many(positions)] \
+        == [[d.name for d in script.infer(*pos)] for pos in positions]
+    assert [[d.name for d in defs] for defs in script.goto_many(positions)] \
+        == [[d.name for d in script.goto(*pos)] for pos in positions]
+    assert [[d.line for d in defs] for defs in script.goto_many([(5, 4)])] == [[2]]
+
+    with pytest.raises(ValueError):
+        script.infer_many([(1, 0), (10, 0)])
+
+
+def test_infer_many_like_infer(Script):
+    # The positions don't share anything that infer doesn't share, so even
+    # the limits that apply to a Script as a whole are hit the same way.
+    code = 'class C:\n    def m(self):\n        self.a = 1\n        self.a\n'
+    budget = InferenceBudget(value_infer_limit=6)
+    positions = [(4, 13)] * 4
+    script = Script(code, budget=budget)
+    expected = [[d.name for d in script.infer(*pos)] for pos in positions]
+    assert expected[0] == ['int']
+    assert [[d.name for d in defs] for defs in Script(code, budget=budget).infer_many(positions)] \
+        == expected
+
+
+def test_get_names_with_types(Script):
+    script = Script('def f(): return 1\nx = f()\ny = x\n')
+    names = script.get_names(with_types=True)
+    assert [(n.name, n._inferred is not None) for n in names] \
+        == [('f', True), ('x', True), ('y', True)]
+    assert [[d.name for d in n.infer()] for n in names] == [['f'], ['int'], ['int']]
+    assert [d.name for d in names[2].infer(prefer_stubs=True)] == ['int']
@@ -1,3 +1,4 @@
+import multiprocessing
 import os
 import sys
 
@@ -7,7 +8,8 @@ import jedi
 from jedi.api.environment import get_default_environment, find_virtualenvs, \
     InvalidPythonEnvironment, find_system_environments, \
     get_system_environment, create_environment, InterpreterEnvironment, \
-    get_cached_default_environment
+    get_cached_default_environment, Environment, _environment_registry, \
+    _get_sha256, _calculate_sha256_for_file, _file_hashes
 
 
 def test_sys_path():
@@ -89,6 +91,32 @@ def test_killed_subprocess(inference_state, Script, environment):
     assert def_.name == 'str'
 
 
+def _get_subprocess_in_child(environment, connection):
+    subprocess = environment._get_subprocess()
+    connection.send((subprocess._get_process().pid, subprocess.get_sys_path()))
+
+
+@pytest.mark.skipif(not hasattr(os, 'fork'), reason='fork is not available')
+def test_subprocess_in_forked_process(environment):
+    if isinstance(environment, InterpreterEnvironment):
+        pytest.skip()
+    subprocess = environment._get_subprocess()
+    sys_path = subprocess.get_sys_path()
+    pid = subprocess._get_process().pid
+
+    context = multiprocessing.get_context('fork')
+    receiver, sender = context.Pipe(duplex=False)
+    process = context.Process(target=_get_subprocess_in_child, args=(environment, sender))
+    process.start()
+    # The child starts its own subprocess and leaves the parent's alone.
+    child_pid, child_sys_path = receiver.recv()
+    assert child_pid != pid
+    assert child_sys_path == sys_path
+    process.join()
+    assert environment._get_subprocess() is subprocess
+    assert subprocess.get_sys_path() == sys_path
+
+
 def test_not_existing_virtualenv(monkeypatch):
     """Should not match the path that was given"""
     path = '/foo/bar/jedi_baz'
@@ -152,3 +180,107 @@ def test_changing_venv(venv_path, monkeypatch):
     get_cached_default_environment()
     monkeypatch.setitem(os.environ, 'VIRTUAL_ENV', sys.executable)
     assert get_cached_default_environment().executable == sys.executable
+
+
+def test_environment_registry(monkeypatch):
+    environment = Environment(sys.executable)
+    registry = _environment_registry
+    refreshed = []
+    monkeypatch.setattr(registry, 'schedule_refresh', refreshed.append)
+
+    def _get_subprocess(self):
+        raise AssertionError('The environment should be cached')
+
+    with monkeypatch.context() as m:
+        m.setattr(Environment, '_get_subprocess', _get_subprocess)
+        cached = Environment(sys.executable)
+    assert refreshed == [sys.executable]
+    assert cached.executable == environment.executable
+    assert cached.path == environment.path
+    assert cached.version_info == environment.version_info
+    assert cached.get_sys_path() == environment.get_sys_path()
+
+    # Refreshing updates the entry.
+    registry.update(sys.executable, ('foo', 'bar', (3, 0, 0), []))
+    assert Environment(sys.executable).path == 'bar'
+    registry.refresh(sys.executable)
+    assert Environment(sys.executable).path == environment.path
+
+    # Entries are only used if the executable did not change.
+    monkeypatch.setattr('jedi.api.environment._get_sha256', lambda path: 'changed')
+    assert registry.get(sys.executable) is None
+
+
+def test_environment_registry_validation(tmp_path):
+    executable = tmp_path / 'bin' / 'python'
+    executable.parent.mkdir()
+    executable.write_bytes(b'python')
+    executable.chmod(0o755)
+    path = str(executable)
+    info = (path, str(tmp_path), [3, 0, 0], [])
+    registry = _environment_registry
+
+    def assert_invalidated():
+        assert registry.get(path) is None
+        registry.update(path, info)
+        assert registry.get(path) == info
+
+    registry.update(path, info)
+    assert registry.get(path) == info
+
+    # Changes to pyvenv.cfg change the sys path.
+    cfg = tmp_path / 'pyvenv.cfg'
+    cfg.write_text('include-system-site-packages = false\n')
+    assert_invalidated()
+    cfg.write_text('include-system-site-packages = true\n')
+    assert_invalidated()
+
+    # A replaced interpreter, even with the same content
+    executable.unlink()
+    executable.write_bytes(b'python')
+    executable.chmod(0o755)
+    assert_invalidated()
+
+    if os.name != 'nt':
+        executable.chmod(0o644)
+        assert registry.get(path) is None
+        executable.chmod(0o755)
+
+    executable.unlink()
+    assert registry.get(path) is None
+    registry.remove(path)
+
+
+@pytest.mark.skipif(not hasattr(os, 'register_at_fork'), reason="Needs fork")
+def test_environment_registry_after_fork():
+    # The background thread might hold the lock while the process forks.
+    with _environment_registry._lock:
+        pid = os.fork()
+        if pid == 0:
+            os._exit(0 if _environment_registry._lock.acquire(timeout=5) else 1)
+    _, status = os.waitpid(pid, 0)
+    assert status == 0
+
+
+def test_sha256_of_executable(tmp_path, monkeypatch):
+    executable = tmp_path / 'python'
+    executable.write_bytes(b'a' * 100000)
+    path = str(executable)
+    sha256 = _calculate_sha256_for_file(path)
+    assert _get_sha256(path) == sha256
+
+    calculated = []
+
+    def calculate(path):
+        calculated.append(path)
+        return 'calculated'
+
+    monkeypatch.setattr('jedi.api.environment._calculate_sha256_for_file', calculate)
+    # Hashes are persisted for other processes.
+    _file_hashes.clear()
+    assert _get_sha256(path) == sha256
+    assert calculated == []
+
+    executable.write_bytes(b'b' * 100000)
+    assert _get_sha256(path) == 'calculated'
+    assert calculated == [path]
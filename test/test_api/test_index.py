@@ -0,0 +1,71 @@
+import os
+import time
+
+import jedi
+from jedi.api import index
+
+
+def _write(path, code):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(code)
+    return str(path)
+
+
+def test_index(tmp_path):
+    lib = _write(tmp_path / 'lib.py', 'def foo():\n    return 1\n')
+    main = _write(tmp_path / 'main.py', 'import lib\nx = lib.foo()\nlen(x)\n')
+    other = _write(tmp_path / 'other.py', 'y = 1\n')
+    project = jedi.Project(tmp_path)
+    index_path = str(tmp_path / 'index.sqlite')
+
+    indexed, failures = index.build_index(project, index_path, jobs=2)
+    assert indexed == [lib, main, other]
+    assert failures == []
+
+    with index.Index(index_path) as idx:
+        assert idx.goto(main, 2, 9) == [(lib, 1, 4)]
+        assert idx.goto(main, 3, 0) == [(None, None, None)]
+        assert idx.goto(main, 1, 0) == []
+        assert idx.get_references(lib, 1, 5) == [(lib, 1, 4), (main, 2, 8)]
+        assert idx.search('foo') == [(lib, 1, 4, 'function')]
+        assert idx.get_imports(main) == [lib]
+        assert idx.get_importers(lib) == [main]
+
+    # Nothing changed
+    assert index.build_index(project, index_path) == ([], [])
+
+    # Files that import a changed file are indexed again.
+    time.sleep(0.01)
+    _write(tmp_path / 'lib.py', '\ndef foo():\n    return 1\n')
+    assert index.build_index(project, index_path)[0] == [lib, main]
+    with index.Index(index_path) as idx:
+        assert idx.goto(main, 2, 9) == [(lib, 2, 4)]
+
+    os.remove(other)
+    assert index.build_index(project, index_path)[0] == []
+    with index.Index(index_path) as idx:
+        assert idx.search('y') == []
+
+
+def test_index_references_in_other_modules(tmp_path):
+    a = _write(tmp_path / 'a.py', 'def target():\n    pass\n')
+    b = _write(tmp_path / 'b.py', 'from a import target\ntarget()\n')
+    c = _write(tmp_path / 'c.py', 'import a\na.target()\n')
+    index_path = str(tmp_path / 'index.sqlite')
+    assert index.build_index(jedi.Project(tmp_path), index_path) == ([a, b, c], [])
+
+    with index.Index(index_path) as idx:
+        assert idx.goto(b, 2, 0) == [(a, 1, 4)]
+        assert idx.goto(c, 2, 2) == [(a, 1, 4)]
+        assert idx.get_references(a, 1, 4) \
+            == [(a, 1, 4), (b, 1, 14), (b, 2, 0), (c, 2, 2)]
+
+
+def test_index_path_with_special_characters(tmp_path):
+    tmp_path = tmp_path / 'a?b#c%20d'
+    lib = _write(tmp_path / 'lib.py', 'def foo():\n    return 1\n')
+    index_path = str(tmp_path / 'index.sqlite')
+    assert index.build_index(jedi.Project(tmp_path), index_path) == ([lib], [])
+
+    with index.Index(index_path) as idx:
+        assert idx.search('foo') == [(lib, 1, 4, 'function')]
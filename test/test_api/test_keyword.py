@@ -49,3 +49,19 @@ def test_none_keyword(Script, environment):
     none, = Script('None').complete()
     assert not none.docstring()
     assert none.name == 'None'
+
+
+def test_keyword_docs_index(monkeypatch, tmpdir):
+    from jedi.api import keywords
+
+    monkeypatch.setattr(keywords.settings, 'cache_directory', str(tmpdir))
+    monkeypatch.setattr(keywords, '_keyword_docs', None)
+    docs = keywords.get_keyword_docs()
+    assert docs['def'] == keywords.imitate_pydoc('def')
+    assert 'None' not in docs
+    assert len(tmpdir.listdir()) == 1
+
+    # The persisted index is used in a new process.
+    monkeypatch.setattr(keywords, '_keyword_docs', None)
+    monkeypatch.setattr(keywords, '_build_index', None)
+    assert keywords.get_keyword_docs() == docs
@@ -187,3 +187,49 @@ def test_is_potential_project(path, expected):
             expected = False
 
     assert _is_potential_project(path) == expected
+
+
+def test_sys_path_cache(Script, tmp_path):
+    package = tmp_path.joinpath('pkg', 'sub')
+    package.mkdir(parents=True)
+    script_path = package.joinpath('mod.py')
+    script_path.write_text('')
+    project = Project(tmp_path)
+
+    def get_sys_path():
+        return Script(path=script_path, project=project)._inference_state.get_sys_path()
+
+    sys_path = get_sys_path()
+    assert str(package) in sys_path
+    assert str(package.parent) in sys_path
+    key = str(package), True, False
+    assert project.get_cached_sys_paths()[key] == [str(package.parent), str(package)]
+
+    assert get_sys_path() == sys_path
+
+    # Adding an __init__.py changes the folder and invalidates the cache.
+    package.joinpath('__init__.py').write_text('')
+    os.utime(package, ns=(0, 0))
+    sys_path = get_sys_path()
+    assert str(package) not in sys_path
+    assert project.get_cached_sys_paths()[key] == [str(package.parent)]
+
+
+def test_default_project_cache(tmp_path):
+    folder = tmp_path.joinpath('foo', 'bar')
+    folder.mkdir(parents=True)
+    project = get_default_project(folder)
+    assert project.path == folder
+    assert get_default_project(folder) is project
+
+    # A new marker file changes the folder and invalidates the cache.
+    tmp_path.joinpath('foo', 'setup.py').write_text('')
+    os.utime(tmp_path.joinpath('foo'), ns=(0, 0))
+    project = get_default_project(folder)
+    assert project.path == folder.parent
+    assert get_default_project(folder) is project
+
+    Project(tmp_path, added_sys_path=['/foo']).save()
+    project = get_default_project(folder)
+    assert project.path == tmp_path
+    assert project.added_sys_path == ['/foo']
@@ -133,3 +133,67 @@ def test_diff_path_outside_of_project(Script):
         -foo = 1
         +bar = 1
         ''')
+
+
+def test_rename_underscore_name_in_other_module(Script, tmp_path):
+    a = tmp_path / 'a.py'
+    b = tmp_path / 'b.py'
+    a.write_text('def _helper(): pass\n')
+    b.write_text('from a import _helper\n_helper()\n')
+    script = Script(path=a, project=jedi.Project(tmp_path))
+    refactoring = script.rename(1, 4, new_name='_renamed')
+    assert sorted(refactoring.get_changed_files()) == [a, b]
+    refactoring.apply()
+    assert b.read_text() == 'from a import _renamed\n_renamed()\n'
+
+
+def test_diff_in_parallel_and_atomic_apply(Script, tmp_path, monkeypatch):
+    paths = [tmp_path / ('mod%s.py' % i) for i in range(3)]
+    paths[0].write_text('def foo(): pass\n')
+    for p in paths[1:]:
+        p.write_text('from mod0 import foo\nfoo()\n')
+    script = Script(path=paths[0], project=jedi.Project(tmp_path))
+    refactoring = script.rename(1, 4, new_name='bar')
+
+    from jedi.api import refactoring as refactoring_module
+    monkeypatch.setattr(refactoring_module, '_MIN_FILES_FOR_PROCESSES', 0)
+    parts = list(refactoring.iter_diff(jobs=2))
+    assert len(parts) == 3
+    assert ''.join(parts) == refactoring.get_diff() == refactoring.get_diff(jobs=2)
+
+    import tempfile
+    mkstemp = tempfile.mkstemp
+    calls = []
+
+    def failing_mkstemp(**kwargs):
+        calls.append(kwargs)
+        if len(calls) == 3:
+            raise OSError('No space left on device')
+        return mkstemp(**kwargs)
+
+    with monkeypatch.context() as m:
+        m.setattr(tempfile, 'mkstemp', failing_mkstemp)
+        with pytest.raises(OSError):
+            refactoring.apply()
+    assert [p.read_text() for p in paths] \
+        == ['def foo(): pass\n'] + ['from mod0 import foo\nfoo()\n'] * 2
+    assert sorted(os.listdir(tmp_path)) == ['mod0.py', 'mod1.py', 'mod2.py']
+
+    refactoring.apply()
+    assert [p.read_text() for p in paths] \
+        == ['def bar(): pass\n'] + ['from mod0 import bar\nbar()\n'] * 2
+
+
+@pytest.mark.skipif(not hasattr(os, 'symlink') or os.name == 'nt',
+                    reason='symlinks and modes are different on Windows')
+def test_apply_keeps_symlinks_and_modes(Script, tmp_path):
+    target = tmp_path / 'target.py'
+    target.write_text('foo = 1\n')
+    target.chmod(0o751)
+    link = tmp_path / 'link.py'
+    link.symlink_to(target)
+
+    Script(path=link).rename(1, 0, new_name='bar').apply()
+    assert link.is_symlink()
+    assert target.read_text() == 'bar = 1\n'
+    assert target.stat().st_mode & 0o777 == 0o751
@@ -0,0 +1,61 @@
+from textwrap import dedent
+
+
+def test_semantic_map(Script):
+    code = dedent('''\
+        def f(x):
+            return x
+        y = f(1)
+        undefined
+        len(y)
+        ''')
+    semantic_map = Script(code).get_semantic_map()
+    assert semantic_map.complete
+    assert len(semantic_map) == 8
+    assert list(zip(semantic_map.lines, semantic_map.columns, semantic_map.lengths)) == [
+        (1, 4, 1), (1, 6, 1), (2, 11, 1), (3, 0, 1), (3, 4, 1), (4, 0, 9), (5, 0, 3), (5, 4, 1)
+    ]
+    assert semantic_map.kinds == [
+        'function', 'param', 'param', 'statement', 'function', None, 'function', 'statement'
+    ]
+
+    def target(i):
+        index = semantic_map.targets[i]
+        return None if index == -1 else semantic_map.definitions[index]
+
+    assert [target(i) for i in range(len(semantic_map))] == [
+        (None, 1, 4, '__main__.f'), (None, 1, 6, None), (None, 1, 6, None),
+        (None, 3, 0, '__main__.y'), (None, 1, 4, '__main__.f'), None,
+        (None, None, None, 'builtins.len'), (None, 3, 0, '__main__.y')
+    ]
+
+    def type_name(i):
+        index = semantic_map.types[i]
+        return None if index == -1 else semantic_map.type_names[index]
+
+    assert [type_name(i) for i in range(len(semantic_map))] == [
+        '__main__.f', 'builtins.int', 'builtins.int', 'builtins.int', '__main__.f', None,
+        'builtins.len', 'builtins.int'
+    ]
+
+
+def test_semantic_map_builtins(Script):
+    semantic_map = Script('int\nlen\nint\n').get_semantic_map()
+    assert [semantic_map.definitions[i] for i in semantic_map.targets] == [
+        (None, None, None, 'builtins.int'), (None, None, None, 'builtins.len'),
+        (None, None, None, 'builtins.int'),
+    ]
+    assert len(semantic_map.definitions) == 2
+
+
+def test_semantic_map_time_budget(Script):
+    script = Script('x = 1\nx\n')
+    budget = script._inference_state.budget
+    assert script.get_semantic_map(time_budget=10).complete
+    assert script._inference_state.budget is budget
+
+    semantic_map = Script('x = 1\nx\n').get_semantic_map(time_budget=0)
+    assert not semantic_map.complete
+    assert semantic_map.lines == [1, 2]
+    assert semantic_map.kinds == [None, None]
+    assert semantic_map.targets == semantic_map.types == [-1, -1]
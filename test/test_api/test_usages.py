@@ -62,3 +62,38 @@ foo()
 
     for place in places:
         assert places == [(n.line, n.column) for n in script.get_references(scope='file', *place)]
+
+
+@pytest.mark.parametrize(
+    'code, position, places', [
+        ('def f():\n    x = 1\n    return x\nx = 2\n', (3, 11), [(2, 4), (3, 11)]),
+        ('y = [x for x in []]\nx = 1\n', (1, 5), [(1, 5), (1, 11)]),
+    ]
+)
+def test_references_in_private_scope(Script, monkeypatch, code, position, places):
+    from jedi.inference import references
+
+    def fail(*args, **kwargs):
+        raise AssertionError('The file system should not be searched')
+
+    monkeypatch.setattr(references, 'get_module_contexts_containing_name', fail)
+    refs = Script(code).get_references(*position)
+    assert [(d.line, d.column) for d in refs] == places
+
+
+@pytest.mark.parametrize(
+    'code', [
+        '_x = 1\n__all__ = ["_x"]\n',
+        '_x = 1\ndef f():\n    return _x\n',
+        'x = 1\n',
+        '_x = 2\ndef f():\n    global _x\n    _x = 1\n',
+    ]
+)
+def test_references_not_in_private_scope(Script, monkeypatch, code):
+    from jedi.inference import references
+
+    called = []
+    monkeypatch.setattr(references, 'get_module_contexts_containing_name',
+                        lambda inf, module_contexts, name: called.append(name) or module_contexts)
+    Script(code).get_references(1, 0)
+    assert called
@@ -27,3 +27,86 @@ def test_cache_get_signatures(Script):
 def test_cache_line_split_issues(Script):
     """Should still work even if there's a newline."""
     assert Script('int(\n').get_signatures()[0].name == 'int'
+
+
+def test_cache_signatures_across_scripts(Script, tmpdir):
+    """
+    Signatures are described and reused by later Scripts as long as the
+    definitions don't change.
+    """
+    from jedi.api.signature_cache import DescribedSignature, clear_cache
+    clear_cache()
+
+    path = tmpdir.join('module.py')
+    code = 'def foo(a, b: int = 3, *args, c, **kw):\n    "doc"\nfoo(1, '
+
+    def get_signature(code):
+        sig, = Script(code, path=str(path)).get_signatures()
+        return sig
+
+    first = get_signature(code)
+    assert not isinstance(first._signature, DescribedSignature)
+    cached = get_signature(code + 'x')
+    assert isinstance(cached._signature, DescribedSignature)
+
+    assert cached.to_string() == first.to_string()
+    assert cached.docstring() == first.docstring()
+    assert cached.index == first.index == 1
+    assert cached.type == 'function'
+    assert cached.full_name == 'module.foo'
+    assert [p.description for p in cached.params] == [p.description for p in first.params]
+    assert [p.kind for p in cached.params] == [p.kind for p in first.params]
+    # Everything else is inferred lazily.
+    assert [d.name for d in cached.params[1].infer_default()] == ['int']
+
+    # Changing the definition invalidates the cache.
+    changed = get_signature(code.replace('b: int', 'x: int'))
+    assert not isinstance(changed._signature, DescribedSignature)
+    assert changed.params[1].name == 'x'
+
+
+def test_cache_signatures_resolved_through_other_code(Script, tmpdir):
+    from jedi.api import signature_cache
+    signature_cache.clear_cache()
+
+    tmpdir.join('classes.py').write('class A:\n    def bar(self, a_param): pass\n'
+                                    'class B:\n    def bar(self, b_param): pass\n')
+    factory = tmpdir.join('factory.py')
+    factory.write('from classes import A, B\ndef make():\n    return A()\n')
+    path = str(tmpdir.join('module.py'))
+
+    def get_param_names(code):
+        sig, = Script(code, path=path).get_signatures()
+        return [p.name for p in sig.params]
+
+    assert get_param_names('from factory import make\nmake().bar(') == ['a_param']
+    factory.write('from classes import A, B\ndef make():\n    return B()\n')
+    factory.setmtime(factory.mtime() + 10)
+    assert get_param_names('from factory import make\nmake().bar(') == ['b_param']
+
+    for i in range(signature_cache._CACHE_LIMIT + 1):
+        get_param_names('def f%s(x): pass\nf%s(' % (i, i))
+    assert len(signature_cache._cache) == signature_cache._CACHE_LIMIT
+
+
+def test_cache_signatures_other_file(Script, tmpdir):
+    from jedi.api.signature_cache import DescribedSignature, clear_cache
+    clear_cache()
+
+    tmpdir.join('other.py').write('def bar(x):\n    pass\n')
+    path = str(tmpdir.join('module.py'))
+    code = 'import other\nother.bar('
+
+    def get_signature():
+        sig, = Script(code, path=path).get_signatures()
+        return sig
+
+    assert not isinstance(get_signature()._signature, DescribedSignature)
+    assert isinstance(get_signature()._signature, DescribedSignature)
+
+    other = tmpdir.join('other.py')
+    other.write('def bar(y):\n    pass\n')
+    other.setmtime(other.mtime() + 10)
+    sig = get_signature()
+    assert not isinstance(sig._signature, DescribedSignature)
+    assert sig.params[0].name == 'y'
@@ -0,0 +1,97 @@
+import os
+
+import jedi
+from jedi.inference import call_sites
+
+
+def _write(path, code):
+    path.write_text(code)
+    return path
+
+
+def test_dynamic_params_in_other_module(Script, tmp_path):
+    lib = _write(tmp_path / 'lib.py', 'def process(item):\n    return item\n')
+    for i in range(30):
+        _write(tmp_path / ('unrelated%s.py' % i), 'x = %s\n' % i)
+    _write(tmp_path / 'caller.py', 'from lib import process\nprocess(1.0)\n')
+
+    project = jedi.Project(tmp_path)
+    script = Script(lib.read_text(), path=lib, project=project)
+    assert [d.name for d in script.infer(2, len('    return item'))] == ['float']
+
+
+def test_index_refresh(Script, tmp_path, monkeypatch):
+    monkeypatch.setattr(call_sites, '_REFRESH_INTERVAL', 0)
+    call_sites.clear_cache()
+    a = _write(tmp_path / 'a.py', 'foo(1)\n')
+    _write(tmp_path / 'b.py', 'bar(1)\n')
+    project = jedi.Project(tmp_path)
+
+    def get_paths(name):
+        inference_state = Script('', project=project)._inference_state
+        return call_sites.get_call_site_index(inference_state).get_paths(name)
+
+    assert get_paths('foo') == [str(a)]
+    assert get_paths('baz') == []
+
+    _write(tmp_path / 'b.py', 'foo(2)\nbaz()\n')
+    os.utime(tmp_path / 'b.py', (0, 0))
+    assert sorted(get_paths('foo')) == sorted([str(a), str(tmp_path / 'b.py')])
+    assert get_paths('baz') == [str(tmp_path / 'b.py')]
+
+    os.remove(a)
+    assert get_paths('foo') == [str(tmp_path / 'b.py')]
+
+    # The index is persisted.
+    call_sites.clear_cache()
+    index = call_sites.CallSiteIndex(project.path)
+    index._load()
+    assert sorted(index._files) == [str(tmp_path / 'b.py')]
+
+
+def test_incomplete_index(Script, tmp_path, monkeypatch):
+    call_sites.clear_cache()
+    lib = _write(tmp_path / 'lib.py', 'def process(item):\n    return item\n')
+    _write(tmp_path / 'caller.py', 'from lib import process\nprocess(1.0)\n')
+    project = jedi.Project(tmp_path)
+
+    def infer():
+        script = Script(lib.read_text(), path=lib, project=project)
+        return [d.name for d in script.infer(2, len('    return item'))]
+
+    # Nothing is scanned, the files are searched without the index.
+    monkeypatch.setattr(call_sites, '_SCAN_TIME_LIMIT', 0)
+    assert infer() == ['float']
+    index = call_sites._indexes[project.path]
+    assert not index.complete and index._files == {}
+    last_walk = index._last_walk
+
+    # The remaining files are scanned in the next API calls without searching
+    # the project for changes again.
+    monkeypatch.setattr(call_sites, '_SCAN_TIME_LIMIT', None)
+    assert infer() == ['float']
+    assert index.complete
+    assert index._last_walk == last_walk
+    assert sorted(index._files) == [str(tmp_path / 'caller.py'), str(lib)]
+
+
+def test_removed_file_in_index(Script, tmp_path):
+    call_sites.clear_cache()
+    lib = _write(tmp_path / 'lib.py', 'def process(item):\n    return item\n')
+    caller = _write(tmp_path / 'caller.py', 'from lib import process\nprocess(1.0)\n')
+    _write(tmp_path / 'other.py', 'from lib import process\nprocess("")\n')
+    project = jedi.Project(tmp_path)
+
+    def infer():
+        script = Script(lib.read_text(), path=lib, project=project)
+        return sorted(d.name for d in script.infer(2, len('    return item')))
+
+    # Only the first module with calls is used.
+    assert infer() == ['float']
+    index = call_sites._indexes[project.path]
+    assert index.complete
+
+    # The project is not searched for changes again yet.
+    os.remove(caller)
+    assert infer() == ['str']
+    assert index.get_paths('process') == [str(tmp_path / 'other.py')]
@@ -542,3 +542,38 @@ def test_property(name, docstring, goto_or_complete):
     ''')
     n, = goto_or_complete(code + 'Test().' + name)
     assert n.docstring() == docstring
+
+
+def test_docstring_parse_cache(Script):
+    from jedi.inference import docstrings
+
+    code = dedent('''\
+        def f(a, b):
+            """
+            :type a: str
+            :type b: int
+            :rtype: float
+            """
+            a
+        def g(a, b):
+            """
+            :type a: str
+            :type b: int
+            :rtype: float
+            """
+            b
+        f()
+        ''')
+    script = Script(code)
+    assert [d.name for d in script.infer(7, 5)] == ['str']
+    assert [d.name for d in script.infer(14, 5)] == ['int']
+    assert [d.name for d in script.infer(15, 3)] == ['float']
+
+    docstring = script.infer(1, 4)[0].docstring(raw=True)
+    hits = docstrings._parse_docstring.cache_info().hits
+    assert docstrings._parse_docstring(docstring) == ({'a': ['str'], 'b': ['int']}, ['float'])
+    assert docstrings._parse_docstring.cache_info().hits == hits + 1
+    grammar = script._inference_state.grammar
+    hits = docstrings._parse_type_string.cache_info().hits
+    assert docstrings._parse_type_string(grammar, '\nstr').value == 'str'
+    assert docstrings._parse_type_string.cache_info().hits == hits + 1
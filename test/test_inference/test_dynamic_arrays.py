@@ -0,0 +1,143 @@
+from textwrap import dedent
+import time
+
+import parso
+import pytest
+
+import jedi
+from jedi import settings
+from jedi.inference.value.dynamic_arrays import _MutationIndex
+
+
+def _get_index_and_atom(code, position):
+    module = parso.parse(dedent(code))
+    atom = module.get_leaf_for_position(position).parent
+    return _MutationIndex(module), atom
+
+
+def test_receiver_names():
+    index, atom = _get_index_and_atom('''\
+        def add(lst, value):
+            lst.append(value)
+
+        def get():
+            return arr
+
+        arr = []
+        alias = arr
+        add(arr, 1)
+        other = []
+        other.append(1)
+        get().append('')
+        ''', (7, 6))
+    assert index.get_receiver_names(atom) == {'arr', 'alias', 'lst', 'get'}
+
+    receivers = [receiver for receiver, _, _ in index.iter_sites('append', atom.get_root_node())]
+    assert receivers == ['lst', 'other', 'get']
+
+
+def test_unknown_receiver_names():
+    index, atom = _get_index_and_atom('for x in []:\n    pass\n', (1, 9))
+    assert index.get_receiver_names(atom) is None
+
+
+def test_escaping_receiver_names():
+    index, atom = _get_index_and_atom('a = []\nb = [a]\nprint(a)\n', (1, 4))
+    assert index.get_receiver_names(atom) is None
+
+    index, atom = _get_index_and_atom('a = []\nb = a\nprint(len(b))\n', (1, 4))
+    assert index.get_receiver_names(atom) == {'a', 'b'}
+
+
+@pytest.mark.parametrize(
+    'code', [
+        'b, c = a, 1\nb.append("")',
+        'b = a if c else d\nb.append("")',
+        'b = a or []\nb.append("")',
+        '(b := a).append("")',
+        'for b in [a]:\n    b.append("")',
+        'd = {}\nd["k"] = a\nd["k"].append("")',
+        'ls = [a]\nls[0].append("")',
+        'f = lambda: a\nf().append("")',
+        'class C:\n    def __init__(self, x):\n        self.x = x\nC(a).x.append("")',
+    ]
+)
+def test_additions_through_other_objects(Script, code):
+    code = 'a = []\n%s\na[0]' % code
+    assert [d.name for d in Script(code).infer()] == ['str']
+
+
+def test_additions_in_other_modules(Script, tmp_path, monkeypatch):
+    (tmp_path / 'registry.py').write_text('REGISTRY = {}\nHANDLERS = []\n')
+    (tmp_path / 'handlers.py').write_text(dedent('''\
+        import registry
+        from registry import REGISTRY, HANDLERS
+
+        class Handler: pass
+
+        REGISTRY['json'] = Handler
+        registry.REGISTRY.update(xml=1.0)
+        HANDLERS.append(Handler())
+        '''))
+    main = tmp_path / 'main.py'
+    main.write_text("from registry import REGISTRY, HANDLERS\n"
+                    "REGISTRY['json']\nREGISTRY['xml']\nHANDLERS[0]\n")
+    project = jedi.Project(tmp_path)
+
+    def infer(line):
+        script = Script(path=main, project=project)
+        return [d.name for d in script.infer(line)]
+
+    assert infer(2) == []
+
+    monkeypatch.setattr(settings, 'dynamic_additions_for_other_modules', True)
+    assert infer(2) == ['Handler']
+    assert infer(3) == ['float']
+    assert infer(4) == ['Handler']
+
+    monkeypatch.setattr(settings, 'dynamic_additions_time_limit', 0)
+    assert infer(2) == []
+
+
+def test_additions_time_limit_includes_index(Script, tmp_path, monkeypatch):
+    from jedi.inference import call_sites
+
+    (tmp_path / 'registry.py').write_text('REGISTRY = {}\n')
+    (tmp_path / 'handlers.py').write_text('from registry import REGISTRY\nREGISTRY[1] = 1.0\n')
+    main = tmp_path / 'main.py'
+    main.write_text('from registry import REGISTRY\nREGISTRY[1]\n')
+    monkeypatch.setattr(settings, 'dynamic_additions_for_other_modules', True)
+    monkeypatch.setattr(settings, 'dynamic_additions_time_limit', 0.05)
+
+    get_call_site_index = call_sites.get_call_site_index
+
+    def slow_get_call_site_index(inference_state):
+        time.sleep(0.1)
+        return get_call_site_index(inference_state)
+
+    monkeypatch.setattr(call_sites, 'get_call_site_index', slow_get_call_site_index)
+    script = Script(path=main, project=jedi.Project(tmp_path))
+    assert script.infer(2) == []
+    assert script._inference_state.dynamic_additions_time >= 0.1
+
+
+def test_additions_in_removed_module(Script, tmp_path, monkeypatch):
+    from jedi.inference import call_sites
+
+    call_sites.clear_cache()
+    (tmp_path / 'registry.py').write_text('HANDLERS = []\n')
+    handlers = tmp_path / 'handlers.py'
+    handlers.write_text('from registry import HANDLERS\nHANDLERS.append(1.0)\n')
+    (tmp_path / 'other.py').write_text('from registry import HANDLERS\nHANDLERS.append("")\n')
+    main = tmp_path / 'main.py'
+    main.write_text('from registry import HANDLERS\nHANDLERS[0]\n')
+    monkeypatch.setattr(settings, 'dynamic_additions_for_other_modules', True)
+
+    def infer():
+        script = Script(path=main, project=jedi.Project(tmp_path))
+        return sorted(d.name for d in script.infer(2))
+
+    assert infer() == ['float', 'str']
+    # The project is not searched for changes again yet.
+    handlers.unlink()
+    assert infer() == ['str']
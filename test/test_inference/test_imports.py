@@ -535,3 +535,36 @@ def test_import_recursion(Script):
     path = get_example_dir('import-recursion', "cq_example.py")
     for c in Script(path=path).complete(3, 3):
         c.docstring()
+
+
+def test_find_module_in_folders(inference_state, tmp_path):
+    for name in ('mod.py', 'pkg/__init__.py', 'pkg/sub.py', 'ns/x.py',
+                 'ext.abi3.so', 'ext.py', 'compiled.pyc'):
+        path = tmp_path.joinpath(*name.split('/'))
+        path.parent.mkdir(exist_ok=True)
+        path.write_text('')
+
+    def find(*import_names, paths=[str(tmp_path)], is_global_search=True):
+        result = imports._find_module_in_folders(
+            inference_state, import_names, paths, is_global_search)
+        if result is None or result[0] is None:
+            return result
+        file_io_or_ns, is_package = result
+        if isinstance(file_io_or_ns, FileIO):
+            return str(file_io_or_ns.path), is_package
+        return file_io_or_ns.name, file_io_or_ns.paths, is_package
+
+    assert find('mod') == (str(tmp_path / 'mod.py'), False)
+    assert find('pkg') == (str(tmp_path / 'pkg' / '__init__.py'), True)
+    assert find('pkg', 'sub', paths=[str(tmp_path / 'pkg')], is_global_search=False) \
+        == (str(tmp_path / 'pkg' / 'sub.py'), False)
+    assert find('ns') == ('ns', [str(tmp_path / 'ns')], True)
+    assert find('pkg', 'doesnt_exist', paths=[str(tmp_path / 'pkg')],
+                is_global_search=False) == (None, None)
+
+    # These are found by the subprocess.
+    assert find('ext') is None
+    assert find('compiled') is None
+    assert find('sys') is None
+    assert find('doesnt_exist') is None
+    assert find('mod', paths=['']) is None
@@ -112,3 +112,24 @@ def test_compiled_signature_annotation_string():
     s, = jedi.Interpreter('func()', [locals()]).get_signatures(1, 5)
     assert s.params[0].description == 'param x: Type'
     assert s.params[1].description == 'param y: Type | int'
+
+
+def test_definition_locations_are_cached(monkeypatch):
+    from jedi.inference.compiled import mixed
+
+    def some_function():
+        pass
+
+    searched = []
+    search = mixed._search_definition_location
+
+    def search_definition_location(inference_state, python_object):
+        searched.append(python_object)
+        return search(inference_state, python_object)
+
+    monkeypatch.setattr(mixed, '_search_definition_location', search_definition_location)
+
+    for _ in range(2):
+        d, = jedi.Interpreter('some_function', [locals()]).infer()
+        assert d.line == some_function.__code__.co_firstlineno
+    assert searched.count(some_function) == 1
@@ -97,6 +97,7 @@ _s = ['/a', '/b', '/c/d/']
         skip_if_not_windows(['/foo'], '/foo/bar/__init__.pyd', ('bar',), True),
 
         (['/foo'], '/x/bar.py', None, False),
+        (['/foo'], '/foobar/baz.py', None, False),
         (['/foo'], '/foo/bar.xyz', ('bar.xyz',), False),
 
         (['/foo', '/foo/bar'], '/foo/bar/baz', ('baz',), False),
@@ -0,0 +1,155 @@
+import time
+
+import pytest
+
+import jedi
+from jedi import stats
+
+
+@pytest.fixture
+def collected():
+    lst = []
+    jedi.set_stats_function(lst.append)
+    yield lst
+    jedi.set_stats_function(None, enable=False)
+
+
+def test_disabled(Script):
+    script = Script('import os\nos.path')
+    script.infer()
+    assert script.last_stats is None
+    assert stats.get_current() is None
+
+
+def test_last_stats(Script, collected):
+    script = Script('import os\nos.path.join')
+    assert script.last_stats['name'] == '__init__'
+    assert script.last_stats['counters']['parse'] == 1
+
+    script.infer()
+    result = script.last_stats
+    assert result['name'] == 'infer'
+    assert result['counters']['imports'] >= 2
+    assert result['counters']['inferred_nodes']
+    assert result['timers']['total'] >= result['timers'].get('parse', 0)
+    assert result['memoize']
+    for counts in result['memoize'].values():
+        assert counts['hits'] + counts['misses']
+
+    assert [s['name'] for s in collected] == ['__init__', 'infer']
+    assert collected[-1] == result
+    assert stats.get_current() is None
+
+
+def test_subprocess(collected, environment):
+    if isinstance(environment, jedi.InterpreterEnvironment):
+        pytest.skip()
+
+    script = jedi.Script('import sys\nsys.getrecursionlimit', environment=environment)
+    script.infer()
+    counters = script.last_stats['counters']
+    assert counters['subprocess'] >= 1
+    assert counters['subprocess_bytes_sent'] > 0
+    assert counters['subprocess_bytes_received'] > 0
+    assert script.last_stats['timers']['subprocess'] > 0
+
+
+def test_references_files(Script, collected, tmp_path):
+    for i in range(3):
+        (tmp_path / ('mod%s.py' % i)).write_text('def foo(): pass\n' if i else 'x = 1\n')
+    project = jedi.Project(tmp_path)
+    script = Script('from mod1 import foo\nfoo', path=tmp_path / 'main.py', project=project)
+    script.get_references()
+    counters = script.last_stats['counters']
+    assert counters['files_opened'] >= counters['files_parsed'] >= 1
+
+
+def test_recursion_limit(Script, collected):
+    script = Script('def f(x):\n    return f(x)\nf(1)')
+    script.infer()
+    counters = script.last_stats['counters']
+    assert counters['function_executions']
+    assert counters.get('per_function_recursion_limit') \
+        or counters.get('per_function_execution_limit') \
+        or counters.get('statement_recursion')
+
+
+def test_threads(Script, collected):
+    import threading
+    with stats.collect('outer') as outer:
+        script = Script('import os\nos.path.join')
+        thread = threading.Thread(target=script.infer)
+        thread.start()
+        thread.join()
+        assert stats.get_current() is outer
+    # The API call in the other thread is collected separately.
+    assert script.last_stats['name'] == 'infer'
+    assert script.last_stats['counters']['imports'] >= 1
+    assert 'imports' not in outer.counters
+    assert [s['name'] for s in collected] == ['infer', 'outer']
+
+
+def test_memoize_names(Script, collected):
+    script = Script('import os\nos.path.join')
+    script.infer()
+    assert all(name.startswith('jedi.') for name in script.last_stats['memoize'])
+
+
+def test_exception_still_recorded(Script, collected):
+    script = Script('foo')
+    with pytest.raises(ValueError):
+        script.infer(10, 0)
+    assert script.last_stats['name'] == 'infer'
+
+
+def test_recursion_detectors(inference_state):
+    detector = inference_state.recursion_detector
+    node = object()
+    assert detector.push(node)
+    assert not detector.push(node)
+    detector.pop()
+    assert detector.pushed_nodes == []
+    assert detector.push(node)
+    detector.pop()
+
+
+def test_inference_budget(Script, collected):
+    code = 'def f0(value):\n    return value\n'
+    code += ''.join('def f%s(value):\n    return f%s(value)\n' % (i, i - 1)
+                    for i in range(1, 20))
+    code += 'f19(1)'
+    assert not Script(code).infer()
+    assert [d.name for d in Script(code, budget='batch').infer()] == ['int']
+
+    budget = jedi.InferenceBudget(recursion_limit=30).with_time_limit(0)
+    script = Script(code, budget=budget)
+    assert not script.infer()
+    assert script.last_stats['counters']['time_limit'] == 1
+
+    with pytest.raises(ValueError):
+        Script(code, budget='unknown')
+
+
+def test_time_limit_of_lazily_inferred_names(Script):
+    # Only the time spent executing functions counts towards the time limit.
+    script = Script('def f():\n    return 1\nx = f()\n',
+                    budget=jedi.InferenceBudget(time_limit=0.05))
+    x = script.get_names()[-1]
+    time.sleep(0.1)
+    assert [d.name for d in x.infer()] == ['int']
+
+
+def test_deprecated_recursion_limits(Script, monkeypatch):
+    from dataclasses import FrozenInstanceError
+    from jedi.inference import recursion
+
+    with pytest.raises(FrozenInstanceError):
+        recursion.PROFILES['interactive'].recursion_limit = 100
+
+    code = 'def f0(value):\n    return value\n'
+    code += ''.join('def f%s(value):\n    return f%s(value)\n' % (i, i - 1)
+                    for i in range(1, 20))
+    code += 'f19(1)'
+    monkeypatch.setattr(recursion, 'recursion_limit', 30)
+    with pytest.warns(DeprecationWarning):
+        assert [d.name for d in Script(code).infer()] == ['int']